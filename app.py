@@ -3,6 +3,8 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import xlwings as xw
+import units
+import chart_transport as ct
 
 # Set page configuration
 st.set_page_config(page_title="Beam Analysis Tool", layout="wide")
@@ -122,7 +124,7 @@ def draw_beam_diagram(length, point_loads, reactions, supports):
             y=[0],
             mode='markers+text',
             marker=dict(size=12, symbol=support_markers[support['type']], color=support_colors[support['type']]),
-            text=f"{support['name']}<br>({reactions[support['name']]:.2f} kN)",
+            text=f"{support['name']}<br>({units.show(reactions[support['name']], 'force')})",
             textposition="top center",
             hoverinfo='text',
             name=f"Support {support['name']}",  # Added name for legend
@@ -130,13 +132,13 @@ def draw_beam_diagram(length, point_loads, reactions, supports):
         ))
 
         # Add reaction force arrows
-        reaction_magnitude = reactions[support['name']]
+        reaction_magnitude = units.from_si(reactions[support['name']], units.DISPLAY["force"])
         fig.add_trace(go.Scatter(
             x=[support['location'], support['location']], 
             y=[0, reaction_magnitude],
             mode="lines+text",
             line=dict(color=support_colors[support['type']], width=2, dash="dot"),
-            text=[f"{reaction_magnitude:.2f} kN"], 
+            text=[str(units.show(reactions[support['name']], "force"))], 
             textposition="top right" if reaction_magnitude > 0 else "bottom right",  # Dynamically adjust text position
             name=f"Reaction at {support['name']}",
             showlegend=True
@@ -149,7 +151,7 @@ def draw_beam_diagram(length, point_loads, reactions, supports):
             y=[0],
             mode='markers+text',
             marker=dict(size=12, symbol='arrow-bar-down', color='red'),
-            text=f"{load['magnitude']} kN",
+            text=str(units.show(load['magnitude'], "force")),
             textposition="bottom center" if load['magnitude'] > 0 else "top center",  # Adjust text based on direction
             hoverinfo='text',
             name=f"Load at {load['location']}",  # Added name for legend
@@ -159,7 +161,7 @@ def draw_beam_diagram(length, point_loads, reactions, supports):
     fig.update_layout(
         title="Beam Diagram with Supports and Reaction Forces",
         showlegend=True,  # Enable legend
-        yaxis=dict(range=[-1, max(reactions.values())+1], showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(range=[-1, units.from_si(max(reactions.values()), units.DISPLAY["force"])+1], showgrid=False, zeroline=False, showticklabels=False),
         xaxis=dict(range=[-0.5, length + 0.5], showgrid=False, zeroline=False, showticklabels=True),
         height=300,
         margin=dict(l=20, r=20, t=40, b=20)
@@ -170,11 +172,11 @@ def draw_beam_diagram(length, point_loads, reactions, supports):
 def draw_shear_force_diagram(x, V):
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(x=x, y=V, mode='lines', line=dict(color='blue', width=2), name='Shear Force'))
+    fig.add_trace(go.Scatter(x=x, y=units.from_si(V, units.DISPLAY["force"]), mode='lines', line=dict(color='blue', width=2), name='Shear Force'))
     fig.update_layout(
         title="Shear Force Diagram",
         xaxis_title="Length (m)",
-        yaxis_title="Shear Force (kN)",
+        yaxis_title=units.label("Shear Force", "force"),
         height=300,
         margin=dict(l=20, r=20, t=40, b=20),
         showlegend=True
@@ -185,11 +187,11 @@ def draw_shear_force_diagram(x, V):
 def draw_bending_moment_diagram(x, M):
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(x=x, y=M, mode='lines', line=dict(color='green', width=2), name='Bending Moment'))
+    fig.add_trace(go.Scatter(x=x, y=units.from_si(M, units.DISPLAY["moment"]), mode='lines', line=dict(color='green', width=2), name='Bending Moment'))
     fig.update_layout(
         title="Bending Moment Diagram",
         xaxis_title="Length (m)",
-        yaxis_title="Bending Moment (kN·m)",
+        yaxis_title=units.label("Bending Moment", "moment"),
         height=300,
         margin=dict(l=20, r=20, t=40, b=20),
         showlegend=True
@@ -200,11 +202,11 @@ def draw_bending_moment_diagram(x, M):
 def draw_deflection_diagram(x, D):
     fig = go.Figure()
 
-    fig.add_trace(go.Scatter(x=x, y=D, mode='lines', line=dict(color='purple', width=2), name='Deflection'))
+    fig.add_trace(go.Scatter(x=x, y=units.from_si(D, units.DISPLAY["deflection"]), mode='lines', line=dict(color='purple', width=2), name='Deflection'))
     fig.update_layout(
         title="Deflection Diagram",
         xaxis_title="Length (m)",
-        yaxis_title="Deflection (m)",
+        yaxis_title=units.label("Deflection", "deflection"),
         height=300,
         margin=dict(l=20, r=20, t=40, b=20),
         showlegend=True
@@ -281,10 +283,10 @@ def main():
         if E_input_method == "Manual Input":
             col1, col2 = st.columns(2)
             with col1:
-                E = st.number_input("Modulus of Elasticity (E) in GPa:", min_value=0.0) * 1e9
+                E = units.to_si(st.number_input("Modulus of Elasticity (E) in GPa:", min_value=0.0), "GPa")
                 st.session_state["E"] = E
             with col2:
-                I = st.number_input("Moment of Inertia (I) in cm^4:", min_value=0.0) * 1e-8
+                I = units.to_si(st.number_input("Moment of Inertia (I) in cm^4:", min_value=0.0), "cm^4")
                 st.session_state["I"] = I
         if st.session_state.get("E") is not None and st.session_state.get("I") is not None:
             E = st.session_state["E"]
@@ -320,7 +322,8 @@ def main():
             with point_load_columns[i]:
                 magnitude = st.number_input(f"Magnitude {i+1} (kN)", min_value=0.0, key=f"magnitude_{i+1}")
                 location = st.number_input(f"Location {i+1} (m)", min_value=0.0, max_value=length, key=f"plocation_{i+1}")
-                point_loads.append({"magnitude": magnitude, "location": location})
+                # Loads are kept in N so the deflection (E in Pa, I in m^4) comes out in metres
+                point_loads.append({"magnitude": units.to_si(magnitude, "kN"), "location": location})
 
         # Generate Diagrams Button
         if st.button("Generate Diagrams"):
@@ -329,23 +332,24 @@ def main():
                 if reactions:
                     with right_col:
                         st.subheader("Reaction Forces:")
-                        reactions_df = pd.DataFrame(list(reactions.items()), columns=["Support", "Reaction Force (kN)"])
+                        reactions_df = pd.DataFrame([(name, units.from_si(value, units.DISPLAY["force"])) for name, value in reactions.items()],
+                                                    columns=["Support", units.label("Reaction Force", "force")])
                         st.table(reactions_df)
 
                     # Draw and display the diagrams
                     fig_beam = draw_beam_diagram(length, point_loads, reactions, supports)
-                    right_col.plotly_chart(fig_beam, use_container_width=True)
+                    ct.plotly_chart(fig_beam, right_col, use_container_width=True)
 
                     x, V, M, D = calculate_shear_force_moment_deflection(length, supports, point_loads, reactions, E, I)
 
                     fig_shear_force = draw_shear_force_diagram(x, V)
-                    right_col.plotly_chart(fig_shear_force, use_container_width=True)
+                    ct.plotly_chart(fig_shear_force, right_col, use_container_width=True)
 
                     fig_bending_moment = draw_bending_moment_diagram(x, M)
-                    right_col.plotly_chart(fig_bending_moment, use_container_width=True)
+                    ct.plotly_chart(fig_bending_moment, right_col, use_container_width=True)
 
                     fig_deflection = draw_deflection_diagram(x, D)
-                    right_col.plotly_chart(fig_deflection, use_container_width=True)
+                    ct.plotly_chart(fig_deflection, right_col, use_container_width=True)
             else:
                 st.error("Please fill in all required fields before generating the diagrams.")
 
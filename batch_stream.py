@@ -0,0 +1,116 @@
+import csv
+import sys
+import itertools
+import numpy as np
+import sfd_slp as sfd
+import units
+from beam_result import BeamResult
+
+# Streaming batch checks for very long member lists.
+# Jobs are read lazily, solved in fixed-size vectorized chunks with the
+# sfd_slp closed forms and yielded as one summary row per member, so peak
+# memory depends on chunk_size and num_points only, never on the input length.
+#
+# Job fields (CSV header or dict keys), converted to SI once per chunk:
+#   member_id, span [m], load_location [m], load_magnitude [kN],
+#   left_support_type, right_support_type            (required)
+#   E [N/m^2], I [m^4], Z [m^3], fy [MPa], deflection_limit [span/limit]  (optional)
+
+JOB_UNITS = {"span": "m", "load_location": "m", "load_magnitude": "kN", "E": "N/m^2", "I": "m^4", "Z": "m^3", "fy": "MPa",
+             "deflection_limit": "-"}
+
+# Summary values are SI: N, Nm, m
+SUMMARY_FIELDS = ("member_id", "max_shear", "max_moment", "max_deflection", "utilization", "passed")
+
+
+# Reads job rows lazily from a CSV file
+def read_jobs(path):
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            yield row
+
+
+# One job field for the whole chunk, as an SI array (default is given in the job's unit)
+def _column(rows, name, default):
+    values = [row.get(name) for row in rows]
+    return units.to_si([float(v) if v not in (None, "") else default for v in values], JOB_UNITS[name])
+
+
+def _solve_chunk(rows, num_points, keep_diagrams, deflection_limit):
+    L = _column(rows, "span", np.nan)
+    a = _column(rows, "load_location", np.nan)
+    P = _column(rows, "load_magnitude", np.nan)
+    E = _column(rows, "E", sfd.E)
+    I = _column(rows, "I", sfd.I)
+    Z = _column(rows, "Z", np.nan)
+    fy = _column(rows, "fy", np.nan)
+    limit = _column(rows, "deflection_limit", deflection_limit)
+    left = np.array([row["left_support_type"] for row in rows], dtype=object)
+    right = np.array([row["right_support_type"] for row in rows], dtype=object)
+
+    # Reactions: one vectorized closed-form call per support combination in the chunk
+    RA, RB, MA, MB = (np.zeros(len(rows)) for _ in range(4))
+    for lt, rt in set(zip(left, right)):
+        m = (left == lt) & (right == rt)
+        RA[m], RB[m], MA[m], MB[m] = sfd.calculate_supports(L[m], a[m], P[m], lt, rt)
+
+    # Diagrams on a (members, stations) grid; same piecewise forms as sfd_slp
+    x = L[:, None] * np.linspace(0, 1, num_points)[None, :]
+    before = x < a[:, None]
+    V = np.where(before, RA[:, None], -RB[:, None])
+    M = np.where(before, -MA[:, None] + RA[:, None] * x, MB[:, None] - RB[:, None] * (x - L[:, None]))
+    # Stations cover the supported length 0..L; an overhang tip is not part of the deflection check
+    theta, delta = sfd.slope_deflection(x, M, left, E[:, None], I[:, None], right)
+
+    # M is piecewise linear under a point load, so its extremes sit at the supports or under the load
+    max_shear = np.maximum(np.abs(RA), np.abs(RB))
+    max_moment = np.max(np.abs(np.stack((MA, -MA + RA * np.clip(a, 0, L), MB))), axis=0)
+    max_deflection = np.max(np.abs(delta), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        bending = max_moment / (Z * fy)
+        deflection = max_deflection / (L / limit)
+    utilization = np.fmax(bending, deflection)
+
+    for i, row in enumerate(rows):
+        out = {
+            "member_id": row.get("member_id", ""),
+            "max_shear": float(max_shear[i]),
+            "max_moment": float(max_moment[i]),
+            "max_deflection": float(max_deflection[i]),
+            "utilization": float(utilization[i]),
+            "passed": bool(utilization[i] <= 1.0),
+        }
+        if keep_diagrams:
+            out["result"] = BeamResult(x[i], V[i], M[i], theta[i], delta[i], cases=[str(out["member_id"])])
+        yield out
+
+
+# Yields one summary row per job; full diagram arrays are dropped unless keep_diagrams is set
+def stream_results(jobs, chunk_size=4096, num_points=101, keep_diagrams=False, deflection_limit=360.0):
+    jobs = iter(jobs)
+    while True:
+        chunk = list(itertools.islice(jobs, chunk_size))
+        if not chunk:
+            return
+        yield from _solve_chunk(chunk, num_points, keep_diagrams, deflection_limit)
+
+
+# Writes summary rows to CSV as they arrive and returns the number of rows written
+def write_summary(rows, path):
+    count = 0
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+if __name__ == "__main__":
+    # python batch_stream.py jobs.csv summary.csv
+    if len(sys.argv) != 3:
+        print("Usage: python batch_stream.py <jobs.csv> <summary.csv>")
+        sys.exit(1)
+    n = write_summary(stream_results(read_jobs(sys.argv[1])), sys.argv[2])
+    print(f"Wrote {n} member summaries to {sys.argv[2]}")
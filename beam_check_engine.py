@@ -0,0 +1,853 @@
+import os
+import math
+import re
+import datetime
+import numpy as np
+import pandas as pd
+import openpyxl
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+# Pure-Python evaluator for the section library workbook.
+# Every formula is compiled once into a closure, the closures are wired into a
+# dependency graph, and a session only recalculates the cells that sit downstream
+# of an input it changed. This lets the Beam_Check lookups run without Excel.
+
+DEFAULT_SHEET = "Beam_Check"
+
+
+# Excel error value stored in a cell (#N/A, #DIV/0!, ...)
+class CellError:
+    __slots__ = ("code",)
+
+    def __init__(self, code):
+        self.code = code
+
+    def __repr__(self):
+        return self.code
+
+    def __eq__(self, other):
+        return isinstance(other, CellError) and other.code == self.code
+
+    def __hash__(self):
+        return hash(self.code)
+
+
+# Raised inside a closure; the session turns it into a CellError for that cell
+class FormulaError(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+# ---------------------------------------------------------------------------
+# Addresses
+# ---------------------------------------------------------------------------
+_CELL_RE = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+
+def parse_cell(addr):
+    m = _CELL_RE.match(addr.strip())
+    if not m:
+        raise ValueError(f"Invalid cell address: {addr}")
+    return int(m.group(2)), column_index_from_string(m.group(1).upper())
+
+
+def split_sheet(addr, default_sheet):
+    if "!" in addr:
+        sheet, addr = addr.rsplit("!", 1)
+        return sheet.strip("'"), addr
+    return default_sheet, addr
+
+
+def parse_range(addr):
+    # Returns (r1, c1, r2, c2) for "A1" or "A1:B2"
+    if ":" in addr:
+        first, last = addr.split(":", 1)
+        r1, c1 = parse_cell(first)
+        r2, c2 = parse_cell(last)
+        return min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2)
+    r, c = parse_cell(addr)
+    return r, c, r, c
+
+
+# ---------------------------------------------------------------------------
+# Tokenizer and parser
+# ---------------------------------------------------------------------------
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<ref>(?:(?:'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_.]*)!)?\$?[A-Za-z]{1,3}\$?\d+(?::\$?[A-Za-z]{1,3}\$?\d+)?)(?![A-Za-z0-9_(])
+  | (?P<func>[A-Za-z_][A-Za-z0-9_.]*)\(
+  | (?P<number>\d+\.?\d*(?:[eE][+-]?\d+)?|\.\d+(?:[eE][+-]?\d+)?)
+  | (?P<bool>TRUE|FALSE)(?![A-Za-z0-9_(])
+  | (?P<error>\#(?:N/A|DIV/0!|VALUE!|REF!|NAME\?|NUM!|NULL!))
+  | (?P<op><=|>=|<>|[-+*/^&=<>%])
+  | (?P<lparen>\()
+  | (?P<rparen>\))
+  | (?P<comma>,)
+""", re.VERBOSE)
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        m = _TOKEN_RE.match(text, pos)
+        if not m:
+            raise ValueError(f"Cannot parse formula near: {text[pos:pos + 20]!r}")
+        kind = m.lastgroup
+        if kind != "ws":
+            value = m.group("func") if kind == "func" else m.group(kind)
+            tokens.append((kind, value))
+        pos = m.end()
+    return tokens
+
+
+_CORNER_RE = re.compile(r"^(\$?)([A-Za-z]{1,3})(\$?)(\d+)$")
+
+
+def _relative_corner(addr, row, col):
+    # "$A4" seen from (row, col) -> (row_abs, row or offset, col_abs, col or offset)
+    m = _CORNER_RE.match(addr)
+    if not m:
+        raise ValueError(f"Invalid cell address: {addr}")
+    c_abs, r_abs = bool(m.group(1)), bool(m.group(3))
+    r, c = int(m.group(4)), column_index_from_string(m.group(2).upper())
+    return (r_abs, r if r_abs else r - row, c_abs, c if c_abs else c - col)
+
+
+def _relative_tokens(tokens, sheet, row, col):
+    # Rewrites references relative to the host cell so formulas filled down a
+    # column share one token key (and one parse) like Excel's R1C1 notation
+    out = []
+    for kind, value in tokens:
+        if kind == "ref":
+            ref_sheet, addr = split_sheet(value, sheet)
+            ref_sheet = ref_sheet.replace("''", "'")
+            corners = tuple(_relative_corner(a, row, col) for a in addr.split(":"))
+            value = (ref_sheet,) + corners
+        out.append((kind, value))
+    return tuple(out)
+
+
+def _resolve(corner, row, col):
+    r_abs, r, c_abs, c = corner
+    return (r if r_abs else row + r), (c if c_abs else col + c)
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, kind=None, value=None):
+        tok = self.peek()
+        if tok[0] is None or (kind and tok[0] != kind) or (value and tok[1] != value):
+            raise ValueError(f"Unexpected token {tok[1]!r}")
+        self.pos += 1
+        return tok
+
+    def parse(self):
+        node = self.comparison()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected token {self.peek()[1]!r}")
+        return node
+
+    # Precedence (low -> high): comparison, &, + -, * /, ^, unary, %
+    def comparison(self):
+        node = self.concat()
+        while self.peek() in (("op", "="), ("op", "<>"), ("op", "<"), ("op", ">"), ("op", "<="), ("op", ">=")):
+            op = self.take()[1]
+            node = ("cmp", op, node, self.concat())
+        return node
+
+    def concat(self):
+        node = self.additive()
+        while self.peek() == ("op", "&"):
+            self.take()
+            node = ("concat", node, self.additive())
+        return node
+
+    def additive(self):
+        node = self.term()
+        while self.peek() in (("op", "+"), ("op", "-")):
+            op = self.take()[1]
+            node = ("arith", op, node, self.term())
+        return node
+
+    def term(self):
+        node = self.power()
+        while self.peek() in (("op", "*"), ("op", "/")):
+            op = self.take()[1]
+            node = ("arith", op, node, self.power())
+        return node
+
+    def power(self):
+        node = self.unary()
+        while self.peek() == ("op", "^"):
+            self.take()
+            node = ("arith", "^", node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek() in (("op", "-"), ("op", "+")):
+            op = self.take()[1]
+            return ("neg", self.unary()) if op == "-" else self.unary()
+        node = self.primary()
+        while self.peek() == ("op", "%"):
+            self.take()
+            node = ("arith", "/", node, ("const", 100.0))
+        return node
+
+    def primary(self):
+        kind, value = self.peek()
+        if kind == "number":
+            self.take()
+            return ("const", float(value))
+        if kind == "string":
+            self.take()
+            return ("const", value[1:-1].replace('""', '"'))
+        if kind == "bool":
+            self.take()
+            return ("const", value == "TRUE")
+        if kind == "error":
+            self.take()
+            return ("const", CellError(value))
+        if kind == "ref":
+            self.take()
+            if len(value) == 2:
+                return ("cell",) + value
+            return ("range",) + value
+        if kind == "func":
+            self.take()
+            name = value.upper()
+            if name.startswith("_XLFN."):
+                name = name[len("_XLFN."):]
+            args = []
+            if self.peek()[0] != "rparen":
+                args.append(self.comparison())
+                while self.peek()[0] == "comma":
+                    self.take()
+                    args.append(self.comparison())
+            self.take("rparen")
+            return ("func", name, args)
+        if kind == "lparen":
+            self.take()
+            node = self.comparison()
+            self.take("rparen")
+            return node
+        raise ValueError(f"Unexpected token {value!r}")
+
+
+# ---------------------------------------------------------------------------
+# Value coercion helpers (Excel semantics)
+# ---------------------------------------------------------------------------
+def _check(v):
+    if isinstance(v, CellError):
+        raise FormulaError(v.code)
+    return v
+
+
+def _num(v):
+    _check(v)
+    if v is None:
+        return 0.0
+    if isinstance(v, bool):
+        return float(v)
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, str):
+        try:
+            return float(v)
+        except ValueError:
+            raise FormulaError("#VALUE!")
+    if isinstance(v, datetime.datetime):
+        return (v - datetime.datetime(1899, 12, 30)).total_seconds() / 86400.0
+    raise FormulaError("#VALUE!")
+
+
+def _text(v):
+    _check(v)
+    if v is None:
+        return ""
+    if isinstance(v, bool):
+        return "TRUE" if v else "FALSE"
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
+
+
+def _truth(v):
+    _check(v)
+    if v is None:
+        return False
+    if isinstance(v, str):
+        if v.upper() in ("TRUE", "FALSE"):
+            return v.upper() == "TRUE"
+        raise FormulaError("#VALUE!")
+    return bool(_num(v))
+
+
+def _cmp_key(v):
+    # Excel orders numbers < text < booleans; text compares case-insensitively
+    _check(v)
+    if v is None:
+        return None
+    if isinstance(v, bool):
+        return (2, v)
+    if isinstance(v, (int, float)):
+        return (0, float(v))
+    if isinstance(v, datetime.datetime):
+        return (0, _num(v))
+    return (1, str(v).lower())
+
+
+def _compare(op, a, b):
+    ka, kb = _cmp_key(a), _cmp_key(b)
+    # A blank cell takes the type of the other operand
+    if ka is None:
+        ka = (kb[0], {0: 0.0, 1: "", 2: False}[kb[0]]) if kb is not None else (0, 0.0)
+    if kb is None:
+        kb = (ka[0], {0: 0.0, 1: "", 2: False}[ka[0]])
+    if op == "=":
+        return ka == kb
+    if op == "<>":
+        return ka != kb
+    if op == "<":
+        return ka < kb
+    if op == ">":
+        return ka > kb
+    if op == "<=":
+        return ka <= kb
+    return ka >= kb
+
+
+def _arith(op, a, b):
+    x, y = _num(a), _num(b)
+    if op == "+":
+        return x + y
+    if op == "-":
+        return x - y
+    if op == "*":
+        return x * y
+    if op == "/":
+        if y == 0:
+            raise FormulaError("#DIV/0!")
+        return x / y
+    try:
+        return float(x ** y)
+    except (OverflowError, ZeroDivisionError, TypeError):
+        raise FormulaError("#NUM!")
+
+
+def _lookup_key(v):
+    if isinstance(v, bool):
+        return ("b", v)
+    if isinstance(v, (int, float)):
+        return ("n", float(v))
+    if isinstance(v, str):
+        return ("s", v.lower())
+    return None
+
+
+# Range argument handed to functions; values are pulled lazily from the session
+class RangeRef:
+    __slots__ = ("session", "sheet", "r1", "c1", "r2", "c2")
+
+    def __init__(self, session, sheet, r1, c1, r2, c2):
+        self.session = session
+        self.sheet = sheet
+        self.r1, self.c1, self.r2, self.c2 = r1, c1, r2, c2
+
+    def values(self):
+        get = self.session.value_at
+        return [get(self.sheet, r, c) for r in range(self.r1, self.r2 + 1) for c in range(self.c1, self.c2 + 1)]
+
+    def column(self, offset):
+        get = self.session.value_at
+        c = self.c1 + offset
+        return [get(self.sheet, r, c) for r in range(self.r1, self.r2 + 1)]
+
+
+def _numbers(args):
+    # Numbers taken from ranges ignore text/blank cells, like Excel's MIN/MAX
+    out = []
+    for a in args:
+        if isinstance(a, RangeRef):
+            for v in a.values():
+                _check(v)
+                if isinstance(v, (int, float)) and not isinstance(v, bool):
+                    out.append(float(v))
+        else:
+            out.append(_num(a))
+    return out
+
+
+def _criteria(crit):
+    # Builds a predicate for MINIFS-style criteria like ">0" or "AISC"
+    if isinstance(crit, str):
+        for op in ("<=", ">=", "<>", "<", ">", "="):
+            if crit.startswith(op):
+                rhs = crit[len(op):]
+                try:
+                    rhs = float(rhs)
+                except ValueError:
+                    pass
+                return lambda v: v is not None and not isinstance(v, CellError) and _safe_compare(op, v, rhs)
+    return lambda v: not isinstance(v, CellError) and _safe_compare("=", v, crit)
+
+
+def _safe_compare(op, a, b):
+    ka, kb = _cmp_key(a), _cmp_key(b)
+    if ka is None or kb is None or ka[0] != kb[0]:
+        return op == "<>"
+    return _compare(op, a, b)
+
+
+# ---------------------------------------------------------------------------
+# Worksheet functions. Lazy functions (IF/IFS) receive unevaluated closures.
+# ---------------------------------------------------------------------------
+def _fn_vlookup(session, value, table, col_index, approx=True):
+    if not isinstance(table, RangeRef):
+        raise FormulaError("#VALUE!")
+    _check(value)
+    offset = int(_num(col_index)) - 1
+    if offset < 0 or table.c1 + offset > table.c2:
+        raise FormulaError("#REF!")
+    if not _truth(approx):
+        row = session.lookup_index(table.sheet, table.c1, table.r1, table.r2).get(_lookup_key(value))
+        if row is None:
+            raise FormulaError("#N/A")
+    else:
+        # Approximate match: last row whose key is <= value (column assumed sorted)
+        row = None
+        target = _cmp_key(value)
+        for r, v in zip(range(table.r1, table.r2 + 1), table.column(0)):
+            k = _cmp_key(v) if not isinstance(v, CellError) else None
+            if k is None or k[0] != target[0]:
+                continue
+            if k > target:
+                break
+            row = r
+        if row is None:
+            raise FormulaError("#N/A")
+    return session.value_at(table.sheet, row, table.c1 + offset)
+
+
+def _fn_minifs(session, min_range, *pairs):
+    if len(pairs) % 2 or not isinstance(min_range, RangeRef):
+        raise FormulaError("#VALUE!")
+    values = min_range.values()
+    mask = [True] * len(values)
+    for crit_range, crit in zip(pairs[::2], pairs[1::2]):
+        test = _criteria(_check(crit))
+        for i, v in enumerate(crit_range.values()):
+            mask[i] = mask[i] and test(v)
+    picked = [float(v) for v, keep in zip(values, mask)
+              if keep and isinstance(v, (int, float)) and not isinstance(v, bool)]
+    return min(picked) if picked else 0.0
+
+
+def _fn_large(session, values, k):
+    nums = sorted(_numbers([values]), reverse=True)
+    k = int(_num(k))
+    if k < 1 or k > len(nums):
+        raise FormulaError("#NUM!")
+    return nums[k - 1]
+
+
+def _fn_small(session, values, k):
+    nums = sorted(_numbers([values]))
+    k = int(_num(k))
+    if k < 1 or k > len(nums):
+        raise FormulaError("#NUM!")
+    return nums[k - 1]
+
+
+def _fn_textafter(session, text, delimiter, instance=1.0):
+    text, delimiter, n = _text(text), _text(delimiter), int(_num(instance))
+    parts = text.split(delimiter)
+    if n < 1 or len(parts) <= n:
+        raise FormulaError("#N/A")
+    return delimiter.join(parts[n:])
+
+
+def _fn_sqrt(session, x):
+    x = _num(x)
+    if x < 0:
+        raise FormulaError("#NUM!")
+    return math.sqrt(x)
+
+
+# CELL("filename"[, ref]) in Excel's form: <folder>\[<file>]<sheet of ref, or of the formula cell>
+def _fn_cell(session, info_type, sheet):
+    if _text(info_type).lower() == "filename":
+        path = os.path.abspath(session.model.filepath)
+        return f"{os.path.join(os.path.dirname(path), '')}[{os.path.basename(path)}]{sheet}"
+    raise FormulaError("#VALUE!")
+
+
+FUNCTIONS = {
+    "SQRT": _fn_sqrt,
+    "PI": lambda session: math.pi,
+    "ABS": lambda session, x: abs(_num(x)),
+    "MIN": lambda session, *args: min(_numbers(args), default=0.0),
+    "MAX": lambda session, *args: max(_numbers(args), default=0.0),
+    "SUM": lambda session, *args: sum(_numbers(args)),
+    "LARGE": _fn_large,
+    "SMALL": _fn_small,
+    "VLOOKUP": _fn_vlookup,
+    "MINIFS": _fn_minifs,
+    "TEXTAFTER": _fn_textafter,
+    "NOW": lambda session: datetime.datetime.now(),
+}
+
+
+# Closures take (session, row, col) so one compiled template serves every cell
+# that shares the formula's relative shape
+def _compile(node, refs):
+    kind = node[0]
+    if kind == "const":
+        value = node[1]
+        return lambda s, row, col: value
+    if kind == "cell":
+        sheet, (r_abs, r, c_abs, c) = node[1], node[2]
+        refs.append((sheet, node[2], node[2]))
+        if r_abs and c_abs:
+            return lambda s, row, col: s.value_at(sheet, r, c)
+        return lambda s, row, col: s.value_at(sheet, r if r_abs else row + r, c if c_abs else col + c)
+    if kind == "range":
+        sheet, first, last = node[1], node[2], node[3]
+        refs.append((sheet, first, last))
+
+        def _range(s, row, col):
+            ra, ca = _resolve(first, row, col)
+            rb, cb = _resolve(last, row, col)
+            return RangeRef(s, sheet, min(ra, rb), min(ca, cb), max(ra, rb), max(ca, cb))
+        return _range
+    if kind == "neg":
+        inner = _compile(node[1], refs)
+        return lambda s, row, col: -_num(inner(s, row, col))
+    if kind == "arith":
+        _, op, left, right = node
+        left, right = _compile(left, refs), _compile(right, refs)
+        return lambda s, row, col: _arith(op, left(s, row, col), right(s, row, col))
+    if kind == "cmp":
+        _, op, left, right = node
+        left, right = _compile(left, refs), _compile(right, refs)
+        return lambda s, row, col: _compare(op, left(s, row, col), right(s, row, col))
+    if kind == "concat":
+        left, right = _compile(node[1], refs), _compile(node[2], refs)
+        return lambda s, row, col: _text(left(s, row, col)) + _text(right(s, row, col))
+    # Function calls
+    _, name, args = node
+    args = [_compile(a, refs) for a in args]
+    if name == "IF":
+        cond = args[0]
+        when_true = args[1] if len(args) > 1 else (lambda s, row, col: True)
+        when_false = args[2] if len(args) > 2 else (lambda s, row, col: False)
+        return lambda s, row, col: when_true(s, row, col) if _truth(cond(s, row, col)) else when_false(s, row, col)
+    if name == "CELL":
+        # The reference is only needed for its sheet, so it is taken from the parse tree
+        info = args[0] if args else (lambda s, row, col: "")
+        ref = node[2][1] if len(node[2]) > 1 else None
+        ref_sheet = ref[1] if ref is not None and ref[0] in ("cell", "range") else None
+        return lambda s, row, col: _fn_cell(s, info(s, row, col), ref_sheet or s.host_sheet)
+    if name == "IFS":
+        pairs = list(zip(args[::2], args[1::2]))
+
+        def _ifs(s, row, col):
+            for cond, value in pairs:
+                if _truth(cond(s, row, col)):
+                    return value(s, row, col)
+            raise FormulaError("#N/A")
+        return _ifs
+    func = FUNCTIONS.get(name)
+    if func is None:
+        return lambda s, row, col: CellError("#NAME?")
+    return lambda s, row, col: func(s, *[a(s, row, col) for a in args])
+
+
+_TEMPLATES = {}
+
+
+def compile_formula(text, sheet=DEFAULT_SHEET, row=1, col=1):
+    # Returns (closure, refs): closure(session, row, col) evaluates the formula and refs
+    # lists every (sheet, r1, c1, r2, c2) it reads from the host cell at (row, col).
+    # Cells whose formulas only differ by relative offsets share one template.
+    key = _relative_tokens(tokenize(text.lstrip("=")), sheet, row, col)
+    template = _TEMPLATES.get(key)
+    if template is None:
+        rel_refs = []
+        template = _TEMPLATES[key] = (_compile(_Parser(list(key)).parse(), rel_refs), rel_refs)
+    closure, rel_refs = template
+    refs = []
+    for ref_sheet, first, last in rel_refs:
+        ra, ca = _resolve(first, row, col)
+        rb, cb = _resolve(last, row, col)
+        refs.append((ref_sheet, min(ra, rb), min(ca, cb), max(ra, rb), max(ca, cb)))
+    return closure, refs
+
+
+# ---------------------------------------------------------------------------
+# Compiled workbook (shared, read-only) and per-user sessions
+# ---------------------------------------------------------------------------
+class WorkbookModel:
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.values = {}        # (sheet, row, col) -> cached value from the file
+        self.formulas = {}      # (sheet, row, col) -> compiled closure(session, row, col)
+        self.stale = set()      # formula cells without a cached value
+        self.cell_deps = {}     # (sheet, row, col) -> formula cells reading that single cell
+        self.range_deps = {}    # (sheet, col) -> [(r1, r2, formula cells reading that span)]
+        self.dimensions = {}    # sheet -> (max_row, max_col)
+
+        # Read-only mode streams the sheets, which is much quicker for a workbook this size
+        wb_formulas = openpyxl.load_workbook(filepath, read_only=True)
+        wb_values = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
+        ranges = {}
+        for ws in wb_formulas.worksheets:
+            ws_values = wb_values[ws.title]
+            self.dimensions[ws.title] = (ws.max_row, ws.max_column)
+            for row, cached_row in zip(ws.iter_rows(), ws_values.iter_rows()):
+                for cell, cached_cell in zip(row, cached_row):
+                    raw = cell.value
+                    if raw is None:
+                        continue
+                    key = (ws.title, cell.row, cell.column)
+                    text = getattr(raw, "text", raw)
+                    cached = cached_cell.value
+                    if isinstance(text, str) and text.startswith("=") and len(text) > 1:
+                        try:
+                            closure, refs = compile_formula(text, ws.title, cell.row, cell.column)
+                        except ValueError:
+                            closure, refs = (lambda s, row, col: CellError("#NAME?")), []
+                        self.formulas[key] = closure
+                        if cached is None:
+                            self.stale.add(key)
+                        else:
+                            self.values[key] = _normalise(cached)
+                        for ref in refs:
+                            sheet, r1, c1, r2, c2 = ref
+                            if (r1, c1) == (r2, c2):
+                                self.cell_deps.setdefault((sheet, r1, c1), set()).add(key)
+                            else:
+                                ranges.setdefault(ref, set()).add(key)
+                    else:
+                        self.values[key] = _normalise(text)
+        wb_formulas.close()
+        wb_values.close()
+        # Ranges are indexed per column so a changed cell only scans the spans of its own column
+        for (sheet, r1, c1, r2, c2), dependents in ranges.items():
+            frozen = frozenset(dependents)
+            for c in range(c1, c2 + 1):
+                self.range_deps.setdefault((sheet, c), []).append((r1, r2, frozen))
+
+    def dependents(self, key):
+        sheet, r, c = key
+        out = set(self.cell_deps.get(key, ()))
+        for r1, r2, deps in self.range_deps.get((sheet, c), ()):
+            if r1 <= r <= r2:
+                out |= deps
+        return out
+
+
+def _normalise(v):
+    if isinstance(v, int) and not isinstance(v, bool):
+        return float(v)
+    if isinstance(v, str) and v.startswith("#") and v in ("#N/A", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#NULL!"):
+        return CellError(v)
+    return v
+
+
+def load_model(filepath):
+    return WorkbookModel(filepath)
+
+
+class WorkbookSession:
+    def __init__(self, model, sheet=DEFAULT_SHEET):
+        self.model = model
+        self.sheet = sheet
+        self.values = dict(model.values)
+        self.dirty = set(model.stale)
+        self.col_versions = {}
+        self._indexes = {}
+        self._evaluating = set()
+        self.host_sheet = sheet  # sheet of the formula being evaluated
+
+    # --- reading -----------------------------------------------------------
+    def value_at(self, sheet, r, c):
+        key = (sheet, r, c)
+        if key in self.dirty:
+            self._recalculate(key)
+        return self.values.get(key)
+
+    def _recalculate(self, key):
+        if key in self._evaluating:
+            raise FormulaError("#REF!")  # circular reference
+        self._evaluating.add(key)
+        host, self.host_sheet = self.host_sheet, key[0]
+        try:
+            value = self.model.formulas[key](self, key[1], key[2])
+            if isinstance(value, RangeRef):
+                value = value.values()[0] if value.r1 == value.r2 and value.c1 == value.c2 else CellError("#VALUE!")
+        except FormulaError as e:
+            value = CellError(e.code)
+        except RecursionError:
+            value = CellError("#REF!")
+        finally:
+            self._evaluating.discard(key)
+            self.host_sheet = host
+        self.values[key] = value
+        self.dirty.discard(key)
+
+    def get(self, addr):
+        sheet, addr = split_sheet(addr, self.sheet)
+        r1, c1, r2, c2 = parse_range(addr)
+        if (r1, c1) == (r2, c2):
+            return self.value_at(sheet, r1, c1)
+        return [[self.value_at(sheet, r, c) for c in range(c1, c2 + 1)] for r in range(r1, r2 + 1)]
+
+    # --- writing -----------------------------------------------------------
+    def set(self, addr, value):
+        sheet, addr = split_sheet(addr, self.sheet)
+        r, c = parse_cell(addr)
+        key = (sheet, r, c)
+        value = _normalise(value)
+        if key not in self.dirty and self.values.get(key) == value and type(self.values.get(key)) is type(value):
+            return
+        self.values[key] = value
+        self.dirty.discard(key)
+        self._invalidate(key)
+
+    def _invalidate(self, key):
+        # Marks every formula downstream of key as dirty; recalculation happens on read
+        self._touch(key)
+        stack = [key]
+        while stack:
+            for dep in self.model.dependents(stack.pop()):
+                if dep not in self.dirty:
+                    self.dirty.add(dep)
+                    self._touch(dep)
+                    stack.append(dep)
+
+    def _touch(self, key):
+        col = (key[0], key[2])
+        self.col_versions[col] = self.col_versions.get(col, 0) + 1
+
+    def lookup_index(self, sheet, col, r1, r2):
+        # Exact-match VLOOKUP index for one column span, rebuilt only after that column changes
+        version = self.col_versions.get((sheet, col), 0)
+        cached = self._indexes.get((sheet, col, r1, r2))
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        index = {}
+        for r in range(r1, r2 + 1):
+            k = _lookup_key(self.value_at(sheet, r, col))
+            if k is not None and k not in index:
+                index[k] = r
+        # Reading dirty cells above does not change the version, so the index is current
+        self._indexes[(sheet, col, r1, r2)] = (self.col_versions.get((sheet, col), 0), index)
+        return index
+
+    def recalculate_all(self):
+        for key in list(self.dirty):
+            if key in self.dirty:
+                self._recalculate(key)
+
+
+# Evaluates outputs for many input vectors, e.g. {"C12": [...], "C15": [...]}.
+# Only cells downstream of inputs that actually change between rows are recomputed,
+# and the session inputs are restored afterwards.
+def evaluate_batch(session, inputs, outputs):
+    names = list(inputs)
+    columns = [list(inputs[name]) for name in names]
+    n = len(columns[0]) if columns else 0
+    if any(len(col) != n for col in columns):
+        raise ValueError("All input vectors must have the same length")
+    original = {name: session.get(name) for name in names}
+    results = {out: [None] * n for out in outputs}
+    try:
+        for i in range(n):
+            for name, col in zip(names, columns):
+                session.set(name, col[i])
+            for out in outputs:
+                results[out][i] = session.get(out)
+    finally:
+        for name, value in original.items():
+            session.set(name, value)
+    for out, vals in results.items():
+        if all(isinstance(v, float) for v in vals):
+            results[out] = np.array(vals, dtype=float)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# xlwings-style adapter so new.py can use the engine in place of an Excel Book
+# ---------------------------------------------------------------------------
+class EngineRange:
+    def __init__(self, session, sheet, addr):
+        self.session = session
+        self.address = f"{sheet}!{addr}"
+        self.shape = parse_range(addr)
+
+    @property
+    def value(self):
+        r1, c1, r2, c2 = self.shape
+        grid = self.session.get(self.address)
+        if r1 == r2 and c1 == c2:
+            return _to_python(grid)
+        if c1 == c2:
+            return [_to_python(row[0]) for row in grid]
+        if r1 == r2:
+            return [_to_python(v) for v in grid[0]]
+        return [[_to_python(v) for v in row] for row in grid]
+
+    @value.setter
+    def value(self, value):
+        r1, c1, r2, c2 = self.shape
+        sheet = self.address.rsplit("!", 1)[0]
+        if r1 == r2 and c1 == c2:
+            self.session.set(f"{sheet}!{get_column_letter(c1)}{r1}", value)
+            return
+        for i, r in enumerate(range(r1, r2 + 1)):
+            for j, c in enumerate(range(c1, c2 + 1)):
+                v = value[i][j] if isinstance(value[0], (list, tuple)) else value[i + j]
+                self.session.set(f"{sheet}!{get_column_letter(c)}{r}", v)
+
+
+def _to_python(v):
+    # xlwings reports Excel errors as None
+    return None if isinstance(v, CellError) else v
+
+
+class EngineSheet:
+    def __init__(self, session, name):
+        self.session = session
+        self.name = name
+
+    def range(self, addr):
+        return EngineRange(self.session, self.name, addr)
+
+    # Same result as pd.read_excel(..., usecols, header, nrows) but with recalculated values
+    def frame(self, usecols, header, nrows):
+        first, last = usecols.split(":")
+        c1, c2 = column_index_from_string(first), column_index_from_string(last)
+        header_row = header + 1
+        grid = self.session.get(f"{self.name}!{first}{header_row}:{last}{header_row + nrows}")
+        columns = [v if v is not None else f"Unnamed: {c1 + i - 1}" for i, v in enumerate(grid[0])]
+        rows = [[_to_python(v) for v in row] for row in grid[1:]]
+        return pd.DataFrame(rows, columns=columns)
+
+
+class EngineBook:
+    def __init__(self, model):
+        self.session = WorkbookSession(model)
+        self.sheets = {name: EngineSheet(self.session, name) for name in model.dimensions}
+
+    def save(self):
+        # Values live in memory; nothing to write back
+        pass
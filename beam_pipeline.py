@@ -0,0 +1,106 @@
+import numpy as np
+import sfd_slp as sfd
+
+# Dependency-tracked pipeline for the Beam Analyzer tab.
+# Stages run in order and each one only reruns when one of its inputs or an
+# upstream stage changed:
+#
+#   geometry  (span, load_location)            -> station grid
+#   influence (+ support types)                -> reactions, V and M for a 1 N load and a 1 N/m UDL
+#   load      (load_magnitude, udl)            -> scale factors
+#   results   (influence, load)                -> scaled reactions, V and M
+#   figures   (results)                        -> beam sketch, SFD and BMD figures
+#
+# The system is linear in the load, so a magnitude-only edit just rescales the
+# unit solutions and patches the y-data of the existing figures.
+
+STAGES = [
+    # (stage, inputs it reads, upstream stages)
+    ("geometry", ("span", "load_location"), ()),
+    ("influence", ("left_support_type", "right_support_type"), ("geometry",)),
+    ("load", ("load_magnitude", "udl"), ()),
+    ("results", (), ("influence", "load")),
+    ("figures", (), ("results",)),
+]
+
+INPUTS = ("span", "load_location", "load_magnitude", "left_support_type", "right_support_type", "udl")
+DEFAULTS = {"udl": 0.0}  # uniform load, e.g. the self-weight of the chosen section
+
+# All inputs are SI (m, N, N/m); convert at the widgets with units.to_si
+
+
+class BeamPipeline:
+    def __init__(self):
+        self.inputs = dict(DEFAULTS)
+        self.outputs = {}
+        self.figures = {}
+        self.recomputed = []   # stages that ran during the last update()
+
+    # Set any subset of INPUTS and bring every stage up to date
+    def update(self, **inputs):
+        unknown = set(inputs) - set(INPUTS)
+        if unknown:
+            raise ValueError(f"Unknown pipeline inputs: {sorted(unknown)}")
+        changed = {name for name, value in inputs.items() if self.inputs.get(name, object()) != value}
+        self.inputs.update(inputs)
+        missing = [name for name in INPUTS if name not in self.inputs]
+        if missing:
+            raise ValueError(f"Missing pipeline inputs: {missing}")
+
+        dirty = set()
+        for stage, reads, upstream in STAGES:
+            if stage not in self.outputs or changed.intersection(reads) or dirty.intersection(upstream):
+                dirty.add(stage)
+        self.recomputed = [stage for stage, _, _ in STAGES if stage in dirty]
+        for stage in self.recomputed:
+            self.outputs[stage] = getattr(self, f"_stage_{stage}")(dirty)
+        return self.outputs["results"]
+
+    def _stage_geometry(self, dirty):
+        span = self.inputs["span"]
+        return {"x": sfd.beam_stations(span, [self.inputs["load_location"]])}
+
+    def _stage_influence(self, dirty):
+        # Unit (1 N) and unit UDL (1 N/m) solutions from the sfd_slp support table
+        span, a = self.inputs["span"], self.inputs["load_location"]
+        left, right = self.inputs["left_support_type"], self.inputs["right_support_type"]
+        x = self.outputs["geometry"]["x"]
+        _, V, M, reactions = sfd.load_diagrams(span, [a], [1.0], left, right, x=x)
+        _, udl_V, udl_M, udl_reactions = sfd.load_diagrams(span, [], [], left, right, udl=1.0, x=x)
+        return {"reactions": np.array(reactions), "V": V, "M": M,
+                "udl_reactions": np.array(udl_reactions), "udl_V": udl_V, "udl_M": udl_M}
+
+    def _stage_load(self, dirty):
+        return {"scale": float(self.inputs["load_magnitude"]), "udl": float(self.inputs["udl"])}
+
+    def _stage_results(self, dirty):
+        unit, load = self.outputs["influence"], self.outputs["load"]
+        scale, w = load["scale"], load["udl"]
+        RA, RB, MA, MB = (unit["reactions"] * scale + unit["udl_reactions"] * w).tolist()
+        return {
+            "x": self.outputs["geometry"]["x"],
+            "reactions": (RA, RB, MA, MB),
+            "V": unit["V"] * scale + unit["udl_V"] * w,
+            "M": unit["M"] * scale + unit["udl_M"] * w,
+        }
+
+    def _stage_figures(self, dirty):
+        res = self.outputs["results"]
+        RA, RB, MA, MB = res["reactions"]
+        args = (self.inputs["span"], self.inputs["left_support_type"], self.inputs["right_support_type"],
+                self.inputs["load_location"], self.inputs["load_magnitude"], RA, RB, -MA, MB)
+        if self.figures and not dirty.intersection(("geometry", "influence")):
+            # Same stations and supports: patch data and labels instead of rebuilding the layouts
+            sfd.update_shear_force_figure(self.figures["sfd"], res["V"])
+            sfd.update_bending_moment_figure(self.figures["bmd"], res["x"], res["M"])
+            labels = self.figures["beam"].layout.annotations
+            labels[0].text = sfd.load_label(self.inputs["load_magnitude"])
+            labels[1].text = sfd.reaction_label("L", RA, -MA)
+            labels[2].text = sfd.reaction_label("R", RB, MB)
+        else:
+            self.figures = {
+                "beam": sfd.beam_supports_figure(*args),
+                "sfd": sfd.shear_force_figure(res["x"], res["V"]),
+                "bmd": sfd.bending_moment_figure(res["x"], res["M"]),
+            }
+        return self.figures
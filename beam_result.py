@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+import sfd_slp as sfd
+
+# Columnar store for analysis outputs.
+# One station array is shared by every load case, and the V/M/theta/delta
+# values live in a single (column, case, station) block so each column is
+# contiguous across cases (cheap envelopes) and any case can be taken as a
+# zero-copy view. Memory is nbytes = 4 * cases * stations * itemsize + x.
+
+COLUMNS = ("V", "M", "theta", "delta")
+
+
+class BeamResult:
+    __slots__ = ("x", "data", "cases")
+
+    def __init__(self, x, V, M, theta=None, delta=None, cases=None, dtype=np.float64):
+        x = np.asarray(x, dtype=dtype)
+        V = np.atleast_2d(np.asarray(V, dtype=dtype))
+        n_cases, n_stations = V.shape
+        if n_stations != x.shape[0]:
+            raise ValueError("Column length does not match the number of stations")
+        data = np.zeros((len(COLUMNS), n_cases, n_stations), dtype=dtype)
+        for i, column in enumerate((V, M, theta, delta)):
+            if column is not None:
+                data[i] = np.atleast_2d(np.asarray(column, dtype=dtype))
+        self.x = x
+        self.data = data
+        self.cases = list(cases) if cases is not None else [str(i) for i in range(n_cases)]
+        if len(self.cases) != n_cases:
+            raise ValueError("Number of case names does not match the number of load cases")
+
+    @classmethod
+    def _from_block(cls, x, data, cases):
+        # Wraps existing arrays without copying them
+        result = cls.__new__(cls)
+        result.x = x
+        result.data = data
+        result.cases = list(cases)
+        return result
+
+    # Column views across all cases, shape (cases, stations)
+    @property
+    def V(self):
+        return self.data[0]
+
+    @property
+    def M(self):
+        return self.data[1]
+
+    @property
+    def theta(self):
+        return self.data[2]
+
+    @property
+    def delta(self):
+        return self.data[3]
+
+    @property
+    def nbytes(self):
+        return self.x.nbytes + self.data.nbytes
+
+    def __len__(self):
+        return len(self.cases)
+
+    def __repr__(self):
+        return f"BeamResult(cases={len(self.cases)}, stations={self.x.shape[0]}, dtype={self.data.dtype}, nbytes={self.nbytes})"
+
+    # Zero-copy view of one load case (by index or name)
+    def case(self, key):
+        i = self.cases.index(key) if isinstance(key, str) else int(key)
+        return BeamResult._from_block(self.x, self.data[:, i:i + 1, :], [self.cases[i]])
+
+    # Max/min of every column over all cases, shape (2, stations) per column
+    def envelope(self):
+        return {name: np.stack((self.data[i].max(axis=0), self.data[i].min(axis=0)))
+                for i, name in enumerate(COLUMNS)}
+
+    def astype(self, dtype):
+        return BeamResult._from_block(self.x.astype(dtype), self.data.astype(dtype), self.cases)
+
+    # Joins results that share the same station grid into one block
+    @classmethod
+    def stack(cls, results):
+        results = list(results)
+        x = results[0].x
+        for r in results[1:]:
+            if r.x.shape != x.shape or not np.array_equal(r.x, x):
+                raise ValueError("Results must share the same station grid to be stacked")
+        data = np.concatenate([r.data for r in results], axis=1)
+        cases = [name for r in results for name in r.cases]
+        return cls._from_block(x, data, cases)
+
+    # Saves to .npz or .parquet (parquet needs pyarrow or fastparquet)
+    def save(self, path):
+        path = str(path)
+        if path.endswith(".npz"):
+            np.savez(path, x=self.x, data=self.data, cases=np.array(self.cases))
+        elif path.endswith(".parquet"):
+            self.to_frame().to_parquet(path, index=False)
+        else:
+            raise ValueError("Unsupported file type, use .npz or .parquet")
+
+    @classmethod
+    def load(cls, path):
+        path = str(path)
+        if path.endswith(".npz"):
+            with np.load(path) as f:
+                return cls._from_block(f["x"], f["data"], f["cases"].tolist())
+        if path.endswith(".parquet"):
+            df = pd.read_parquet(path)
+            cases = list(dict.fromkeys(df["case"]))
+            n = len(df) // len(cases)
+            x = df["x"].to_numpy()[:n]
+            data = np.stack([df[name].to_numpy().reshape(len(cases), n) for name in COLUMNS])
+            return cls._from_block(x, data, cases)
+        raise ValueError("Unsupported file type, use .npz or .parquet")
+
+    # Long table: one row per (case, station)
+    def to_frame(self):
+        n_cases, n = len(self.cases), self.x.shape[0]
+        table = {"case": np.repeat(np.array(self.cases, dtype=object), n), "x": np.tile(self.x, n_cases)}
+        for i, name in enumerate(COLUMNS):
+            table[name] = self.data[i].reshape(-1)
+        return pd.DataFrame(table)
+
+
+# Runs the single-span analysis from sfd_slp (SI inputs) and stores V, M, slope and deflection
+def analyse(span, load_location, load_magnitude, left_support_type, right_support_type,
+            E=sfd.E, I=sfd.I, case="0", dtype=np.float64):
+    x, V, M, _ = sfd.load_diagrams(span, [load_location], [load_magnitude], left_support_type, right_support_type)
+    theta, delta = sfd.slope_deflection(x, M, left_support_type, E, I, right_support_type, supports=(0, span))
+    return BeamResult(x, V, M, theta, delta, cases=[case], dtype=dtype)
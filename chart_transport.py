@@ -0,0 +1,99 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+
+# Smaller chart payloads for remote sessions.
+# st.plotly_chart sends every figure as JSON. Plotly already writes NumPy arrays as base64
+# typed arrays, but at float64 and with every station of every trace. compact_figure() makes
+# a transport copy of a figure (the original, e.g. a pipeline's cached figure, is untouched):
+#   - numeric x/y/z/customdata arrays are rounded to `resolution` times their value range
+#     (far below a pixel and below the hover precision) and sent as float32 typed arrays;
+#   - evenly spaced coordinates (the station grids, heatmap axes) are sent as a start and a
+#     step (x0/dx, y0/dy) instead of an array;
+#   - line-only traces (fills, zero lines) keep just the points needed to draw them within
+#     `tolerance` times their value range (Ramer-Douglas-Peucker on y over increasing x), so a
+#     piecewise-linear fill of 1000 stations goes down to its corners. Traces with markers
+#     keep every station, so markers and hover look the same.
+# The websocket is deflate-compressed as well (.streamlit/config.toml), and the rounded arrays
+# compress much better than full-precision ones.
+
+RESOLUTION = 1e-4
+TOLERANCE = 1e-3
+ARRAY_KEYS = ("x", "y", "z", "customdata")
+GRID_TRACES = ("heatmap", "contour")  # traces whose y is an axis rather than data
+
+
+def _numeric(values):
+    if values is None or isinstance(values, (str, dict)):
+        return None
+    values = np.asarray(values)
+    return values if values.dtype.kind in "fiu" and values.size else None
+
+
+def _value_range(values):
+    finite = values[np.isfinite(values)]
+    return float(finite.max() - finite.min()) if finite.size else 0.0
+
+
+# Step of an evenly spaced 1-D array, or None
+def _even_step(values):
+    if values is None or values.ndim != 1 or len(values) < 3:
+        return None
+    steps = np.diff(values.astype(float))
+    return float(steps.mean()) if np.allclose(steps, steps[0], rtol=1e-9, atol=0) and steps[0] != 0 else None
+
+
+def quantize(values, resolution=RESOLUTION):
+    values = np.asarray(values, dtype=float)
+    step = resolution * _value_range(values)
+    if step > 0:
+        values = np.round(values / step) * step
+    return values.astype(np.float32)
+
+
+# Indices of the points of y(x) (x increasing) that keep the polyline within tolerance of the original
+def simplify(x, y, tolerance):
+    keep = np.zeros(len(x), dtype=bool)
+    keep[[0, -1]] = True
+    segments = [(0, len(x) - 1)]
+    while segments:
+        i, j = segments.pop()
+        if j - i < 2:
+            continue
+        chord = y[i] + (y[j] - y[i]) * (x[i + 1:j] - x[i]) / (x[j] - x[i])
+        error = np.abs(y[i + 1:j] - chord)
+        k = int(np.argmax(error))
+        if error[k] > tolerance:
+            keep[i + 1 + k] = True
+            segments += [(i, i + 1 + k), (i + 1 + k, j)]
+    return np.flatnonzero(keep)
+
+
+# Transport copy of a figure with quantized float32 arrays and simplified line-only traces
+def compact_figure(fig, resolution=RESOLUTION, tolerance=TOLERANCE):
+    if not isinstance(fig, go.Figure):
+        fig = go.Figure(fig)
+    data = []
+    for trace in fig.data:
+        trace = trace.to_plotly_json()
+        arrays = {key: _numeric(trace.get(key)) for key in ARRAY_KEYS}
+        arrays = {key: values for key, values in arrays.items() if values is not None}
+        x, y = arrays.get("x"), arrays.get("y")
+        if (trace.get("mode") == "lines" and x is not None and y is not None and x.ndim == y.ndim == 1
+                and len(x) == len(y) > 2 and np.all(np.diff(x) > 0) and np.all(np.isfinite(y))):
+            index = simplify(x.astype(float), y.astype(float), tolerance * _value_range(y))
+            arrays = {key: values[index] if values.ndim and len(values) == len(x) else values for key, values in arrays.items()}
+        for key in ("x", "y") if trace.get("type") in GRID_TRACES else ("x",):
+            step = _even_step(arrays.get(key))
+            if step is not None:
+                trace[key + "0"], trace["d" + key] = float(arrays.pop(key)[0]), step
+                trace.pop(key)
+        for key, values in arrays.items():
+            trace[key] = quantize(values, resolution)
+        data.append(trace)
+    return go.Figure({"data": data, "layout": fig.layout.to_plotly_json()}, _validate=False)
+
+
+# st.plotly_chart with the compact transport copy (container: st, a column, an expander, ...)
+def plotly_chart(fig, container=None, **kwargs):
+    return (container or st).plotly_chart(compact_figure(fig), **kwargs)
@@ -0,0 +1,147 @@
+import numpy as np
+import sfd_slp as sfd
+
+# Member code checks on the diagrams from sfd_slp (AISC 360-16 chapters F/G, or EN 1993-1-1 6.2/6.3.2).
+# Everything is NumPy broadcasting: V, M and delta have shape (..., stations) on a shared
+# station array x, and section properties / fy broadcast against the leading axes, e.g.
+# (cases, stations) for one section or (sections, cases, stations) for a library sweep.
+# Units are SI throughout (N, Nm, m, Pa), including fy.
+#
+# Doubly-symmetric rolled I-sections are assumed. J and Cw are not in the library, so they
+# are estimated from the plate dimensions:
+#   J  = (2 B tf^3 + (D - 2 tf) tw^3) / 3
+#   Cw = Iy h0^2 / 4,  h0 = D - tf
+
+CHECKS = ("bending", "shear", "ltb", "combined", "deflection")
+CODES = ("AISC 360", "EN 1993-1-1")
+NU = 0.3  # Poisson's ratio for steel
+
+
+def torsion_constants(section):
+    D, B, tf, tw, Iy = (np.asarray(section[key], dtype=float) for key in ("D", "B", "tf", "tw", "Iy"))
+    J = (2 * B * tf**3 + (D - 2 * tf) * tw**3) / 3
+    h0 = D - tf
+    return J, Iy * h0**2 / 4, h0
+
+
+# Moment gradient factor over the unbraced length from the quarter-point moments (AISC F1-1)
+def moment_gradient(x, M):
+    x = np.asarray(x, dtype=float)
+    absM = np.abs(M)
+    q = np.searchsorted(x, x[0] + np.array([0.25, 0.5, 0.75]) * (x[-1] - x[0]))
+    Mmax = absM.max(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        Cb = 12.5 * Mmax / (2.5 * Mmax + 3 * absM[..., q[0]] + 4 * absM[..., q[1]] + 3 * absM[..., q[2]])
+    return np.where(Mmax > 0, np.minimum(Cb, 3.0), 1.0)
+
+
+# Equivalent uniform moment factor C1 for EN 1993-1-1 6.3.2.2 from the moment diagram over the
+# unbraced length (Lopez, Yong & Serna, k = 1): C1 = 1 / sqrt(A1) with
+#   A1 = (Mmax^2 + 5 M(L/4)^2 + 10 M(L/2)^2 + 5 M(3L/4)^2) / (21 Mmax^2)
+# e.g. 1.0 for uniform moment, 1.12 for a simply supported UDL, 1.78 for a linear 1:0 diagram
+def moment_factor_c1(x, M):
+    x = np.asarray(x, dtype=float)
+    absM = np.abs(M)
+    q = np.searchsorted(x, x[0] + np.array([0.25, 0.5, 0.75]) * (x[-1] - x[0]))
+    Mmax = absM.max(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        A1 = (Mmax**2 + 5 * absM[..., q[0]] ** 2 + 10 * absM[..., q[1]] ** 2 + 5 * absM[..., q[2]] ** 2) / (21 * Mmax**2)
+        C1 = 1 / np.sqrt(A1)
+    return np.where(Mmax > 0, C1, 1.0)
+
+
+# Design moment for lateral-torsional buckling, per beam (leading axes)
+def _ltb_aisc(section, Fy, E, Lb, Cb):
+    Sx, Zx, Iy, ry = (np.asarray(section[key], dtype=float) for key in ("Zx", "Zpx", "Iy", "ry"))
+    J, Cw, h0 = torsion_constants(section)
+    Mp = Fy * Zx
+    rts = np.sqrt(np.sqrt(Iy * Cw) / Sx)
+    Lp = 1.76 * ry * np.sqrt(E / Fy)
+    jc = J / (Sx * h0)
+    Lr = 1.95 * rts * E / (0.7 * Fy) * np.sqrt(jc + np.sqrt(jc**2 + 6.76 * (0.7 * Fy / E) ** 2))
+    slender = (Lb / rts) ** 2
+    Fcr = Cb * np.pi**2 * E / slender * np.sqrt(1 + 0.078 * jc * slender)
+    inelastic = Cb * (Mp - (Mp - 0.7 * Fy * Sx) * (Lb - Lp) / (Lr - Lp))
+    Mn = np.where(Lb <= Lp, Mp, np.where(Lb <= Lr, inelastic, Fcr * Sx))
+    return 0.9 * np.minimum(Mn, Mp)
+
+
+def _ltb_en(section, fy, E, Lb, C1, gamma_M1=1.0):
+    Wpl, Iz, D, B = (np.asarray(section[key], dtype=float) for key in ("Zpx", "Iy", "D", "B"))
+    J, Iw, _ = torsion_constants(section)
+    G = E / (2 * (1 + NU))
+    Mcr = C1 * np.pi**2 * E * Iz / Lb**2 * np.sqrt(Iw / Iz + Lb**2 * G * J / (np.pi**2 * E * Iz))
+    lam = np.sqrt(Wpl * fy / Mcr)
+    alpha = np.where(D / B <= 2, 0.21, 0.34)  # rolled I-sections, curves a / b (table 6.4)
+    phi = 0.5 * (1 + alpha * (lam - 0.2) + lam**2)
+    chi = np.minimum(1.0, 1 / (phi + np.sqrt(phi**2 - lam**2)))
+    return chi * Wpl * fy / gamma_M1
+
+
+# AISC F1: Cb = 1.0 for cantilevers braced only at the support; None lets code_check work it out
+def cantilever_cb(left_support_type, right_support_type):
+    return 1.0 if "Free" in (left_support_type, right_support_type) else None
+
+
+# Utilization of every check at every station plus the governing value and where it occurs.
+#   Lb: unbraced length for LTB (default: the whole station range)
+#   Cb: AISC Cb / EN C1 (default: from the moment diagram, moment_gradient / moment_factor_c1;
+#       use 1.0 for cantilevers)
+def code_check(x, V, M, delta, section, fy, code="AISC 360", Lb=None, Cb=None, E=sfd.E,
+               deflection_limit=360.0, span=None):
+    if code not in CODES:
+        raise ValueError(f"Unknown design code: {code}")
+    x = np.asarray(x, dtype=float)
+    V, M, delta = (np.asarray(v, dtype=float) for v in (V, M, delta))
+    Fy = np.asarray(fy, dtype=float)
+    span = x[-1] - x[0] if span is None else span
+    Lb = span if Lb is None else Lb
+    if Cb is None:
+        Cb = moment_gradient(x, M) if code == "AISC 360" else moment_factor_c1(x, M)
+    Cb = np.asarray(Cb, dtype=float)
+    Sx, Zx, D, tf, tw = (np.asarray(section[key], dtype=float) for key in ("Zx", "Zpx", "D", "tf", "tw"))
+    Aw = D * tw
+
+    if code == "AISC 360":
+        # F2.1 yielding; G2.1(a) shear (phi_v = 1.0, Cv1 = 1) for rolled webs with h/tw <= 2.24 sqrt(E/Fy),
+        # otherwise G2.1(b): phi_v = 0.9, kv = 5.34 (no stiffeners), h = D - 2 tf (fillets ignored)
+        Md = 0.9 * Fy * Zx
+        h_tw = (D - 2 * tf) / tw
+        limit = 1.10 * np.sqrt(5.34 * E / Fy)
+        Cv1 = np.minimum(1.0, limit / h_tw)
+        stocky = h_tw <= 2.24 * np.sqrt(E / Fy)
+        Vd = np.where(stocky, 1.0, 0.9) * 0.6 * Fy * Aw * np.where(stocky, 1.0, Cv1)
+        Mltb = _ltb_aisc(section, Fy, E, Lb, Cb)
+        Md_station = Md[..., None]
+    else:
+        # 6.2.5 / 6.2.6 with Av = D tw, 6.2.8 moment reduced where V > 0.5 Vpl,Rd
+        Md = Fy * Zx
+        Vd = Aw * Fy / np.sqrt(3)
+        Mltb = _ltb_en(section, Fy, E, Lb, Cb)
+        rho = np.where(np.abs(V) > 0.5 * Vd[..., None], (2 * np.abs(V) / Vd[..., None] - 1) ** 2, 0.0)
+        Md_station = (Zx[..., None] - rho * Aw[..., None] ** 2 / (4 * tw[..., None])) * Fy[..., None]
+
+    # Elastic combined stress sqrt(sigma^2 + 3 tau^2), extreme-fibre sigma with average web tau (conservative)
+    sigma = M / Sx[..., None]
+    tau = V / Aw[..., None]
+    ratios = {
+        "bending": np.abs(M) / Md_station,
+        "shear": np.abs(V) / Vd[..., None],
+        "ltb": np.abs(M) / Mltb[..., None],
+        "combined": np.sqrt(sigma**2 + 3 * tau**2) / Fy[..., None],
+        "deflection": np.abs(delta) / (span / deflection_limit),
+    }
+    stacked = np.stack([np.broadcast_to(ratios[name], np.broadcast_shapes(*(r.shape for r in ratios.values())))
+                        for name in CHECKS])
+    per_check = stacked.max(axis=-1)
+    at = stacked.argmax(axis=-1)
+    check = per_check.argmax(axis=0)
+    station = np.take_along_axis(at, check[None], 0)[0]
+    return {
+        "ratios": ratios,
+        "max": dict(zip(CHECKS, per_check)),
+        "location": dict(zip(CHECKS, x[at])),
+        "governing": per_check.max(axis=0),
+        "governing_check": np.array(CHECKS)[check],
+        "governing_x": x[station],
+    }
@@ -0,0 +1,131 @@
+import numpy as np
+import sfd_slp as sfd
+
+# Continuous beam over any number of spans (three-moment / Clapeyron equations).
+# Supports sit at the span ends; the two outer ends can be Pinned or Fixed and
+# every interior support is a knife-edge. Loads are point loads (N) at global
+# positions plus an optional UDL (N/m) per span.
+#
+# For interior support i with spans L1 = L[i-1] and L2 = L[i] (EI per span):
+#
+#   M[i-1] L1/I1 + 2 M[i] (L1/I1 + L2/I2) + M[i+1] L2/I2 = -(T1/I1 + T2/I2)
+#
+# where T is the load term of each span (P a (L^2 - a^2) / L for a point load a
+# from the far support, w L^3 / 4 for a UDL). A fixed end is an extra span of
+# zero length. The system is tridiagonal and solved in O(n) with the Thomas
+# algorithm. Moments are sagging positive, so support moments are usually negative.
+
+
+# Solves a tridiagonal system; lower[0] and upper[-1] are ignored
+def thomas(lower, diag, upper, rhs):
+    n = len(diag)
+    c = np.zeros(n)
+    d = np.zeros(n)
+    c[0] = upper[0] / diag[0]
+    d[0] = rhs[0] / diag[0]
+    for i in range(1, n):
+        m = diag[i] - lower[i] * c[i - 1]
+        c[i] = upper[i] / m if i < n - 1 else 0.0
+        d[i] = (rhs[i] - lower[i] * d[i - 1]) / m
+    x = np.zeros(n)
+    x[-1] = d[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = d[i] - c[i] * x[i + 1]
+    return x
+
+
+def _span_loads(supports, loads):
+    # Splits global point loads into (span index, distance from the span's left support, P)
+    loads = np.asarray(loads, dtype=float).reshape(-1, 2)
+    pos, P = loads[:, 0], loads[:, 1]
+    if np.any((pos < supports[0]) | (pos > supports[-1])):
+        raise ValueError("Load located outside the beam")
+    span = np.clip(np.searchsorted(supports, pos, side="right") - 1, 0, len(supports) - 2)
+    return span, pos - supports[span], P
+
+
+# Support moments (Nm) at every support, shape (n_spans + 1,)
+def support_moments(spans, loads=(), udl=0.0, left_support_type="Pinned", right_support_type="Pinned", I=sfd.I):
+    if left_support_type not in ("Pinned", "Fixed") or right_support_type not in ("Pinned", "Fixed"):
+        raise ValueError("Continuous beam ends must be Pinned or Fixed")
+    L = np.asarray(spans, dtype=float)
+    n = len(L)
+    Ispan = np.broadcast_to(np.asarray(I, dtype=float), (n,))
+    w = np.broadcast_to(np.asarray(udl, dtype=float), (n,))
+    supports = np.concatenate(([0.0], np.cumsum(L)))
+    k, a, P = _span_loads(supports, loads)
+    b = L[k] - a
+
+    # Load terms of each span seen from its left (TL) and right (TR) support
+    TL = w * L**3 / 4
+    TR = TL.copy()
+    np.add.at(TL, k, P * b * (L[k]**2 - b**2) / L[k])
+    np.add.at(TR, k, P * a * (L[k]**2 - a**2) / L[k])
+    flex = L / Ispan
+    TL, TR = TL / Ispan, TR / Ispan
+
+    lower = np.zeros(n + 1)
+    diag = np.ones(n + 1)
+    upper = np.zeros(n + 1)
+    rhs = np.zeros(n + 1)
+    lower[1:n] = flex[:-1]
+    diag[1:n] = 2 * (flex[:-1] + flex[1:])
+    upper[1:n] = flex[1:]
+    rhs[1:n] = -(TR[:-1] + TL[1:])
+    if left_support_type == "Fixed":
+        diag[0], upper[0], rhs[0] = 2 * flex[0], flex[0], -TL[0]
+    if right_support_type == "Fixed":
+        lower[n], diag[n], rhs[n] = flex[-1], 2 * flex[-1], -TR[-1]
+    return thomas(lower, diag, upper, rhs)
+
+
+# Full solution: support positions, moments and reactions plus V, M, slope and deflection
+# on num_points stations per span (same units as sfd_slp: N, Nm, rad, m)
+def solve_continuous(spans, loads=(), udl=0.0, left_support_type="Pinned", right_support_type="Pinned",
+                     E=sfd.E, I=sfd.I, num_points=101):
+    L = np.asarray(spans, dtype=float)
+    if L.ndim != 1 or len(L) == 0 or np.any(L <= 0):
+        raise ValueError("Spans must be a non-empty list of positive lengths")
+    n = len(L)
+    w = np.broadcast_to(np.asarray(udl, dtype=float), (n,))
+    supports = np.concatenate(([0.0], np.cumsum(L)))
+    Ms = support_moments(L, loads, udl, left_support_type, right_support_type, I)
+    k, a, P = _span_loads(supports, loads)
+
+    # Stations: (span, station) grid, each row runs from one support to the next
+    t = np.linspace(0, 1, num_points)
+    xl = L[:, None] * t[None, :]
+    ML, MR = Ms[:-1, None], Ms[1:, None]
+
+    # Simply supported shear/moment from the span loads plus the linear support moment line
+    V = (MR - ML) / L[:, None] + w[:, None] * (L[:, None] / 2 - xl)
+    M = ML + (MR - ML) * t[None, :] + w[:, None] * xl * (L[:, None] - xl) / 2
+    for span, dist, load in zip(k, a, P):
+        row = xl[span]
+        Ls = L[span]
+        V[span] += np.where(row < dist, load * (Ls - dist) / Ls, -load * dist / Ls)
+        M[span] += np.where(row < dist, load * (Ls - dist) * row / Ls, load * dist * (Ls - row) / Ls)
+
+    # Reactions from the shear just either side of each support
+    V_start = (Ms[1:] - Ms[:-1]) / L + w * L / 2
+    V_end = (Ms[1:] - Ms[:-1]) / L - w * L / 2
+    np.add.at(V_start, k, P * (L[k] - a) / L[k])
+    np.add.at(V_end, k, -P * a / L[k])
+    reactions = np.concatenate((V_start, [0.0])) - np.concatenate(([0.0], V_end))
+
+    # Every span has zero deflection at both of its supports; the three-moment solution
+    # already makes the slopes continuous, so each span can be integrated on its own
+    Ispan = np.broadcast_to(np.asarray(I, dtype=float), (n,))
+    theta, delta = sfd.slope_deflection(xl, M, "Pinned", E, Ispan[:, None])
+
+    x = (supports[:-1, None] + xl).ravel()
+    return {
+        "supports": supports,
+        "support_moments": Ms,
+        "reactions": reactions,
+        "x": x,
+        "V": V.ravel(),
+        "M": M.ravel(),
+        "theta": theta.ravel(),
+        "delta": delta.ravel(),
+    }
@@ -0,0 +1,119 @@
+import os
+import sys
+import numpy as np
+import sfd_slp as sfd
+
+# Precomputed dimensionless influence surfaces for every support pattern in sfd_slp.SUPPORT_CASES.
+# For a unit load at xi_a = a / L, on stations xi = x / L:
+#
+#   V / P,   M / (P L),   delta E I / (P L^3)            shape (n, n)  rows: xi_a, columns: xi
+#   RA / P,  RB / P,  MA / (P L),  MB / (P L)            shape (n,)
+#
+# Any set of point loads on any span is answered by interpolating between load rows and
+# scaling: the loads are binned onto the xi_a grid (O(loads)), then one weights @ table
+# product gives the diagrams, with no per-request solving. Load positions are interpolated
+# linearly, so M is exact at the stations for pinned ends and V can smear over one station
+# at the load. Overhang loads are not covered (xi_a must be in 0..1).
+#
+# The table is stored as float32 in a compressed .npz; build it once with
+#   python influence_library.py [path] [points]
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "influence_lines.npz")
+SURFACES = ("V", "M", "delta")
+REACTIONS = ("RA", "RB", "MA", "MB")
+
+
+def _pattern_key(left_support_type, right_support_type):
+    return f"{left_support_type}-{right_support_type}"
+
+
+class InfluenceLibrary:
+    __slots__ = ("xi", "tables")
+
+    def __init__(self, xi, tables):
+        self.xi = xi
+        self.tables = tables    # "Pinned-Fixed/M" -> array
+
+    # Solves a unit load at every grid position for every support pattern
+    @classmethod
+    def build(cls, points=201, dtype=np.float32):
+        xi = np.linspace(0, 1, points)
+        tables = {}
+        for left, right in sfd.SUPPORT_CASES:
+            rows = {name: [] for name in SURFACES + REACTIONS}
+            for a in xi:
+                _, V, M, reactions = sfd.load_diagrams(1.0, [a], [1.0], left, right, x=xi)
+                _, delta = sfd.slope_deflection(xi, M, left, 1.0, 1.0, right)
+                for name, value in zip(SURFACES + REACTIONS, (V, M, delta) + tuple(reactions)):
+                    rows[name].append(value)
+            key = _pattern_key(left, right)
+            for name, value in rows.items():
+                tables[f"{key}/{name}"] = np.asarray(value, dtype=dtype)
+        return cls(xi, tables)
+
+    def save(self, path=DEFAULT_PATH):
+        np.savez_compressed(path, xi=self.xi, **self.tables)
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH):
+        with np.load(path) as f:
+            return cls(f["xi"], {name: f[name] for name in f.files if name != "xi"})
+
+    @property
+    def nbytes(self):
+        return self.xi.nbytes + sum(table.nbytes for table in self.tables.values())
+
+    def _table(self, left_support_type, right_support_type, name):
+        try:
+            return self.tables[f"{_pattern_key(left_support_type, right_support_type)}/{name}"]
+        except KeyError:
+            raise ValueError(f"Unsupported support combination: {left_support_type} - {right_support_type}") from None
+
+    # Peak |value| over the stations for a unit load at each grid position, e.g. the largest
+    # dimensionless deflection as a function of xi_a (interpolate it with np.interp)
+    def peak(self, left_support_type, right_support_type, name="delta"):
+        return np.abs(self._table(left_support_type, right_support_type, name)).max(axis=1).astype(float)
+
+    # Load magnitudes spread onto the two neighbouring xi_a rows (linear interpolation weights)
+    def _weights(self, span, loads):
+        loads = np.asarray(loads, dtype=float).reshape(-1, 2)
+        xi_a = loads[:, 0] / span
+        if np.any((xi_a < 0) | (xi_a > 1)):
+            raise ValueError("Influence lines only cover loads between the supports")
+        pos = xi_a * (len(self.xi) - 1)
+        i0 = np.minimum(pos.astype(int), len(self.xi) - 2)
+        t = pos - i0
+        w = np.zeros(len(self.xi))
+        np.add.at(w, i0, loads[:, 1] * (1 - t))
+        np.add.at(w, i0 + 1, loads[:, 1] * t)
+        return w
+
+    # Reactions (N, Nm) for point loads given as rows of (position m, magnitude N)
+    def reactions(self, span, loads, left_support_type, right_support_type):
+        w = self._weights(span, loads)
+        RA, RB, MA, MB = (float(w @ self._table(left_support_type, right_support_type, name)) for name in REACTIONS)
+        return RA, RB, MA * span, MB * span
+
+    # Stations x plus V, M and deflection for the same loads, on the library's station grid
+    def diagrams(self, span, loads, left_support_type, right_support_type, E=sfd.E, I=sfd.I):
+        w = self._weights(span, loads)
+        V, M, delta = (w @ self._table(left_support_type, right_support_type, name).astype(float) for name in SURFACES)
+        return self.xi * span, V, M * span, delta * span**3 / (E * I)
+
+
+# Loads the table from disk, building and saving it first if it is not there yet
+def load_library(path=DEFAULT_PATH, points=201):
+    if not os.path.exists(path):
+        library = InfluenceLibrary.build(points)
+        library.save(path)
+        return library
+    return InfluenceLibrary.load(path)
+
+
+if __name__ == "__main__":
+    # python influence_library.py [path] [points]
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    points = int(sys.argv[2]) if len(sys.argv) > 2 else 201
+    library = InfluenceLibrary.build(points)
+    library.save(path)
+    print(f"Wrote {len(library.tables)} tables ({library.nbytes / 1e6:.1f} MB in memory) to {path}")
@@ -0,0 +1,100 @@
+import time
+import threading
+
+# Background jobs for long-running analyses started from the Streamlit page.
+# A job runs on a shared executor; the work function receives the Job handle and calls
+# job.report(progress, message, partial) between steps. report() raises JobCancelled once
+# the job has been cancelled, so cancellation takes effect at the next step boundary.
+# The page keeps a JobRunner in st.session_state and polls it from a fragment; nothing in
+# here touches Streamlit, so worker threads never call st.* functions.
+
+
+class JobCancelled(Exception):
+    pass
+
+
+class Job:
+    __slots__ = ("name", "key", "future", "progress", "message", "partial", "started", "_cancel")
+
+    def __init__(self, name, key):
+        self.name = name
+        self.key = key          # input signature; a different key means the inputs changed
+        self.future = None
+        self.progress = 0.0
+        self.message = ""
+        self.partial = None
+        self.started = time.time()
+        self._cancel = threading.Event()
+
+    # Called by the work function between steps
+    def report(self, progress, message="", partial=None):
+        if self._cancel.is_set():
+            raise JobCancelled(self.name)
+        self.progress = min(max(float(progress), 0.0), 1.0)
+        self.message = message
+        if partial is not None:
+            self.partial = partial
+
+    def cancel(self):
+        self._cancel.set()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    @property
+    def status(self):
+        if self.cancelled:
+            return "cancelled"
+        if not self.future.done():
+            return "running"
+        return "failed" if self.future.exception() is not None else "done"
+
+    @property
+    def elapsed(self):
+        return time.time() - self.started
+
+    def result(self):
+        return self.future.result()
+
+
+def _run(job, func, args, kwargs):
+    job.report(0.0, "started")
+    out = func(job, *args, **kwargs)
+    job.report(1.0, "done")
+    return out
+
+
+class JobRunner:
+    __slots__ = ("executor", "jobs")
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.jobs = {}          # name -> Job, one live job per name
+
+    # Starts func(job, *args, **kwargs) under `name`, replacing (and cancelling) any job of that name
+    def submit(self, name, key, func, *args, **kwargs):
+        self.discard(name)
+        job = Job(name, key)
+        job.future = self.executor.submit(_run, job, func, args, kwargs)
+        self.jobs[name] = job
+        return job
+
+    # Cancels and drops job `name` if it was started for different inputs
+    def sync(self, name, key):
+        job = self.jobs.get(name)
+        if job is not None and job.key != key:
+            self.discard(name)
+
+    def discard(self, name):
+        job = self.jobs.pop(name, None)
+        if job is not None and not job.future.done():
+            job.cancel()
+
+    def get(self, name):
+        return self.jobs.get(name)
+
+    @property
+    def running(self):
+        return any(job.status == "running" for job in self.jobs.values())
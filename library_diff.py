@@ -0,0 +1,123 @@
+import io
+import sys
+import numpy as np
+import sfd_slp as sfd
+import code_check as cc
+import section_library as sl
+import project_store as pst
+
+# Change detection for the section library workbook.
+# Each project store keeps the SectionTable columns it was last checked against as a snapshot
+# (.npz bytes in its own library_snapshot table), so every database is revalidated on its own.
+# When the Database sheet is read again, the new table is compared with the store's snapshot
+# column by column, and only the stored analyses whose current row references an added,
+# revised or removed section are touched: revised sections are re-analysed with their new
+# properties (self-weight included when the stored UDL was the old self-weight), removed ones
+# are reported. The work is one vectorized compare of the table plus one analysis per
+# affected member.
+
+def encode_snapshot(table):
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, names=np.array(table.names, dtype=str),
+                        standards=np.array([str(s) for s in table.standards], dtype=str),
+                        **{f"prop_{key}": values for key, values in table.props.items()})
+    return buffer.getvalue()
+
+
+def decode_snapshot(blob):
+    with np.load(io.BytesIO(blob)) as f:
+        props = {name[len("prop_"):]: f[name] for name in f.files if name.startswith("prop_")}
+        return sl.SectionTable(f["names"].tolist(), f["standards"].tolist(), props)
+
+
+# Sections added, removed and revised between two tables (NaN equals NaN). A name is compared
+# through the row it resolves to (its first row, see SectionTable), which is the row every
+# stored analysis of that name used; a later duplicate row never feeds an analysis, but a
+# reorder that changes which row comes first is a revision.
+def diff_tables(old, new):
+    common = [name for name in new._index if name in old._index]
+    i_old = np.array([old._index[name] for name in common], dtype=int)
+    i_new = np.array([new._index[name] for name in common], dtype=int)
+    changed = np.zeros(len(common), dtype=bool)
+    for key, values in new.props.items():
+        if key not in old.props:
+            changed[:] = True
+            continue
+        a, b = old.props[key][i_old], values[i_new]
+        changed |= ~((a == b) | (np.isnan(a) & np.isnan(b)))
+    return {
+        "added": [name for name in new._index if name not in old._index],
+        "removed": [name for name in old._index if name not in new._index],
+        "changed": [name for name, flag in zip(common, changed) if flag],
+    }
+
+
+# Re-runs one stored single-span analysis with the given section properties
+def reanalyse(record, section, num_points=500):
+    span, a, P = record["span"], record["load_location"], record["load_magnitude"]
+    left, right = record["left_support_type"], record["right_support_type"]
+    x = sfd.beam_stations(span, [a], num_points)
+    _, V, M, _ = sfd.load_diagrams(span, [a], [P], left, right, udl=record["udl"], x=x)
+    _, delta = sfd.slope_deflection(x, M, left, I=section["Ix"], right_support_type=right, supports=(0, span))
+    check = cc.code_check(x, V, M, delta, section, record["fy"], record["design_code"],
+                          Lb=span, Cb=cc.cantilever_cb(left, right), span=span)
+    out = dict(record)
+    out.update(max_shear=float(np.max(np.abs(V))), max_moment=float(np.max(np.abs(M))),
+               max_deflection=float(np.max(np.abs(delta))), utilization=float(check["governing"]),
+               governing_check=str(check["governing_check"]))
+    return out, (x, V, M, delta)
+
+
+# Re-analyses every stored member that currently uses a revised section and appends the new
+# rows to the store. Returns the diff plus the re-analysed rows and the members left on
+# sections that no longer exist.
+def revalidate(store, old, new, num_points=500):
+    diff = diff_tables(old, new)
+    rows = store.latest_by_section(diff["changed"])
+    updated = []
+    for project, group in rows.groupby("project", sort=False):
+        records, diagrams = [], []
+        for row in group.to_dict("records"):
+            section = new.section(row["section"])
+            # Keep self-weight in step with the section when the stored UDL was its old self-weight
+            if np.isclose(row["udl"], sl.self_weight_udl(old.section(row["section"])["mass"])):
+                row["udl"] = sl.self_weight_udl(section["mass"])
+            record, arrays = reanalyse({key: row[key] for key in pst.INPUT_FIELDS + pst.RESULT_FIELDS}, section, num_points)
+            records.append(record)
+            diagrams.append(arrays)
+            updated.append(dict(project=project, previous_utilization=row["utilization"], **record))
+        store.save_many(project, records, diagrams)
+    return {
+        **diff,
+        "updated": updated,
+        "orphaned": store.latest_by_section(diff["removed"]).to_dict("records"),
+    }
+
+
+# Compares a freshly read table with the store's snapshot, revalidates the store and refreshes
+# its snapshot. The first call on a store only writes the snapshot.
+def check_revision(table, store, num_points=500):
+    snapshot = store.library_snapshot()
+    if snapshot is None:
+        store.save_library_snapshot(encode_snapshot(table))
+        return {"added": list(table._index), "removed": [], "changed": [], "updated": [], "orphaned": []}
+    result = revalidate(store, decode_snapshot(snapshot), table, num_points)
+    if result["added"] or result["removed"] or result["changed"]:
+        store.save_library_snapshot(encode_snapshot(table))
+    return result
+
+
+if __name__ == "__main__":
+    # python library_diff.py "000_Steel Section Library.xlsx" [beam_project.sqlite]
+    if len(sys.argv) not in (2, 3):
+        print('Usage: python library_diff.py <library.xlsx> [project.sqlite]')
+        sys.exit(1)
+    import beam_check_engine as bce
+    table = sl.SectionTable.from_sheet(bce.EngineBook(bce.load_model(sys.argv[1])).sheets["Database"])
+    with pst.ProjectStore(sys.argv[2] if len(sys.argv) == 3 else "beam_project.sqlite") as store:
+        result = check_revision(table, store)
+    print(f"{len(result['added'])} added, {len(result['removed'])} removed, {len(result['changed'])} revised sections; "
+          f"{len(result['updated'])} analyses re-run, {len(result['orphaned'])} on removed sections")
+    for row in result["updated"]:
+        print(f"  {row['project']}/{row['member_id']} ({row['section']}): "
+              f"{row['previous_utilization']:.3f} -> {row['utilization']:.3f} ({row['governing_check']})")
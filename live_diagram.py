@@ -0,0 +1,57 @@
+import os
+import numpy as np
+import streamlit.components.v1 as components
+import sfd_slp as sfd
+import units
+
+# Single-span SFD/BMD that recompute in the browser while the load is dragged.
+# For every closed-form case in sfd_slp.SUPPORT_CASES the end moments of a unit point load are
+# polynomials (cubic at most) in the load position, and they scale with the span. The
+# component receives those polynomial coefficients, the overhang carry-over factors and the
+# UDL's reactions once; live_diagram_frontend/beam.js evaluates the reactions, V and M the
+# same way sfd_slp.load_diagrams does, so dragging redraws at frame rate with no server work.
+# The new load position is returned only when the pointer is released.
+
+FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "live_diagram_frontend")
+POLY_DEGREE = 3
+OVERHANG = 0.25  # drag range past a pinned end, as a fraction of the span
+
+_component = components.declare_component("live_diagram", path=FRONTEND)
+
+
+# Unit-span end-moment polynomials (highest power first) of a unit point load at xi = a / L
+def end_moment_polynomials(left_support_type, right_support_type):
+    point = sfd._support_case(left_support_type, right_support_type)[0]
+    xi = np.linspace(0, 1, 2 * POLY_DEGREE + 1)
+    out = []
+    for m in point(1.0, xi, 1 - xi):
+        coefficients = np.polyfit(xi, m, POLY_DEGREE)
+        if not np.allclose(np.polyval(coefficients, xi), m, atol=1e-12):
+            raise ValueError(f"End moments of {left_support_type} - {right_support_type} are not a cubic in the load position")
+        out.append(coefficients)
+    return out
+
+
+# Everything the browser needs for one beam, JSON-ready (SI values, display unit factors)
+def coefficients(span, load_location, load_magnitude, left_support_type, right_support_type, udl=0.0):
+    # Raises ValueError for unstable patterns or an overhang next to a non-pinned support
+    sfd.calculate_supports(span, load_location, load_magnitude, left_support_type, right_support_type)
+    pA, pB = end_moment_polynomials(left_support_type, right_support_type)
+    carry_right, carry_left = sfd._support_case(left_support_type, right_support_type)[2]
+    RA, RB, MA, MB = (float(v) for v in sfd.beam_reactions(span, [], [], left_support_type, right_support_type, udl))
+    return {
+        "span": float(span), "a": float(load_location), "P": float(load_magnitude), "w": float(udl),
+        "left": left_support_type, "right": right_support_type,
+        "pA": pA.tolist(), "pB": pB.tolist(), "carryLeft": float(carry_left), "carryRight": float(carry_right),
+        "udlReactions": [RA, RB, MA, MB],
+        "xmin": -OVERHANG * span if left_support_type == "Pinned" else 0.0,
+        "xmax": (1 + OVERHANG) * span if right_support_type == "Pinned" else float(span),
+        "units": {kind: [units.DISPLAY[kind], units.factor(units.DISPLAY[kind])] for kind in ("force", "moment")},
+    }
+
+
+# Draws the component and returns the load position (m) after the last drag, or None
+def live_diagram(span, load_location, load_magnitude, left_support_type, right_support_type, udl=0.0,
+                 height=620, key=None, on_change=None):
+    return _component(beam=coefficients(span, load_location, load_magnitude, left_support_type, right_support_type, udl),
+                      height=height, key=key, on_change=on_change, default=None)
@@ -0,0 +1,42 @@
+// Closed-form single-span actions, mirroring sfd_slp._point_actions / load_diagrams (SI units).
+// beam: the dict from live_diagram.coefficients(); a: load position from the left support.
+
+function polyval(coefficients, x) {
+  let out = 0;
+  for (const c of coefficients) out = out * x + c;
+  return out;
+}
+
+// Reactions RA, RB and end moments MA, MB for the point load at a plus the UDL
+function reactions(beam, a) {
+  const L = beam.span, P = beam.P;
+  const aSpan = Math.min(Math.max(a, 0), L);
+  const hangLeft = a < 0 ? a : 0;
+  const hangRight = a > L ? L - a : 0;
+  const mA = P * (L * polyval(beam.pA, aSpan / L) + hangLeft + beam.carryLeft * hangRight);
+  const mB = P * (L * polyval(beam.pB, aSpan / L) + hangRight + beam.carryRight * hangLeft);
+  const RA = P * (L - aSpan) / L + (mB - mA) / L;
+  const [RAw, RBw, MAw, MBw] = beam.udlReactions;
+  return { RA: RA + RAw, RB: P - RA + RBw, MA: -mA + MAw, MB: mB + MBw };
+}
+
+// Shear and moment at n stations over the beam (and any overhang the load sits on)
+function diagrams(beam, a, n) {
+  const L = beam.span, P = beam.P, w = beam.w;
+  const { RA, RB, MA, MB } = reactions(beam, a);
+  const x0 = Math.min(0, a), x1 = Math.max(L, a);
+  const x = new Float64Array(n), V = new Float64Array(n), M = new Float64Array(n);
+  const fixedLeft = beam.left === "Fixed";
+  for (let i = 0; i < n; i++) {
+    const xi = x0 + (x1 - x0) * i / (n - 1);
+    const past = xi >= a;
+    const onSpan = Math.min(Math.max(xi, 0), L);
+    x[i] = xi;
+    V[i] = (xi >= 0 ? RA : 0) + (xi > L ? RB : 0) - (past ? P : 0) - w * onSpan;
+    M[i] = RA * Math.max(xi, 0) + RB * Math.max(xi - L, 0) - (past ? P * (xi - a) : 0)
+      - w * onSpan * (Math.max(xi, 0) - onSpan / 2) - (fixedLeft && xi >= 0 ? MA : 0);
+  }
+  return { x, V, M, RA, RB, MA, MB };
+}
+
+if (typeof module !== "undefined") module.exports = { polyval, reactions, diagrams };
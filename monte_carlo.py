@@ -0,0 +1,117 @@
+import concurrent.futures
+import numpy as np
+import sfd_slp as sfd
+import influence_library as il
+import shared_library as shl
+
+# Monte Carlo sweep of a single-span beam under one point load with random load magnitude,
+# load location and fabrication tolerances on the flange and web thickness of a doubly
+# symmetric I-section. Every sample is evaluated with the sfd_slp closed forms, so a batch
+# is a handful of array operations and no diagrams are built:
+#
+#   max moment      max(|MA|, |MB|, |RA a - MA|)  (M is piecewise linear under a point load)
+#   max deflection  P L^3 / (E Ix) * f(a / L), f = peak dimensionless deflection per load
+#                   position, taken from the influence-line library and interpolated
+#
+# Large runs are split into batches with independent random streams (SeedSequence.spawn)
+# and can be spread over processes; the result does not depend on the number of workers.
+# A section from the shared library is passed by name and path, and each worker maps the
+# library once and looks the plates up itself.
+# Inputs and outputs are SI (N, m, Pa).
+
+QUANTITIES = ("max_moment", "max_deflection", "bending_ratio", "deflection_ratio")
+PERCENTILES = (1, 5, 50, 95, 99)
+
+
+# Doubly symmetric I-section from its plates (arrays broadcast): A, Ix, elastic Zx and mass
+def i_section_properties(D, B, tf, tw, density=7850.0):
+    hw = D - 2 * tf
+    A = 2 * B * tf + hw * tw
+    Ix = (B * D**3 - (B - tw) * hw**3) / 12
+    return {"A": A, "Ix": Ix, "Zx": Ix / (D / 2), "mass": A * density}
+
+
+# Peak |deflection| E I / (P L^3) for a unit load at each grid position of the library
+def deflection_coefficients(left_support_type, right_support_type, library=None):
+    library = il.load_library() if library is None else library
+    return library.xi, library.peak(left_support_type, right_support_type, "delta")
+
+
+def _draw(rng, n, nominal):
+    P = rng.normal(nominal["load_magnitude"], nominal["load_magnitude"] * nominal["load_cov"], n)
+    a = rng.normal(nominal["load_location"], nominal["location_sd"], n)
+    tf = rng.normal(nominal["tf"], nominal["tf_sd"], n)
+    tw = rng.normal(nominal["tw"], nominal["tw_sd"], n)
+    return P, np.clip(a, 0.0, nominal["span"]), np.maximum(tf, 0.0), np.maximum(tw, 0.0)
+
+
+# Nominal plates of a shared-library section, filled in where the batch runs
+def _with_section(nominal):
+    if nominal["section"] is None:
+        return nominal
+    props = shl.attach(nominal["library"]).section(nominal["section"])
+    return {**nominal, **{key: props[key] for key in ("D", "B", "tf", "tw")}}
+
+
+# One batch of samples -> array of shape (len(QUANTITIES), n)
+def _run_batch(seed, n, nominal, xi, coefficients):
+    nominal = _with_section(nominal)
+    rng = np.random.default_rng(seed)
+    L = nominal["span"]
+    P, a, tf, tw = _draw(rng, n, nominal)
+    props = i_section_properties(nominal["D"], nominal["B"], tf, tw)
+    RA, _, MA, MB = sfd.calculate_supports(L, a, P, nominal["left_support_type"], nominal["right_support_type"])
+    moment = np.max(np.abs(np.stack((MA, MB, RA * a - MA))), axis=0)
+    deflection = np.abs(P) * L**3 / (nominal["E"] * props["Ix"]) * np.interp(a / L, xi, coefficients)
+    return np.stack((moment, deflection, moment / (props["Zx"] * nominal["fy"]),
+                     deflection / (L / nominal["deflection_limit"])))
+
+
+# Runs the sweep and returns percentiles, histograms and exceedance probabilities.
+#   load_cov: coefficient of variation of the load magnitude
+#   location_sd, tf_sd, tw_sd: standard deviations (m) of the load position and plate thicknesses
+#   section, library: name of a section in the shared library at path `library` (shared_library),
+#       whose plates replace D, B, tf, tw (pass None for those)
+#   workers: processes to use; 1 runs every batch in this process
+#   progress: optional callback(samples_done, samples) after every batch; raising from it stops the run
+def run_monte_carlo(span, load_location, load_magnitude, left_support_type, right_support_type, D, B, tf, tw,
+                    fy, load_cov=0.1, location_sd=0.0, tf_sd=0.0, tw_sd=0.0, E=sfd.E, deflection_limit=360.0,
+                    samples=1_000_000, batch_size=250_000, workers=1, seed=None, bins=50, keep_samples=False,
+                    progress=None, section=None, library=None):
+    sfd._support_case(left_support_type, right_support_type)  # fail early on an unsupported pattern
+    if not 0 <= load_location <= span:
+        raise ValueError("Monte Carlo mode covers loads between the supports only")
+    nominal = dict(span=span, load_location=load_location, load_magnitude=load_magnitude,
+                   left_support_type=left_support_type, right_support_type=right_support_type,
+                   D=D, B=B, tf=tf, tw=tw, fy=fy, load_cov=load_cov, location_sd=location_sd,
+                   tf_sd=tf_sd, tw_sd=tw_sd, E=E, deflection_limit=deflection_limit, section=section, library=library)
+    _with_section(nominal)  # fail early on an unknown section; republishes a pruned library for the workers
+    xi, coefficients = deflection_coefficients(left_support_type, right_support_type)
+    sizes = [batch_size] * (samples // batch_size) + ([samples % batch_size] if samples % batch_size else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = [(s, n, nominal, xi, coefficients) for s, n in zip(seeds, sizes)]
+    pool = None if workers == 1 or len(args) < 2 else concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers, initializer=shl.attach if section else None, initargs=(library,) if section else ())
+    batches, done = [], 0
+    try:
+        for batch in (pool.map(_run_batch, *zip(*args)) if pool else (_run_batch(*arg) for arg in args)):
+            batches.append(batch)
+            done += batch.shape[1]
+            if progress is not None:
+                progress(done, samples)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+    values = np.concatenate(batches, axis=1)
+
+    result = {
+        "samples": samples,
+        "percentiles": {name: dict(zip(PERCENTILES, np.percentile(row, PERCENTILES))) for name, row in zip(QUANTITIES, values)},
+        "mean": dict(zip(QUANTITIES, values.mean(axis=1))),
+        "std": dict(zip(QUANTITIES, values.std(axis=1))),
+        "histograms": {name: np.histogram(row, bins=bins) for name, row in zip(QUANTITIES, values)},
+        "exceedance": {"bending": float(np.mean(values[2] > 1.0)), "deflection": float(np.mean(values[3] > 1.0))},
+    }
+    if keep_samples:
+        result["values"] = dict(zip(QUANTITIES, values))
+    return result
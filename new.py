@@ -3,26 +3,184 @@ import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import matplotlib.pyplot as plt
-import xlwings as xw
 import matplotlib.patches as patches
 import sfd_slp as sfd
+import beam_check_engine as bce
+from beam_pipeline import BeamPipeline
+import continuous_beam as cb
+import section_library as sl
+import shared_library as shl
+import section_engine as se
+import plastic_section as pls
+import live_diagram as lvd
+import chart_transport as ct
+import profiling as prof
+import report_export as rpt
+import code_check as cc
+import monte_carlo as mc
+import parametric_sweep as ps
+import project_store as pst
+import library_diff as ld
+import os
+import concurrent.futures
+import job_runner as jr
+import units
+try:
+    import xlwings as xw
+except ImportError:  # e.g. the Linux container, where Excel is not available
+    xw = None
+# Errors that mean Excel cannot be driven here (no engine on this platform, COM or launch failures);
+# anything else from xlwings is a real problem with the workbook and is not hidden
+EXCEL_UNAVAILABLE = (OSError,) if xw is None else (xw.XlwingsError, OSError)
+try:
+    import pywintypes
+    EXCEL_UNAVAILABLE += (pywintypes.com_error,)
+except ImportError:
+    pass
 
 # Set page configuration
 st.set_page_config(page_title="MODEC Beam Sensei", layout="wide")
 
+# Compile the workbook formulas once per server process
+@st.cache_resource
+def load_formula_model(filepath):
+    return bce.load_model(filepath)
+
+# Section properties are read from the Database sheet once per server process and published
+# per version of its contents; returns the path that this process and the worker pools map
+# read-only (see shared_library)
+@st.cache_resource
+def load_section_library(filepath, _sheet_db):
+    return shl.shared_table(_sheet_db.range(sl.DATABASE_RANGE).value)
+
+# One project database per server process (path from BEAM_PROJECT_DB)
+@st.cache_resource
+def open_project_store(path):
+    return pst.ProjectStore(path)
+
+# Compares the Database sheet with the store's snapshot once per server process and store, and
+# re-runs the stored analyses that use revised sections as a background job (the page does not
+# wait for it; its outcome shows on the next rerun after it finishes)
+@st.cache_resource
+def library_revision_job(filepath, _table, project_db):
+    runner = jr.JobRunner(job_executor())
+    return runner.submit("library_revision", project_db, library_revision_work, _table, open_project_store(project_db))
+
+def library_revision_work(job, table, store):
+    return ld.check_revision(table, store)
+
+# Background analyses share one small thread pool per server process
+@st.cache_resource
+def job_executor():
+    return concurrent.futures.ThreadPoolExecutor(max_workers=4)
+
+# Selection lists from the Database sheet, read once per workbook
+@st.cache_data
+def database_lists(filepath, _sheet_db):
+    return {
+        "beam_types": _sheet_db.range('A4:A1021').value,
+        "similarity_types": _sheet_db.range('AW28:AW29').value,
+        "yield_strengths": _sheet_db.range('AR21:AR25').value,
+    }
+
+# Widgets other tabs depend on flag a full rerun; the fragment performs it (st.rerun is a no-op in callbacks)
+def rerun_all_tabs():
+    st.session_state["rerun_all_tabs"] = True
+
+def rerun_if_requested():
+    if st.session_state.pop("rerun_all_tabs", False):
+        st.rerun()
+
+# Span x load-location grids are computed once per distinct input set
+@st.cache_data(max_entries=8)
+def run_span_sweep(span_range, points, load_magnitude, left_support_type, right_support_type, I):
+    spans = np.linspace(span_range[0], span_range[1], points)
+    locations = np.linspace(0.0, span_range[1], points)
+    return ps.sweep_span_location(spans, locations, load_magnitude, left_support_type, right_support_type, I=I)
+
 # Define functions for data extraction and calculations
 def load_excel_data(filepath, database_sheet, lookup_sheet):
-    try:
-        wb = xw.Book(filepath)
-        sheet_db = wb.sheets[database_sheet]
-        sheet_lookup = wb.sheets[lookup_sheet]
-        return wb, sheet_db, sheet_lookup
-    except FileNotFoundError:
+    if not os.path.exists(filepath):
         st.error(f"File not found: {filepath}")
+        return None, None, None
+    if xw is None:
+        reason = "xlwings is not installed"
+    else:
+        try:
+            wb = xw.Book(filepath)
+            sheet_db = wb.sheets[database_sheet]
+            sheet_lookup = wb.sheets[lookup_sheet]
+            return wb, sheet_db, sheet_lookup
+        except EXCEL_UNAVAILABLE as e:
+            reason = f"{type(e).__name__}: {e}"
+    if "formula_book" not in st.session_state:
+        st.caption(f"Excel is not available ({reason}); using the built-in formula engine")
+    # No Excel available (e.g. Docker on Linux): evaluate the workbook formulas in Python instead.
+    # Each user session gets its own copy of the cell values.
+    try:
+        if "formula_book" not in st.session_state:
+            st.session_state["formula_book"] = bce.EngineBook(load_formula_model(filepath))
+        wb = st.session_state["formula_book"]
+        return wb, wb.sheets[database_sheet], wb.sheets[lookup_sheet]
     except Exception as e:
         st.error(f"Error loading Excel file: {e}")
         return None, None, None
+
+# Read a block of the Beam_Check sheet as a table
+def read_check_table(wb, excel_file, usecols, header, nrows):
+    # The formula engine holds the recalculated values in memory rather than in the file
+    if isinstance(wb, bce.EngineBook):
+        return wb.sheets["Beam_Check"].frame(usecols, header, nrows)
+    return pd.read_excel(excel_file, sheet_name="Beam_Check", usecols=usecols, header=header, nrows=nrows)
     
+# Built-up plate section: columns and default (a plated I-girder), in mm
+PLATE_COLUMNS = ["x0 (mm)", "y0 (mm)", "Width (mm)", "Height (mm)"]
+DEFAULT_PLATES = [[0, 0, 200, 15], [94, 15, 12, 370], [0, 385, 200, 15], [25, -20, 150, 20]]
+
+# Outline of a polygon / plate section to scale, cut-outs in white
+def draw_plate_section(section):
+    fig, ax = plt.subplots(figsize=(2, 2), dpi=400)
+    for vertices, sign in section.rings:
+        ax.add_patch(patches.Polygon(vertices * 1000, closed=True, linewidth=0.5, edgecolor='black',
+                                     facecolor='steelblue' if sign > 0 else 'white'))
+    ax.autoscale_view()
+    ax.set_aspect('equal')
+    ax.axis('off')
+    return fig
+
+# Section engine properties in the Database sheet's units
+def plate_section_table(props, plastic):
+    rows = [("Area", "A", props["A"], "cm^2"), ("Centroid x", "xc", props["xc"], "mm"), ("Centroid y", "yc", props["yc"], "mm"),
+            ("Second moment of area", "Ix", props["Ix"], "cm^4"), ("Second moment of area", "Iy", props["Iy"], "cm^4"),
+            ("Product of inertia", "Ixy", props["Ixy"], "cm^4"), ("Principal second moment", "I1", props["I1"], "cm^4"),
+            ("Principal second moment", "I2", props["I2"], "cm^4"), ("Elastic modulus", "Zx", props["Zx"], "cm^3"),
+            ("Elastic modulus", "Zy", props["Zy"], "cm^3"), ("Radius of gyration", "rx", props["rx"], "cm"),
+            ("Radius of gyration", "ry", props["ry"], "cm"), ("Plastic modulus", "Zpx", plastic["Zpx"], "cm^3"),
+            ("Plastic modulus", "Zpy", plastic["Zpy"], "cm^3"), ("Torsion constant", "J", props["J"], "cm^4")]
+    table = pd.DataFrame({
+        "Variable": [row[0] for row in rows],
+        "Symbol": [row[1] for row in rows],
+        "Value": [f"{units.from_si(row[2], row[3]):.2f}" for row in rows],
+        "Unit": [row[3] for row in rows],
+    })
+    principal = pd.DataFrame({"Variable": ["Principal axis angle"], "Symbol": ["θ"],
+                              "Value": [f"{np.degrees(props['theta']):.2f}"], "Unit": ["deg"]})
+    return pd.concat([table, principal], ignore_index=True)
+
+# Plastic / effective properties of a Custom Beam shape from plastic_section
+def section_class_table(props):
+    rows = [("Elastic modulus", "Zx", units.from_si(float(props["Zx"]), "cm^3"), "cm^3"),
+            ("Plastic modulus", "Zpx", units.from_si(float(props["Zpx"]), "cm^3"), "cm^3"),
+            ("Plastic neutral axis", "ypna", units.from_si(float(props["ypna"]), "mm"), "mm"),
+            ("Effective modulus", "Zeffx", units.from_si(float(props["Zeffx"]), "cm^3"), "cm^3"),
+            ("Flange reduction", "ρf", float(props["rho_flange"]), "-"),
+            ("Web reduction", "ρw", float(props["rho_web"]), "-"),
+            ("Section class", "", int(props["section_class"]), "-"),
+            ("Design modulus", "Zdx", units.from_si(float(props["Zdx"]), "cm^3"), "cm^3")]
+    return pd.DataFrame({"Variable": [row[0] for row in rows], "Symbol": [row[1] for row in rows],
+                         "Value": [f"{row[2]:.2f}" if isinstance(row[2], float) else str(row[2]) for row in rows],
+                         "Unit": [row[3] for row in rows]})
+
 # Function to draw I-beam based on user inputs and add labels
 def draw_static_ibeam_with_labels(height, width, flange_thickness, web_thickness):
     # Fixed dimensions for the I-beam shape
@@ -248,106 +406,8 @@ def draw_static_rect_tube_with_labels(height, width, thickness):
     return fig
 
 def draw_beam_with_supports_plotly(span, left_support_type, right_support_type, load_location, load_magnitude, RA, RB, MA, MB):
-    # Ensure that load_location and load_magnitude are numeric (float type)
-    load_location = float(load_location)
-    load_magnitude = float(load_magnitude)
-    
-    # Define the x-coordinates for left and right supports (in meters)
-    left_support_position = 0  # Left support is always at the start of the beam
-    right_support_position = span  # Right support is at the end of the beam
-
-    # Create the plot layout without axes
-    layout = go.Layout(
-        shapes=[
-            # Draw the beam (a simple line from left to right support)
-            go.layout.Shape(
-                type="line", 
-                x0=left_support_position, 
-                y0=0, 
-                x1=right_support_position, 
-                y1=0, 
-                line=dict(color="blue", width=4),
-            ),
-            # Draw left support (triangle) based on support type
-            go.layout.Shape(
-                type="path", 
-                path=f"M {left_support_position-0.2} -0.5 L {left_support_position+0.2} -0.5 L {left_support_position} 0 Z",  
-                fillcolor="yellow",
-                line=dict(color="yellow", width=2),
-            ) if left_support_type == "Pinned" else
-            go.layout.Shape(
-                type="line", 
-                x0=left_support_position,
-                y0=-1,
-                x1=left_support_position,
-                y1=1,
-                line=dict(color="yellow", width=6),
-            ),
-            # Draw right support (triangle) based on support type
-            go.layout.Shape(
-                type="path", 
-                path=f"M {right_support_position-0.2} -0.5 L {right_support_position+0.2} -0.5 L {right_support_position} 0 Z", 
-                fillcolor="yellow",
-                line=dict(color="yellow", width=2),
-            ) if right_support_type == "Pinned" else
-            go.layout.Shape(
-                type="line", 
-                x0=right_support_position,
-                y0=-1,
-                x1=right_support_position,
-                y1=1,
-                line=dict(color="yellow", width=6),
-            )
-        ],
-        annotations=[
-            dict(
-                x=load_location,
-                y=0,
-                text=f"{load_magnitude} kN",
-                font=dict(size=20, color="red"),
-                showarrow=True,
-                arrowhead=2,
-                ax=0,
-                ay=-100,
-            ),
-            dict(
-                x=left_support_position,
-                y=0,
-                text=f"R_L = {RA:.2f} kN\nM_L = {MA:.2f} kNm",
-                font=dict(size=20, color="green"),
-                showarrow=True,
-                arrowhead=5,
-                ax=0,
-                ay=80,
-            ),
-            dict(
-                x=right_support_position,
-                y=0,
-                text=f"R_R = {RB:.2f} kN\nM_R = {MB:.2f} kNm",
-                font=dict(size=20, color="green"),
-                showarrow=True,
-                arrowhead=5,
-                ax=0,
-                ay=80,
-            ),
-        ],
-        xaxis=dict(
-            visible=False,
-            range=[-2, span + 2],
-        ),
-        yaxis=dict(
-            visible=False,
-            range=[-1.5, 1.5],
-        ),
-        plot_bgcolor="white",
-        showlegend=False,
-        height=300,
-    )
-    # Create the figure with the layout
-    fig = go.Figure(layout=layout)
-
     # Show the figure
-    st.plotly_chart(fig)
+    ct.plotly_chart(sfd.beam_supports_figure(span, left_support_type, right_support_type, load_location, load_magnitude, RA, RB, MA, MB))
 
 def draw_static_circ_tube_with_labels(diameter, thickness):
     # Calculate the inner and outer radii
@@ -583,311 +643,696 @@ def main():
     <h1 class="title">MODEC Beam Sensei</h1>
 """, unsafe_allow_html=True)
     t1, t2, t3 = st.tabs(["Section Library", "Custom Beam", "Beam Analyzer"])
-    with st.container():
-        # Use two columns for layout
-        left_col, right_col = t1.columns([2, 5])  # 3 parts left, 1 part right for diagrams
-        left2_col, right2_col = t2.columns([2, 7])
-        left3_col, right3_col = t3.columns([1, 3])
-        # Load Workbook
-        excel_file = "000_Steel Section Library.xlsx"
-        wb, sheet_db, sheet_lookup = load_excel_data(excel_file, "Database", "Beam_Check")
-        if not wb:
-                st.error("Excel file could not be loaded.")
-                return
-        # Left Panel: Beam Input Section
-        with left_col:
-            Beam_Type = sheet_db.range('A4:A1021').value
-            Beam_Selection = st.selectbox("Select Beam Type:", Beam_Type, index=0)
-            Similarity_Type = sheet_db.range('AW28:AW29').value
-            Similarity_Selection = st.selectbox("Select Similarity Type:", Similarity_Type, index=0)
-            Yield_Strength = sheet_db.range('AR21:AR25').value
-            Yield_Strength_Selection = st.selectbox("Select Yield Strength (MPa):", Yield_Strength, index=0)
-
-            if st.button("Generate properties from Database"):
+    # Load Workbook
+    excel_file = "000_Steel Section Library.xlsx"
+    wb, sheet_db, sheet_lookup = load_excel_data(excel_file, "Database", "Beam_Check")
+    if not wb:
+        st.error("Excel file could not be loaded.")
+        return
+    # Each tab is a fragment, so a widget in one tab reruns only that tab
+    with t1:
+        section_library_tab(excel_file, wb, sheet_db, sheet_lookup)
+    with t2:
+        custom_beam_tab(excel_file, wb, sheet_db, sheet_lookup)
+    with t3:
+        beam_analyzer_tab(excel_file, wb, sheet_db, sheet_lookup)
+
+# Section Library tab
+@st.fragment
+@prof.profiled("section_library")
+def section_library_tab(excel_file, wb, sheet_db, sheet_lookup):
+    lists = database_lists(excel_file, sheet_db)
+    left_col, right_col = st.columns([2, 5])  # 3 parts left, 1 part right for diagrams
+
+    with left_col:
+        # The Beam Analyzer tab uses these two, so changing them reruns every tab
+        Beam_Selection = st.selectbox("Select Beam Type:", lists["beam_types"], index=0, key="beam_selection", on_change=rerun_all_tabs)
+        Similarity_Selection = st.selectbox("Select Similarity Type:", lists["similarity_types"], index=0)
+        Yield_Strength_Selection = st.selectbox("Select Yield Strength (MPa):", lists["yield_strengths"], index=0,
+                                                key="library_yield_strength", on_change=rerun_all_tabs)
+        rerun_if_requested()
+
+        if st.button("Generate properties from Database"):
+            try:
+                sheet_lookup.range('C12').value = Beam_Selection
+                sheet_lookup.range('C14').value = Similarity_Selection
+                wb.save()
+                # Generate the I-beam diagram when button is pressed
+                fig = draw_static_ibeam_with_labels(sheet_lookup.range('E19').value, sheet_lookup.range('E20').value, sheet_lookup.range('E21').value, sheet_lookup.range('E22').value)
+                st.pyplot(fig)
+                with right_col:
+                    a, b = st.columns([1,1])
+                    with a:
+                        st.write(f"Alt. Std. 1: {sheet_lookup.range('L12').value}")
+                    with b:
+                        st.write(f"Alt. Std. 2: {sheet_lookup.range('L13').value}")
+                    df = read_check_table(wb, excel_file, 'B:J', 16, 21)
+                    df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3"]
+                    # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
+                    df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
+                    # Display the DataFrame with `st.table()`
+                    st.table(df)
+            except Exception as e:
+                st.error(f"An error occurred: {e}")
+
+# Custom Beam tab
+@st.fragment
+@prof.profiled("custom_beam")
+def custom_beam_tab(excel_file, wb, sheet_db, sheet_lookup):
+    lists = database_lists(excel_file, sheet_db)
+    left2_col, right2_col = st.columns([2, 7])
+
+    with left2_col:
+        # Streamlit UI
+        # st.markdown('<h1 style="font-size: 20px;">Static I-Beam Diagram with Dynamic Labels</h1>', unsafe_allow_html=True)
+        beam_type_selection = st.selectbox("Select Beam Type:", ["Symmetric I-Beam", "Assymmetric I-Beam", "Boxed Up I-Beam", "Rectangular Tube", "Circular Tube", "Built-up Plates"],
+                                           key="custom_beam_type", on_change=rerun_all_tabs)
+        rerun_if_requested()
+        # Display input fields based on the selected beam type
+        if beam_type_selection == "Symmetric I-Beam":
+            a, b = st.columns([1, 1])
+            with a:
+                height = st.number_input("Height (mm)", min_value=100, max_value=2000, value=200, key="custom_height")
+                width = st.number_input("Width (mm)", min_value=50, max_value=1000, value=150, key="custom_width")
+            with b:
+                flange_thickness = st.number_input("Tf (mm)", min_value=1, max_value=200, value=20, key="custom_tf")
+                web_thickness = st.number_input("Tw (mm)", min_value=1, max_value=100, value=20, key="custom_tw")
+            shape_dims = (height, width, flange_thickness, web_thickness)
+
+        elif beam_type_selection == "Assymmetric I-Beam":
+            a, b = st.columns([1, 1])
+            with a:
+                depth = st.number_input("Depth (mm)", min_value=50, max_value=5000, value=200)
+                top_flange_breadth = st.number_input("Top flange breadth (mm)", min_value=50, max_value=5000, value=150)
+                bottom_flange_breadth = st.number_input("Bottom flange breadth (mm)", min_value=50, max_value=5000, value=100)
+            with b:
+                top_flange_thickness = st.number_input("Top flange thickness (mm)", min_value=5, max_value=100, value=20)
+                bottom_flange_thickness = st.number_input("Bottom flange thickness (mm)", min_value=5, max_value=100, value=10)
+                web_thickness = st.number_input("Web thickness (mm)", min_value=5, max_value=100, value=20)
+            shape_dims = (depth, top_flange_breadth, bottom_flange_breadth, top_flange_thickness, bottom_flange_thickness, web_thickness)
+
+        elif beam_type_selection == "Boxed Up I-Beam":
+            a, b = st.columns([1, 1])
+            with a:
+                depth = st.number_input("Depth (mm)", min_value=50, max_value=5000, value=200)
+                flange_breadth = st.number_input("Flange breadth (mm)", min_value=50, max_value=5000, value=150)
+                flange_thickness = st.number_input("Flange thickness (mm)", min_value=5, max_value=100, value=20)
+            with b:
+                center_web_thickness = st.number_input("Center web thickness (mm)", min_value=5, max_value=100, value=10)
+                outer_web_thickness = st.number_input("Outer web thickness (mm)", min_value=5, max_value=100, value=20)
+            shape_dims = (depth, flange_breadth, flange_thickness, center_web_thickness, outer_web_thickness)
+
+        elif beam_type_selection == "Rectangular Tube":
+            depth = st.number_input("Depth (mm)", min_value=50, max_value=5000, value=200)
+            breadth = st.number_input("Breadth (mm)", min_value=50, max_value=5000, value=150)
+            thickness = st.number_input("Thickness (mm)", min_value=5, max_value=100, value=20)
+            shape_dims = (depth, breadth, thickness)
+
+        elif beam_type_selection == "Circular Tube":
+            diameter = st.number_input("Diameter (mm)", min_value=50, max_value=1000, value=200)
+            thickness = st.number_input("Thickness (mm)", min_value=5, max_value=1000, value=10)
+            shape_dims = (diameter, thickness)
+
+        elif beam_type_selection == "Built-up Plates":
+            # Plates and rectangular cut-outs by bottom-left corner and size; any channel, angle, tee or plated girder
+            plates = st.data_editor(pd.DataFrame(DEFAULT_PLATES, columns=PLATE_COLUMNS), num_rows="dynamic", key="custom_plates").dropna()
+            cutouts = st.data_editor(pd.DataFrame(columns=PLATE_COLUMNS, dtype=float), num_rows="dynamic", key="custom_cutouts").dropna()
+
+        # Written to the sheet for the I-beams; sets the section class and effective widths for every shape
+        Yield_Strength_Selection = st.selectbox("Select Yield Strength (MPa): ", lists["yield_strengths"], index=0)
+        Similarity_Selection = st.selectbox("Select Similarity Type: ", lists["similarity_types"], index=0)
+        
+        # Button to generate the diagram
+        generate_button = st.button("Generate Properties")
+        if generate_button:
+            # Depending on the selected beam type, call the appropriate function to generate the diagram
+            if beam_type_selection == "Symmetric I-Beam":
                 try:
-                    sheet_lookup.range('C12').value = Beam_Selection
-                    sheet_lookup.range('C14').value = Similarity_Selection
+                    sheet_lookup.range('E42').value = height
+                    sheet_lookup.range('E43').value = width
+                    sheet_lookup.range('E44').value = flange_thickness
+                    sheet_lookup.range('E45').value = web_thickness
+                    sheet_lookup.range('C47').value = Similarity_Selection
+                    sheet_lookup.range('C48').value = Yield_Strength_Selection
+                    # Save other properties to the Excel sheet
                     wb.save()
-                    # Generate the I-beam diagram when button is pressed
-                    fig = draw_static_ibeam_with_labels(sheet_lookup.range('E19').value, sheet_lookup.range('E20').value, sheet_lookup.range('E21').value, sheet_lookup.range('E22').value)
+                    fig = draw_static_ibeam_with_labels(height, width, flange_thickness, web_thickness)
                     st.pyplot(fig)
-                    with right_col:
-                        a, b = st.columns([1,1])
-                        with a:
-                            st.write(f"Alt. Std. 1: {sheet_lookup.range('L12').value}")
-                        with b:
-                            st.write(f"Alt. Std. 2: {sheet_lookup.range('L13').value}")
-                        df = pd.read_excel(excel_file, sheet_name="Beam_Check", usecols='B:J', header=16, nrows=21)
-                        df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3"]
-                        # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
-                        df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
-                        # Display the DataFrame with `st.table()`
-                        st.table(df)
                 except Exception as e:
-                    st.error(f"An error occurred: {e}")
-        with left2_col:
-            # Streamlit UI
-            # st.markdown('<h1 style="font-size: 20px;">Static I-Beam Diagram with Dynamic Labels</h1>', unsafe_allow_html=True)
-            beam_type_selection = st.selectbox("Select Beam Type:", ["Symmetric I-Beam", "Assymmetric I-Beam", "Boxed Up I-Beam", "Rectangular Tube", "Circular Tube"])
-            # Display input fields based on the selected beam type
-            if beam_type_selection == "Symmetric I-Beam":
-                a, b = st.columns([1, 1])
-                with a:
-                    height = st.number_input("Height (mm)", min_value=100, max_value=2000, value=200)
-                    width = st.number_input("Width (mm)", min_value=50, max_value=1000, value=150)
-                with b:
-                    flange_thickness = st.number_input("Tf (mm)", min_value=1, max_value=200, value=20)
-                    web_thickness = st.number_input("Tw (mm)", min_value=1, max_value=100, value=20)
-                Yield_Strength = sheet_db.range('AR21:AR25').value
-                Yield_Strength_Selection = st.selectbox("Select Yield Strength (MPa): ", Yield_Strength, index=0)
-    
+                    st.error(f"Failed to save data to Excel: {e}")
+                
+                with right2_col:
+                    a, b, c = st.columns([1, 1, 1])
+                    with a:
+                        st.write(f"Alt. Std. 1: {sheet_lookup.range('L42').value}")
+                    with b:
+                        st.write(f"Alt. Std. 2: {sheet_lookup.range('L43').value}")
+                    with c:
+                        st.write(f"Alt. Std. 3: {sheet_lookup.range('L44').value}")
+                    
+                    df = read_check_table(wb, excel_file, 'B:L', 48, 21)
+                    df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
+                    # st.dataframe(df, height = 740, use_container_width=True)
+                    # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
+                    df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
+                    # Display the DataFrame with `st.table()`
+                    st.table(df)
+
             elif beam_type_selection == "Assymmetric I-Beam":
-                a, b = st.columns([1, 1])
-                with a:
-                    depth = st.number_input("Depth (mm)", min_value=50, max_value=5000, value=200)
-                    top_flange_breadth = st.number_input("Top flange breadth (mm)", min_value=50, max_value=5000, value=150)
-                    bottom_flange_breadth = st.number_input("Bottom flange breadth (mm)", min_value=50, max_value=5000, value=100)
-                with b:
-                    top_flange_thickness = st.number_input("Top flange thickness (mm)", min_value=5, max_value=100, value=20)
-                    bottom_flange_thickness = st.number_input("Bottom flange thickness (mm)", min_value=5, max_value=100, value=10)
-                    web_thickness = st.number_input("Web thickness (mm)", min_value=5, max_value=100, value=20)
-                Yield_Strength = sheet_db.range('AR21:AR25').value
-                Yield_Strength_Selection = st.selectbox("Select Yield Strength (MPa): ", Yield_Strength, index=0)
+                try:
+                    sheet_lookup.range('E74').value = depth
+                    sheet_lookup.range('E75').value = top_flange_breadth
+                    sheet_lookup.range('E76').value = bottom_flange_breadth
+                    sheet_lookup.range('E77').value = top_flange_thickness
+                    sheet_lookup.range('E78').value = bottom_flange_thickness
+                    sheet_lookup.range('E79').value = web_thickness
+                    sheet_lookup.range('C81').value = Similarity_Selection
+                    sheet_lookup.range('C82').value = Yield_Strength_Selection
+                    # Save other properties to the Excel sheet
+                    wb.save()
+                    fig = draw_static_assyym_ibeam_with_labels(depth, top_flange_breadth, bottom_flange_breadth, top_flange_thickness, bottom_flange_thickness, web_thickness)
+                    st.pyplot(fig)
+                except Exception as e:
+                    st.error(f"Failed to save data to Excel: {e}")
+                
+                with right2_col:
+                    a, b, c = st.columns([1, 1, 1])
+                    with a:
+                        st.write(f"Alt. Std. 1: {sheet_lookup.range('L74').value}")
+                    with b:
+                        st.write(f"Alt. Std. 2: {sheet_lookup.range('L75').value}")
+                    with c:
+                        st.write(f"Alt. Std. 3: {sheet_lookup.range('L76').value}")
+                    
+                    df = read_check_table(wb, excel_file, 'B:L', 82, 23)
+                    df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
+                    # st.dataframe(df, height = 740, use_container_width=True)
+                    # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
+                    df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
+                    # Display the DataFrame with `st.table()`
+                    st.table(df)
 
             elif beam_type_selection == "Boxed Up I-Beam":
-                a, b = st.columns([1, 1])
-                with a:
-                    depth = st.number_input("Depth (mm)", min_value=50, max_value=5000, value=200)
-                    flange_breadth = st.number_input("Flange breadth (mm)", min_value=50, max_value=5000, value=150)
-                    flange_thickness = st.number_input("Flange thickness (mm)", min_value=5, max_value=100, value=20)
-                with b:
-                    center_web_thickness = st.number_input("Center web thickness (mm)", min_value=5, max_value=100, value=10)
-                    outer_web_thickness = st.number_input("Outer web thickness (mm)", min_value=5, max_value=100, value=20)
+                try:
+                    sheet_lookup.range('E110').value = depth
+                    sheet_lookup.range('E111').value = flange_breadth
+                    sheet_lookup.range('E112').value = flange_thickness
+                    sheet_lookup.range('E113').value = center_web_thickness
+                    sheet_lookup.range('E114').value = outer_web_thickness
+                    sheet_lookup.range('C116').value = Similarity_Selection
+                    # Save other properties to the Excel sheet
+                    wb.save()
+                    fig = draw_static_boxedup_ibeam_with_labels(depth, flange_breadth, flange_thickness, center_web_thickness, outer_web_thickness)
+                    st.pyplot(fig)
+                except Exception as e:
+                    st.error(f"Failed to save data to Excel: {e}")
+                
+                with right2_col:
+                    a, b, c = st.columns([1, 1, 1])
+                    with a:
+                        st.write(f"Alt. Std. 1: {sheet_lookup.range('L110').value}")
+                    with b:
+                        st.write(f"Alt. Std. 2: {sheet_lookup.range('L111').value}")
+                    with c:
+                        st.write(f"Alt. Std. 3: {sheet_lookup.range('L112').value}")
+                    
+                    df = read_check_table(wb, excel_file, 'B:L', 117, 22)
+                    df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
+                    # st.dataframe(df, height = 740, use_container_width=True)
+                    # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
+                    df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
+                    # Display the DataFrame with `st.table()`
+                    st.table(df)
 
             elif beam_type_selection == "Rectangular Tube":
-                depth = st.number_input("Depth (mm)", min_value=50, max_value=5000, value=200)
-                breadth = st.number_input("Breadth (mm)", min_value=50, max_value=5000, value=150)
-                thickness = st.number_input("Thickness (mm)", min_value=5, max_value=100, value=20)
+                try:
+                    sheet_lookup.range('E144').value = depth
+                    sheet_lookup.range('E145').value = breadth
+                    sheet_lookup.range('E146').value = thickness
+                    sheet_lookup.range('C148').value = Similarity_Selection
+                    # Save other properties to the Excel sheet
+                    wb.save()
+                    fig = draw_static_rect_tube_with_labels(depth, breadth, thickness)
+                    st.pyplot(fig)
+                except Exception as e:
+                    st.error(f"Failed to save data to Excel: {e}")
+                
+                with right2_col:
+                    a, b, c = st.columns([1, 1, 1])
+                    with a:
+                        st.write(f"Alt. Std. 1: {sheet_lookup.range('L144').value}")
+                    with b:
+                        st.write(f"Alt. Std. 2: {sheet_lookup.range('L145').value}")
+                    with c:
+                        st.write(f"Alt. Std. 3: {sheet_lookup.range('L146').value}")
+                    
+                    df = read_check_table(wb, excel_file, 'B:L', 149, 22)
+                    df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
+                    # st.dataframe(df, height = 740, use_container_width=True)
+                    # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
+                    df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
+                    # Display the DataFrame with `st.table()`
+                    st.table(df)
 
             elif beam_type_selection == "Circular Tube":
-                diameter = st.number_input("Diameter (mm)", min_value=50, max_value=1000, value=200)
-                thickness = st.number_input("Thickness (mm)", min_value=5, max_value=1000, value=10)
-
-            Similarity_Type = sheet_db.range('AW28:AW29').value
-            Similarity_Selection = st.selectbox("Select Similarity Type: ", Similarity_Type, index=0)
-            
-            # Button to generate the diagram
-            generate_button = st.button("Generate Properties")
-            if generate_button:
-                # Depending on the selected beam type, call the appropriate function to generate the diagram
-                if beam_type_selection == "Symmetric I-Beam":
-                    try:
-                        sheet_lookup.range('E42').value = height
-                        sheet_lookup.range('E43').value = width
-                        sheet_lookup.range('E44').value = flange_thickness
-                        sheet_lookup.range('E45').value = web_thickness
-                        sheet_lookup.range('C47').value = Similarity_Selection
-                        sheet_lookup.range('C48').value = Yield_Strength_Selection
-                        # Save other properties to the Excel sheet
-                        wb.save()
-                        fig = draw_static_ibeam_with_labels(height, width, flange_thickness, web_thickness)
-                        st.pyplot(fig)
-                    except Exception as e:
-                        st.error(f"Failed to save data to Excel: {e}")
-                    
-                    with right2_col:
-                        a, b, c = st.columns([1, 1, 1])
-                        with a:
-                            st.write(f"Alt. Std. 1: {sheet_lookup.range('L42').value}")
-                        with b:
-                            st.write(f"Alt. Std. 2: {sheet_lookup.range('L43').value}")
-                        with c:
-                            st.write(f"Alt. Std. 3: {sheet_lookup.range('L44').value}")
-                        
-                        df = pd.read_excel(excel_file, sheet_name="Beam_Check", usecols='B:L', header=48, nrows=21)
-                        df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
-                        # st.dataframe(df, height = 740, use_container_width=True)
-                        # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
-                        df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
-                        # Display the DataFrame with `st.table()`
-                        st.table(df)
-
-                elif beam_type_selection == "Assymmetric I-Beam":
-                    try:
-                        sheet_lookup.range('E74').value = depth
-                        sheet_lookup.range('E75').value = top_flange_breadth
-                        sheet_lookup.range('E76').value = bottom_flange_breadth
-                        sheet_lookup.range('E77').value = top_flange_thickness
-                        sheet_lookup.range('E78').value = bottom_flange_thickness
-                        sheet_lookup.range('E79').value = web_thickness
-                        sheet_lookup.range('C81').value = Similarity_Selection
-                        sheet_lookup.range('C82').value = Yield_Strength_Selection
-                        # Save other properties to the Excel sheet
-                        wb.save()
-                        fig = draw_static_assyym_ibeam_with_labels(depth, top_flange_breadth, bottom_flange_breadth, top_flange_thickness, bottom_flange_thickness, web_thickness)
-                        st.pyplot(fig)
-                    except Exception as e:
-                        st.error(f"Failed to save data to Excel: {e}")
-                    
-                    with right2_col:
-                        a, b, c = st.columns([1, 1, 1])
-                        with a:
-                            st.write(f"Alt. Std. 1: {sheet_lookup.range('L74').value}")
-                        with b:
-                            st.write(f"Alt. Std. 2: {sheet_lookup.range('L75').value}")
-                        with c:
-                            st.write(f"Alt. Std. 3: {sheet_lookup.range('L76').value}")
-                        
-                        df = pd.read_excel(excel_file, sheet_name="Beam_Check", usecols='B:L', header=82, nrows=23)
-                        df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
-                        # st.dataframe(df, height = 740, use_container_width=True)
-                        # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
-                        df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
-                        # Display the DataFrame with `st.table()`
-                        st.table(df)
-
-                elif beam_type_selection == "Boxed Up I-Beam":
-                    try:
-                        sheet_lookup.range('E110').value = depth
-                        sheet_lookup.range('E111').value = flange_breadth
-                        sheet_lookup.range('E112').value = flange_thickness
-                        sheet_lookup.range('E113').value = center_web_thickness
-                        sheet_lookup.range('E114').value = outer_web_thickness
-                        sheet_lookup.range('C116').value = Similarity_Selection
-                        # Save other properties to the Excel sheet
-                        wb.save()
-                        fig = draw_static_boxedup_ibeam_with_labels(depth, flange_breadth, flange_thickness, center_web_thickness, outer_web_thickness)
-                        st.pyplot(fig)
-                    except Exception as e:
-                        st.error(f"Failed to save data to Excel: {e}")
-                    
-                    with right2_col:
-                        a, b, c = st.columns([1, 1, 1])
-                        with a:
-                            st.write(f"Alt. Std. 1: {sheet_lookup.range('L110').value}")
-                        with b:
-                            st.write(f"Alt. Std. 2: {sheet_lookup.range('L111').value}")
-                        with c:
-                            st.write(f"Alt. Std. 3: {sheet_lookup.range('L112').value}")
-                        
-                        df = pd.read_excel(excel_file, sheet_name="Beam_Check", usecols='B:L', header=117, nrows=22)
-                        df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
-                        # st.dataframe(df, height = 740, use_container_width=True)
-                        # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
-                        df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
-                        # Display the DataFrame with `st.table()`
-                        st.table(df)
-
-                elif beam_type_selection == "Rectangular Tube":
-                    try:
-                        sheet_lookup.range('E144').value = depth
-                        sheet_lookup.range('E145').value = breadth
-                        sheet_lookup.range('E146').value = thickness
-                        sheet_lookup.range('C148').value = Similarity_Selection
-                        # Save other properties to the Excel sheet
-                        wb.save()
-                        fig = draw_static_rect_tube_with_labels(depth, breadth, thickness)
-                        st.pyplot(fig)
-                    except Exception as e:
-                        st.error(f"Failed to save data to Excel: {e}")
-                    
-                    with right2_col:
-                        a, b, c = st.columns([1, 1, 1])
-                        with a:
-                            st.write(f"Alt. Std. 1: {sheet_lookup.range('L144').value}")
-                        with b:
-                            st.write(f"Alt. Std. 2: {sheet_lookup.range('L145').value}")
-                        with c:
-                            st.write(f"Alt. Std. 3: {sheet_lookup.range('L146').value}")
-                        
-                        df = pd.read_excel(excel_file, sheet_name="Beam_Check", usecols='B:L', header=149, nrows=22)
-                        df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
-                        # st.dataframe(df, height = 740, use_container_width=True)
-                        # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
-                        df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
-                        # Display the DataFrame with `st.table()`
-                        st.table(df)
-
-                elif beam_type_selection == "Circular Tube":
-                    try:
-                        sheet_lookup.range('E175').value = diameter
-                        sheet_lookup.range('E176').value = thickness
-                        sheet_lookup.range('C178').value = Similarity_Selection
-                        # Save other properties to the Excel sheet
-                        wb.save()
-                        fig = draw_static_circ_tube_with_labels(diameter, thickness)
-                        st.pyplot(fig)
-                    except Exception as e:
-                        st.error(f"Failed to save data to Excel: {e}")
+                try:
+                    sheet_lookup.range('E175').value = diameter
+                    sheet_lookup.range('E176').value = thickness
+                    sheet_lookup.range('C178').value = Similarity_Selection
+                    # Save other properties to the Excel sheet
+                    wb.save()
+                    fig = draw_static_circ_tube_with_labels(diameter, thickness)
+                    st.pyplot(fig)
+                except Exception as e:
+                    st.error(f"Failed to save data to Excel: {e}")
+                
+                with right2_col:
+                    a, b, c = st.columns([1, 1, 1])
+                    with a:
+                        st.write(f"Alt. Std. 1: {sheet_lookup.range('L175').value}")
+                    with b:
+                        st.write(f"Alt. Std. 2: {sheet_lookup.range('L176').value}")
+                    with c:
+                        st.write(f"Alt. Std. 3: {sheet_lookup.range('L177').value}")
                     
+                    df = read_check_table(wb, excel_file, 'B:L', 179, 23)
+                    df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
+                    # st.dataframe(df, height = 740, use_container_width=True)
+                    # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
+                    df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
+                    # Display the DataFrame with `st.table()`
+                    st.table(df)
+
+            elif beam_type_selection == "Built-up Plates":
+                # No workbook template for this shape: the properties come from section_engine
+                if plates.empty:
+                    st.error("Enter at least one plate.")
+                else:
+                    section = se.Section.from_plates(units.to_si(plates.to_numpy(dtype=float), "mm"),
+                                                     [se.rectangle(*row) for row in units.to_si(cutouts.to_numpy(dtype=float), "mm")])
+                    st.pyplot(draw_plate_section(section))
                     with right2_col:
-                        a, b, c = st.columns([1, 1, 1])
-                        with a:
-                            st.write(f"Alt. Std. 1: {sheet_lookup.range('L175').value}")
-                        with b:
-                            st.write(f"Alt. Std. 2: {sheet_lookup.range('L176').value}")
-                        with c:
-                            st.write(f"Alt. Std. 3: {sheet_lookup.range('L177').value}")
-                        
-                        df = pd.read_excel(excel_file, sheet_name="Beam_Check", usecols='B:L', header=179, nrows=23)
-                        df.columns = ["Variable", "Symbol", "=", "Chosen", "1", "Alt. Std. 1", "2", "Alt. Std. 2", "3","Alt. Std. 3", "4"]
-                        # st.dataframe(df, height = 740, use_container_width=True)
-                        # Apply formatting to keep original decimal points but limit to 2 decimal places if necessary
-                        df = df.map(lambda x: f"{x:.2f}" if isinstance(x, (float, int)) and ('.' in str(x) and len(str(x).split('.')[1]) > 2) else x)
-                        # Display the DataFrame with `st.table()`
-                        st.table(df)
+                        st.table(plate_section_table(se.properties(section), pls.section_plastic_moduli(section)))
 
-                    
-    
-        with left3_col:
-            # st.subheader("BEAM CONDITION INITIALIZATION")
-            st.markdown('<h1 style="font-size: 24px;">Beam Initialisation</h1>', unsafe_allow_html=True)
+            if beam_type_selection in pls.SHAPES:
+                with right2_col:
+                    st.markdown("**Section class and design modulus (EN 1993-1-1 / 1993-1-5)**")
+                    st.table(section_class_table(pls.custom_section(beam_type_selection, units.to_si(np.array(shape_dims, dtype=float), "mm"),
+                                                                    units.to_si(Yield_Strength_Selection, "MPa"))))
+
+# Beam Analyzer tab; the section and yield strength come from the Section Library tab's widgets
+@st.fragment
+@prof.profiled("beam_analyzer")
+def beam_analyzer_tab(excel_file, wb, sheet_db, sheet_lookup):
+    Beam_Selection = st.session_state["beam_selection"]
+    library_fy = units.to_si(st.session_state["library_yield_strength"], "MPa")
+    beam_type_selection = st.session_state["custom_beam_type"]
+    left3_col, right3_col = st.columns([1, 3])
+
+    with left3_col:
+        # st.subheader("BEAM CONDITION INITIALIZATION")
+        st.markdown('<h1 style="font-size: 24px;">Beam Initialisation</h1>', unsafe_allow_html=True)
+        beam_layout = st.radio("Beam Layout", options=["Single Span", "Continuous"], index=0, horizontal=True)
+        # Section chosen in the Section Library tab
+        section_library = load_section_library(excel_file, sheet_db)
+        section_table = shl.attach(section_library)
+        project_db = os.environ.get("BEAM_PROJECT_DB", "beam_project.sqlite")
+        revision_job = library_revision_job(excel_file, section_table, project_db)
+        if revision_job.status == "running":
+            st.caption("Checking stored analyses against the section library in the background...")
+        elif revision_job.status == "failed":
+            st.warning(f"Section library revision check failed: {revision_job.future.exception()}")
+        else:
+            revision = revision_job.result()
+            if revision["changed"] or revision["removed"]:
+                st.info(f"Section library revised: {len(revision['changed'])} sections changed, {len(revision['removed'])} removed; "
+                        f"{len(revision['updated'])} stored analyses re-run, {len(revision['orphaned'])} use removed sections.")
+        section = section_table.section(Beam_Selection)
+        include_self_weight = st.checkbox(f"Include self-weight of {Beam_Selection} ({units.show(sl.self_weight_udl(section['mass']), 'udl', 3)})", value=True)
+        self_weight = sl.self_weight_udl(section["mass"]) if include_self_weight else 0.0
+        design_code = st.selectbox("Design Code:", cc.CODES, index=0)
+        # Widget values are converted to SI once here; everything below works in N, m and Pa
+        if beam_layout == "Single Span":
             span = st.number_input("Beam Span (in meters):", min_value=1.0, value=5.0)  # Default value 5 meters
-            load_magnitude = st.number_input("Load Magnitude (in kN):", min_value=1.0, value=5.0)  # Default value 5 kN
-            load_location = st.number_input("Load distance from left support (in meters):", min_value=1.0, value=2.5)  # Default value 2.5m
-            # Left beam support
-            left_support_type = st.radio(
-            "Left End Support",
-            options=["Pinned", "Fixed"],
-            index=0,  # Default selection, you can change if you prefer
-            horizontal=True)
-            # Right beam support
-            right_support_type = st.radio(
-            "Right End Support",
-            options=["Pinned", "Fixed"],
-            index=0,  # Default selection, you can change if you prefer
-            horizontal=True)
-            
-            generate_button = st.button("Generate Diagrams", key="generate_button_tab3")
+            load_magnitude = units.to_si(st.number_input("Load Magnitude (in kN):", min_value=1.0, value=5.0), "kN")  # Default value 5 kN
+            # Negative or beyond the span puts the load on an overhang past a pinned support
+            load_location = st.number_input("Load distance from left support (in meters):", value=2.5, key="load_location")  # Default value 2.5m
+            a, b = st.columns([1, 1])
+            with a:
+                project = st.text_input("Project:", value="Default")
+            with b:
+                member_id = st.text_input("Member ID:", value="B1")
+        else:
+            span_text = st.text_input("Span lengths (in meters, comma separated):", value="5, 5, 5")
+            udl = units.to_si(st.number_input("Uniform load on every span (in kN/m):", min_value=0.0, value=0.0), "kN/m")
+            continuous_loads = st.data_editor(
+                pd.DataFrame({"Distance from left end (m)": [2.5, 7.5], "Load (kN)": [5.0, 5.0]}),
+                num_rows="dynamic", key="continuous_loads").dropna()
+            continuous_loads = np.column_stack((units.to_si(continuous_loads.iloc[:, 0], "m"),
+                                                units.to_si(continuous_loads.iloc[:, 1], "kN")))
+        # Left beam support
+        left_support_type = st.radio(
+        "Left End Support",
+        options=list(sfd.SUPPORT_TYPES),
+        index=0,  # Default selection, you can change if you prefer
+        horizontal=True)
+        # Right beam support
+        right_support_type = st.radio(
+        "Right End Support",
+        options=list(sfd.SUPPORT_TYPES),
+        index=0,  # Default selection, you can change if you prefer
+        horizontal=True)
+        # Inputs of this rerun, kept with the profile when profiling is on (see profiling.py)
+        prof.record(section_name=Beam_Selection, section=section, fy=library_fy, design_code=design_code,
+                    left_support_type=left_support_type, right_support_type=right_support_type)
+        if beam_layout == "Single Span":
+            prof.record(case="single_span", span=span, load_location=load_location, load_magnitude=load_magnitude,
+                        udl=self_weight)
+        
+        generate_button = st.button("Generate Diagrams", key="generate_button_tab3")
+        # SFD/BMD evaluated in the browser; releasing a dragged load moves the load input above
+        live_diagram = beam_layout == "Single Span" and st.toggle("Interactive diagram (drag the load)", key="live_diagram_on")
+        check_library_button = beam_layout == "Single Span" and st.button("Check All Library Sections", key="check_library_tab3")
+        monte_carlo_button = sweep_button = open_button = export_button = False
+        if beam_layout == "Single Span":
+            with st.expander("Monte Carlo (load and fabrication tolerances)"):
+                mc_sections = [Beam_Selection] + (["Custom Symmetric I-Beam"] if beam_type_selection == "Symmetric I-Beam" else [])
+                mc_section = st.selectbox("Section:", mc_sections, index=0, key="mc_section")
+                mc_samples = st.number_input("Samples:", min_value=1000, max_value=10_000_000, value=1_000_000, step=100_000)
+                mc_load_cov = st.number_input("Load coefficient of variation (%):", min_value=0.0, value=10.0) / 100
+                mc_location_sd = st.number_input("Load location std. dev. (m):", min_value=0.0, value=0.1)
+                mc_tf_sd = units.to_si(st.number_input("Tf std. dev. (mm):", min_value=0.0, value=0.5), "mm")
+                mc_tw_sd = units.to_si(st.number_input("Tw std. dev. (mm):", min_value=0.0, value=0.3), "mm")
+                monte_carlo_button = st.button("Run Monte Carlo", key="monte_carlo_tab3")
+            with st.expander("Span × Load Location Sweep"):
+                sweep_span_range = st.slider("Span range (m):", min_value=1.0, max_value=50.0, value=(1.0, 20.0))
+                sweep_points = st.number_input("Grid points per axis:", min_value=10, max_value=1000, value=500, step=50)
+                sweep_button = st.button("Run Sweep", key="sweep_tab3")
+            with st.expander("Project History"):
+                store = open_project_store(project_db)
+                history_threshold = st.number_input("Show members with utilization above:", min_value=0.0, value=0.0, step=0.1)
+                stored = store.latest(project)
+                if history_threshold > 0:
+                    stored = stored[stored["utilization"] > history_threshold]
+                st.dataframe(stored[["member_id", "section", "span", "utilization", "governing_check"]].round(3), hide_index=True)
+                open_member = st.selectbox("Stored member:", stored["member_id"].tolist(), index=None, key="open_member")
+                open_button = st.button("Open Stored Analysis", key="open_member_tab3", disabled=open_member is None)
+                export_format = st.radio("Report format:", ["HTML", "PDF"], horizontal=True, key="export_format")
+                export_button = st.button("Export Report of Listed Members", key="export_report_tab3", disabled=stored.empty)
 
     # Add some space between the top and bottom section
     st.markdown("<hr>", unsafe_allow_html=True)
  
-    if generate_button:
+    if generate_button and beam_layout == "Continuous":
+        try:
+            spans = [float(value) for value in span_text.replace(";", ",").split(",") if value.strip()]
+            prof.record(case="continuous", spans=spans, loads=continuous_loads, udl=udl + self_weight)
+            result = cb.solve_continuous(spans, continuous_loads, udl + self_weight,
+                                         left_support_type, right_support_type, I=section["Ix"])
+        except ValueError as e:
+            st.error(f"Invalid continuous beam input: {e}")
+        else:
+            with right3_col:
+                st.markdown('<h1 style="font-size: 24px;">Beam Diagram with Supports and Load</h1>', unsafe_allow_html=True)
+                ct.plotly_chart(sfd.continuous_beam_figure(result["supports"], left_support_type, right_support_type,
+                                                           continuous_loads, result["reactions"]))
+                st.markdown('<h1 style="font-size: 24px;">Reactions and Moments Summary:</h1>', unsafe_allow_html=True)
+                st.dataframe(pd.DataFrame({"Location (m)": result["supports"],
+                                           units.label("Reaction Force", "force"): units.from_si(result["reactions"], units.DISPLAY["force"]),
+                                           units.label("Moment", "moment"): units.from_si(result["support_moments"], units.DISPLAY["moment"])}).round(2),
+                             hide_index=True)
+            with st.container():
+                left_sfd, right_bmd = st.columns([1,1])
+                with left_sfd:
+                    sfd.plot_sfd(result["x"], result["V"])
+                with right_bmd:
+                    sfd.plot_bmd(result["x"], result["M"])
+            # Each span is checked on its own stations, length and moment gradient
+            rows = [cc.code_check(*(result[key].reshape(len(spans), -1)[i] for key in ("x", "V", "M", "delta")),
+                                  section, library_fy, design_code) for i in range(len(spans))]
+            show_code_check(max(rows, key=lambda row: row["governing"]), design_code)
+
+    elif generate_button:
+        # The pipeline lives in the session so only stages downstream of changed inputs rerun
+        if "beam_pipeline" not in st.session_state:
+            st.session_state["beam_pipeline"] = BeamPipeline()
+        pipeline = st.session_state["beam_pipeline"]
+        try:
+            results = pipeline.update(span=span, load_location=load_location, load_magnitude=load_magnitude,
+                                      left_support_type=left_support_type, right_support_type=right_support_type,
+                                      udl=self_weight)
+        except ValueError as e:
+            # Unstable support patterns (e.g. Free-Free) or an overhang next to a fixed end
+            st.session_state.pop("beam_pipeline")
+            st.error(f"Invalid beam input: {e}")
+            return
+        RA, RB, MA, MB = results["reactions"]
         with right3_col:
-            # Draw the beam with supports (from your previous function)
+            # Draw the beam with supports
             st.markdown('<h1 style="font-size: 24px;">Beam Diagram with Supports and Load</h1>', unsafe_allow_html=True)
-            RA, RB, MA, MB = sfd.calculate_supports(span, load_location, load_magnitude, left_support_type, right_support_type)
-            draw_beam_with_supports_plotly(span, left_support_type, right_support_type, load_location, load_magnitude, RA, RB, -MA, MB)
+            ct.plotly_chart(pipeline.figures["beam"])
             a, b = st.columns([2, 1])
             with a:
                 st.markdown('<h1 style="font-size: 24px;">Reactions and Moments Summary:</h1>', unsafe_allow_html=True)
                 sfd.display_summary_table(RA, RB, MA, MB)
-        with t3.container():  
+            with b:
+                _, delta = sfd.slope_deflection(results["x"], results["M"], left_support_type, I=section["Ix"],
+                                                right_support_type=right_support_type, supports=(0, span))
+                check = cc.code_check(results["x"], results["V"], results["M"], delta, section, library_fy, design_code,
+                                      Lb=span, Cb=cc.cantilever_cb(left_support_type, right_support_type), span=span)
+                show_code_check(check, design_code)
+        # Stored once per distinct beam; reopening the member later reads these rows back
+        record = dict(member_id=member_id, section=Beam_Selection, span=span, load_location=load_location,
+                      load_magnitude=load_magnitude, udl=self_weight, left_support_type=left_support_type,
+                      right_support_type=right_support_type, design_code=design_code, fy=library_fy,
+                      max_shear=float(np.max(np.abs(results["V"]))), max_moment=float(np.max(np.abs(results["M"]))),
+                      max_deflection=float(np.max(np.abs(delta))), utilization=float(check["governing"]),
+                      governing_check=str(check["governing_check"]))
+        previous = store.history(project, member_id)
+        if previous.empty or pst.input_key(previous.iloc[0]) != pst.input_key(record):
+            store.save(project, record, (results["x"], results["V"], results["M"], delta))
+        with st.container():  
             left_sfd, right_bmd = st.columns([1,1])
             with left_sfd:
-                # Calculate SFD
-                x, V = sfd.shear_force_diagram(span, load_location, load_magnitude, RA, RB)
                 # Plot SFD
-                sfd.plot_sfd(x, V)
+                ct.plotly_chart(pipeline.figures["sfd"])
             with right_bmd:
-                # # # Choose the correct BMD function based on support configuration
-                if left_support_type == 'Fixed' or right_support_type == 'Fixed':
-                    x_bmd, M = sfd.bending_moment_fixed_fixed(span, load_location, load_magnitude, RA, MA, RB, MB)
-                else:
-                    x_bmd, M = sfd.bending_moment_diagram(span, load_location, load_magnitude, RA)
                 # Plot BMD
-                sfd.plot_bmd(x_bmd, M)
-                
+                ct.plotly_chart(pipeline.figures["bmd"])
+
+
+    if live_diagram:
+        with right3_col:
+            st.markdown('<h1 style="font-size: 24px;">Interactive Diagram</h1>', unsafe_allow_html=True)
+            try:
+                lvd.live_diagram(span, load_location, load_magnitude, left_support_type, right_support_type, udl=self_weight,
+                                 key="live_diagram", on_change=move_load_from_diagram)
+            except ValueError as e:
+                st.error(f"Invalid beam input: {e}")
+
+    if open_button:
+        with st.container():
+            show_stored_analysis(store, store.history(project, open_member).iloc[0])
+
+    # Library screening and Monte Carlo run as background jobs so the page stays responsive;
+    # a job is cancelled as soon as the inputs it was started with change
+    runner = st.session_state.setdefault("job_runner", jr.JobRunner(job_executor()))
+    if beam_layout == "Single Span":
+        library_args = (span, load_location, load_magnitude, left_support_type, right_support_type, library_fy, design_code)
+        if mc_section == "Custom Symmetric I-Beam":
+            dims = tuple(units.to_si([st.session_state[key] for key in ("custom_height", "custom_width", "custom_tf", "custom_tw")], "mm"))
+            mc_library = {}
+        else:
+            # The workers look the plates up in the mapped library
+            dims = (None,) * 4
+            mc_library = dict(section=Beam_Selection, library=section_library)
+        mc_args = library_args[:5] + dims + (library_fy,)
+        mc_kwargs = dict(load_cov=mc_load_cov, location_sd=mc_location_sd, tf_sd=mc_tf_sd, tw_sd=mc_tw_sd,
+                         samples=int(mc_samples), **mc_library)
+        runner.sync("library_check", (Beam_Selection,) + library_args)
+        runner.sync("monte_carlo", mc_args + tuple(mc_kwargs.values()))
+        if check_library_button:
+            runner.submit("library_check", (Beam_Selection,) + library_args, library_check_job, section_table, *library_args)
+        if export_button:
+            members = report_members(stored)
+            runner.submit("report_export", (project, export_format, len(members)), report_export_job, members,
+                          export_format.lower(), f"{project}-report", section_library)
+        if monte_carlo_button:
+            runner.submit("monte_carlo", mc_args + tuple(mc_kwargs.values()), monte_carlo_job, *mc_args, **mc_kwargs)
+    else:
+        runner.discard("library_check")
+        runner.discard("monte_carlo")
+    if runner.jobs:
+        with st.container():
+            show_jobs(runner)
+
+    # The last sweep stays on the page so its cells can be drilled into across reruns
+    if sweep_button:
+        inputs = (tuple(sweep_span_range), int(sweep_points), load_magnitude, left_support_type, right_support_type, section["Ix"])
+        try:
+            st.session_state["span_sweep"] = (inputs, run_span_sweep(*inputs))
+        except ValueError as e:
+            st.error(f"Invalid sweep input: {e}")
+    if beam_layout == "Single Span" and "span_sweep" in st.session_state:
+        with st.container():
+            show_span_sweep(*st.session_state["span_sweep"])
+
+# The interactive diagram returns the load position where a drag ended
+def move_load_from_diagram():
+    if st.session_state.get("live_diagram") is not None:
+        st.session_state["load_location"] = float(st.session_state["live_diagram"])
+
+# Code-check utilizations of the section chosen in the Section Library tab
+def show_code_check(check, design_code):
+    st.markdown(f'<h1 style="font-size: 24px;">{design_code} Utilization:</h1>', unsafe_allow_html=True)
+    st.table({
+        "Check": [name.capitalize() for name in cc.CHECKS] + [f"Governing ({check['governing_check']})"],
+        "Ratio": [f"{float(check['max'][name]):.3f}" for name in cc.CHECKS] + [f"{float(check['governing']):.3f}"],
+        "At (m)": [f"{float(check['location'][name]):.2f}" for name in cc.CHECKS] + [f"{float(check['governing_x']):.2f}"],
+    })
+
+# Percentiles and histograms of a Monte Carlo sweep, in display units
+def show_monte_carlo(sweep):
+    quantities = {"max_moment": units.label("Max Moment", "moment"), "max_deflection": units.label("Max Deflection", "deflection"),
+                  "bending_ratio": "Bending Ratio", "deflection_ratio": "Deflection Ratio"}
+    scale = {"max_moment": units.factor(units.DISPLAY["moment"]), "max_deflection": units.factor(units.DISPLAY["deflection"])}
+    st.markdown(f'<h1 style="font-size: 24px;">Monte Carlo ({sweep["samples"]:,} samples)</h1>', unsafe_allow_html=True)
+    st.table({
+        "Quantity": list(quantities.values()),
+        **{f"P{p}": [f"{sweep['percentiles'][name][p] / scale.get(name, 1.0):.3f}" for name in quantities] for p in mc.PERCENTILES},
+    })
+    st.write(f"P(bending ratio > 1) = {sweep['exceedance']['bending']:.2e},  "
+             f"P(deflection ratio > 1) = {sweep['exceedance']['deflection']:.2e}")
+    columns = st.columns(len(quantities))
+    for column, (name, title) in zip(columns, quantities.items()):
+        counts, edges = sweep["histograms"][name]
+        fig = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2 / scale.get(name, 1.0), y=counts, marker_color="steelblue"))
+        fig.update_layout(title=title, height=300, margin=dict(l=10, r=10, t=40, b=10), bargap=0)
+        ct.plotly_chart(fig, column)
+
+# Every section at once, each with its own self-weight; the chunks checked so far are the partial result
+def library_check_job(job, table, *args):
+    frames = []
+    def progress(done, total, frame):
+        frames.append(frame)
+        job.report(done / total, f"{done} / {total} sections", partial=pd.concat(frames, ignore_index=True))
+    return sl.check_all_sections(table, *args, progress=progress)
+
+def monte_carlo_job(job, *args, **kwargs):
+    return mc.run_monte_carlo(*args, progress=lambda done, total: job.report(done / total, f"{done:,} / {total:,} samples"),
+                              **kwargs)
+
+# Calculation report of stored members (HTML file or zip of PDFs), rendered off the page thread
+def report_export_job(job, members, fmt, name, library):
+    job.report(0.0, f"rendering {len(members)} members")
+    return rpt.export_reports(members, fmt, library=library), fmt, name
+
+# Stored project rows (SI) as report members (rpt.MEMBER_UNITS)
+def report_members(stored):
+    return [dict(member_id=row["member_id"], section_name=row["section"], span=row["span"], load_location=row["load_location"],
+                 load_magnitude=units.from_si(row["load_magnitude"], "kN"), udl=units.from_si(row["udl"], "kN/m"),
+                 left_support_type=row["left_support_type"], right_support_type=row["right_support_type"],
+                 section={"Section": row["section"], "Design code": row["design_code"],
+                          "Utilization": f"{row['utilization']:.3f} ({row['governing_check']})"})
+            for row in stored.to_dict("records")]
+
+def show_report_export(export):
+    data, fmt, name = export
+    file_name = f"{name}.{'html' if fmt == 'html' else 'zip'}"
+    st.download_button(f"Download {file_name}", data, file_name=file_name,
+                       mime="text/html" if fmt == "html" else "application/zip", key="download_report")
+
+def show_library_check(checks):
+    checks = checks[checks["Utilization"] <= 1.0].sort_values(units.label("Self-weight", "udl"))
+    st.markdown('<h1 style="font-size: 24px;">Passing Sections (lightest first)</h1>', unsafe_allow_html=True)
+    st.dataframe(checks.round(4), hide_index=True)
+
+# Job name -> (title, view of a finished or partial result)
+JOB_VIEWS = {
+    "library_check": ("Library Screening", show_library_check),
+    "monte_carlo": ("Monte Carlo", show_monte_carlo),
+    "report_export": ("Report Export", show_report_export),
+}
+
+# Progress and partial results of the running jobs, polled without rerunning the rest of the page
+@st.fragment(run_every=0.5)
+def show_running_jobs(runner):
+    if not runner.running:
+        st.rerun()  # the full run renders the finished results
+    for name, job in list(runner.jobs.items()):
+        if job.status != "running":
+            continue
+        title, view = JOB_VIEWS[name]
+        a, b = st.columns([6, 1])
+        with a:
+            st.progress(job.progress, text=f"{title}: {job.message} ({job.elapsed:.1f} s)")
+        with b:
+            if st.button("Cancel", key=f"cancel_{name}"):
+                runner.discard(name)
+        if job.partial is not None:
+            view(job.partial)
+
+def show_jobs(runner):
+    if runner.running:
+        show_running_jobs(runner)
+    for name, job in list(runner.jobs.items()):
+        title, view = JOB_VIEWS[name]
+        if job.status == "failed":
+            st.error(f"{title} failed: {job.future.exception()}")
+        elif job.status == "done":
+            view(job.result())
+
+# A stored member read back from the project database, without recomputing it
+def show_stored_analysis(store, row):
+    st.markdown(f'<h1 style="font-size: 24px;">{row["member_id"]} ({row["section"]}, {row["left_support_type"]} - '
+                f'{row["right_support_type"]}, span {row["span"]:.2f} m)</h1>', unsafe_allow_html=True)
+    st.table({
+        "Quantity": [units.label("Load", "force"), units.label("Load Location", "length"), units.label("Max Shear", "force"),
+                     units.label("Max Moment", "moment"), units.label("Max Deflection", "deflection"), "Utilization"],
+        "Value": [f"{units.from_si(row[key], units.DISPLAY[kind]):.2f}" for key, kind in
+                  (("load_magnitude", "force"), ("load_location", "length"), ("max_shear", "force"),
+                   ("max_moment", "moment"), ("max_deflection", "deflection"))]
+                 + [f"{row['utilization']:.3f} ({row['governing_check']}, {row['design_code']})"],
+    })
+    diagrams = store.diagrams(row["id"])
+    if diagrams is not None:
+        x, V, M, _ = diagrams
+        left_sfd, right_bmd = st.columns([1, 1])
+        with left_sfd:
+            ct.plotly_chart(sfd.shear_force_figure(x, V))
+        with right_bmd:
+            ct.plotly_chart(sfd.bending_moment_figure(x, M))
+
+# Heatmap of a span x load-location sweep plus the diagrams of one chosen cell
+def show_span_sweep(inputs, sweep):
+    _, _, load_magnitude, left_support_type, right_support_type, I = inputs
+    st.markdown(f'<h1 style="font-size: 24px;">Span × Load Location Sweep ({left_support_type} - {right_support_type}, '
+                f'{units.show(load_magnitude, "force")})</h1>', unsafe_allow_html=True)
+    a, b, c, d = st.columns([2, 1, 1, 1])
+    with a:
+        quantity = st.radio("Quantity", options=list(ps.QUANTITIES), format_func=lambda q: ps.QUANTITIES[q][0],
+                            horizontal=True, key="sweep_quantity")
+    with b:
+        contour = st.checkbox("Contour", value=False, key="sweep_contour")
+    with c:
+        cell_span = st.number_input("Drill-down span (m):", min_value=float(sweep["spans"][0]),
+                                    max_value=float(sweep["spans"][-1]), value=float(sweep["spans"][len(sweep["spans"]) // 2]),
+                                    key="sweep_cell_span")
+    with d:
+        cell_location = st.number_input("Drill-down load location (m):", min_value=0.0, max_value=float(cell_span),
+                                        value=float(cell_span) / 2, key="sweep_cell_location")
+    i, j = ps.nearest_cell(sweep, cell_span, cell_location)
+    span, location = float(sweep["spans"][i]), float(sweep["load_locations"][j])
+    left, right = st.columns([1, 1])
+    with left:
+        ct.plotly_chart(ps.sweep_figure(sweep, quantity, contour, selected=(span, location)))
+    with right:
+        name, kind = ps.QUANTITIES[quantity]
+        st.write(f"Cell: span {span:.2f} m, load at {location:.2f} m, {name.lower()} {units.show(sweep[quantity][i, j], kind, 3)}")
+        x, V, M, _ = sfd.load_diagrams(span, [location], [load_magnitude], left_support_type, right_support_type)
+        ct.plotly_chart(sfd.shear_force_figure(x, V))
+        ct.plotly_chart(sfd.bending_moment_figure(x, M))
+
 if __name__ == "__main__":
-    main()
+    # Profiled only when BEAM_PROFILE=1 or the URL has ?profile=1
+    prof.run("main", main)
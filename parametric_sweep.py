@@ -0,0 +1,55 @@
+import numpy as np
+import plotly.graph_objects as go
+import sfd_slp as sfd
+import units
+import monte_carlo as mc
+
+# Span x load-location sweep for a single point load. The whole grid is one broadcast call
+# into the sfd_slp closed forms: spans run down the rows, load positions across the columns,
+# and cells with the load past the right support are NaN.
+#
+#   max moment      max(|MA|, |MB|, |RA a - MA|)
+#   max deflection  P L^3 / (E I) * f(a / L)   (peak influence-line deflection, see monte_carlo)
+#
+# Inputs and outputs are SI (N, m, Nm).
+
+QUANTITIES = {"max_moment": ("Max Moment", "moment"), "max_deflection": ("Max Deflection", "deflection")}
+
+
+def sweep_span_location(spans, load_locations, load_magnitude, left_support_type, right_support_type, E=sfd.E, I=sfd.I):
+    L = np.asarray(spans, dtype=float)[:, None]
+    a = np.asarray(load_locations, dtype=float)[None, :]
+    on_span = (a >= 0) & (a <= L)
+    a_on = np.where(on_span, a, 0.0)
+    RA, _, MA, MB = sfd.calculate_supports(L, a_on, load_magnitude, left_support_type, right_support_type)
+    moment = np.max(np.abs(np.stack(np.broadcast_arrays(MA, MB, RA * a_on - MA))), axis=0)
+    xi, coefficients = mc.deflection_coefficients(left_support_type, right_support_type)
+    deflection = abs(load_magnitude) * L**3 / (E * I) * np.interp(a_on / L, xi, coefficients)
+    return {
+        "spans": L[:, 0],
+        "load_locations": a[0],
+        "max_moment": np.where(on_span, moment, np.nan),
+        "max_deflection": np.where(on_span, deflection, np.nan),
+    }
+
+
+# Heatmap (or contour) of one swept quantity in display units
+def sweep_figure(sweep, quantity="max_moment", contour=False, selected=None):
+    name, kind = QUANTITIES[quantity]
+    z = units.from_si(sweep[quantity], units.DISPLAY[kind])
+    trace = go.Contour if contour else go.Heatmap
+    fig = go.Figure(trace(
+        x=sweep["load_locations"], y=sweep["spans"], z=z, colorscale="Viridis",
+        colorbar=dict(title=units.DISPLAY[kind]),
+        hovertemplate=f"Span: %{{y:.2f}} m<br>Load at: %{{x:.2f}} m<br>{name}: %{{z:.3f}} {units.DISPLAY[kind]}<extra></extra>"))
+    if selected is not None:
+        fig.add_trace(go.Scatter(x=[selected[1]], y=[selected[0]], mode="markers", showlegend=False,
+                                 marker=dict(symbol="x", size=12, color="red")))
+    fig.update_layout(title=units.label(name, kind), xaxis_title="Load distance from left support (m)",
+                      yaxis_title="Beam span (m)", height=500, margin=dict(l=10, r=10, t=40, b=10))
+    return fig
+
+
+# Grid cell nearest to a (span, load location) pair, as (row, column)
+def nearest_cell(sweep, span, load_location):
+    return int(np.abs(sweep["spans"] - span).argmin()), int(np.abs(sweep["load_locations"] - load_location).argmin())
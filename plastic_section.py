@@ -0,0 +1,287 @@
+import numpy as np
+
+# Plastic and effective section moduli for major-axis bending.
+# The plastic neutral axis is the equal-area axis, found by bisection for every section of a
+# batch at once. The area below a trial axis c is a Green's theorem sum over the section's
+# edges clipped to y < c (the closing segments along the axis contribute nothing to it), so a
+# bisection step is one pass over all edges of the batch with bincount. At the axis,
+#   Zpl = 2 B(c) + Qx - c A,   B(c) = integral over y < c of (c - y) dA,
+# where B is the same clipped edge sum. Any Section from section_engine works (polygons,
+# holes, plates); the Custom Beam shapes are batched as plate arrays.
+#
+# Section class follows EN 1993-1-1 table 5.2 and class 4 effective sections EN 1993-1-5 4.4,
+# with epsilon = sqrt(235 MPa / fy). For the Custom Beam shapes under sagging moment the top
+# flange is the compression flange: its outstands and internal panels and the compressed part
+# of each web are reduced by rho, and the removed strips are subtracted as negative plates.
+# The web stress ratio is taken from the section with the effective flange and gross webs
+# (EN 1993-1-5 4.4(3)). Circular tubes are classified but not reduced (class 4 CHS need
+# EN 1993-1-6). Units are SI (m, Pa).
+
+FY_REF = 235e6
+DESIGN_MODULUS = ("Zpx", "Zpx", "Zx", "Zeffx")  # modulus used for class 1 to 4
+
+
+def epsilon(fy):
+    return np.sqrt(FY_REF / np.asarray(fy, dtype=float))
+
+
+# ---------------------------------------------------------------------------
+# Equal-area axis search
+# ---------------------------------------------------------------------------
+# Area and (c - y) moment of each edge's part below y = c, for material on the edge's left
+def _clip_below(c, x0, y0, x1, y1):
+    u0, u1 = c - y0, c - y1
+    in0, in1 = u0 > 0, u1 > 0
+    xc = x0 + u0 / np.where(u0 == u1, 1.0, u0 - u1) * (x1 - x0)
+    dx = np.where(in0 | in1, np.where(in1, x1, xc) - np.where(in0, x0, xc), 0.0)
+    ua, ub = np.maximum(u0, 0.0), np.maximum(u1, 0.0)
+    return dx * (ua + ub) / 2, dx * (ua * ua + ua * ub + ub * ub) / 6
+
+
+# Plastic modulus and axis height by bisection between lo and hi, where below(c) gives the
+# area and the (c - y) moment under the trial axes c
+def _equal_area_axis(below, lo, hi, iterations):
+    A, B_top = below(hi)
+    Qx = hi * A - B_top
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        low = below(mid)[0] < A / 2
+        lo, hi = np.where(low, mid, lo), np.where(low, hi, mid)
+    c = (lo + hi) / 2
+    return 2 * below(c)[1] + Qx - c * A, c
+
+
+# Plastic modulus and axis height of every Section from the edges of its rings; the edge
+# weight orients each ring and removes holes
+def _section_axis(sections, iterations, swap=False):
+    rings = [(vertices[:, ::-1] if swap else vertices, sign, i)
+             for i, section in enumerate(sections) for vertices, sign in section.rings]
+    n = len(sections)
+    counts = np.array([len(v) for v, _, _ in rings])
+    p0 = np.concatenate([v for v, _, _ in rings])
+    starts = np.cumsum(counts) - counts
+    following = np.arange(1, len(p0) + 1)
+    following[starts + counts - 1] = starts
+    p1 = p0[following]
+    ring_id = np.repeat(np.arange(len(rings)), counts)
+    area = np.bincount(ring_id, p0[:, 0] * p1[:, 1] - p1[:, 0] * p0[:, 1], len(rings))
+    weight = (np.array([sign for _, sign, _ in rings], dtype=float) * np.sign(area))[ring_id]
+    owner = np.array([i for _, _, i in rings])[ring_id]
+    x0, y0, x1, y1 = p0[:, 0], p0[:, 1], p1[:, 0], p1[:, 1]
+
+    def below(c):
+        area, moment = _clip_below(c[owner], x0, y0, x1, y1)
+        return np.bincount(owner, area * weight, n), np.bincount(owner, moment * weight, n)
+
+    lo, hi = np.full(n, np.inf), np.full(n, -np.inf)
+    np.minimum.at(lo, owner, y0)
+    np.maximum.at(hi, owner, y0)
+    return _equal_area_axis(below, lo, hi, iterations)
+
+
+# Plastic moduli about both centroidal directions of Sections (any polygons and holes)
+def plastic_moduli(sections, iterations=40):
+    sections = list(sections)
+    Zpx, ypna = _section_axis(sections, iterations)
+    Zpy, xpna = _section_axis(sections, iterations, swap=True)
+    return {"Zpx": Zpx, "Zpy": Zpy, "ypna": ypna, "xpna": xpna}
+
+
+# Major-axis plastic modulus and axis height of plate batches (..., P, 4) with signs (+1 plate,
+# -1 removed); a rectangle's part below c is a clipped height, so no edges are needed
+def plate_plastic_modulus(plates, signs=1.0, iterations=40):
+    plates = np.asarray(plates, dtype=float)
+    _, y0, w, h = np.moveaxis(plates, -1, 0)
+    weight = signs * w
+
+    def below(c):
+        u0 = np.maximum(c[..., None] - y0, 0.0)
+        u1 = np.maximum(c[..., None] - y0 - h, 0.0)
+        return (weight * (u0 - u1)).sum(-1), (weight * (u0 * u0 - u1 * u1)).sum(-1) / 2
+
+    return _equal_area_axis(below, y0.min(-1), (y0 + h).max(-1), iterations)
+
+
+def _elastic(plates, signs):
+    x0, y0, w, h = np.moveaxis(plates, -1, 0)
+    a = signs * w * h
+    A = a.sum(-1)
+    yc = (a * (y0 + h / 2)).sum(-1) / A
+    I = (signs * w * h**3 / 12 + a * (y0 + h / 2 - yc[..., None]) ** 2).sum(-1)
+    return A, yc, I
+
+
+# ---------------------------------------------------------------------------
+# Custom Beam shapes as plates plus the compression flange / web layout
+# ---------------------------------------------------------------------------
+# Plate rows of broadcastable dimensions -> (..., P, 4)
+def _stack(*rows):
+    values = np.broadcast_arrays(*(np.asarray(v, dtype=float) for row in rows for v in row))
+    return np.stack(values, axis=-1).reshape(values[0].shape + (len(rows), 4))
+
+
+def _webs(*webs):
+    x, t = zip(*webs)
+    values = np.broadcast_arrays(*x, *t)
+    return np.stack(values[:len(x)], -1), np.stack(values[len(x):], -1)
+
+
+# Layout: top flange (x, width, thickness), webs (x, t) sorted left to right, web bottom and top
+def _asymmetric_i(D, b_top, b_bottom, tf_top, tf_bottom, tw):
+    B = np.maximum(b_top, b_bottom)
+    plates = _stack(((B - b_bottom) / 2, 0, b_bottom, tf_bottom), ((B - tw) / 2, tf_bottom, tw, D - tf_top - tf_bottom),
+                    ((B - b_top) / 2, D - tf_top, b_top, tf_top))
+    return plates, ((B - b_top) / 2, b_top, tf_top), _webs(((B - tw) / 2, tw)), tf_bottom, D - tf_top
+
+
+def _symmetric_i(D, B, tf, tw):
+    return _asymmetric_i(D, B, B, tf, tf, tw)
+
+
+# Outer webs flush with the flange edges, centre web on the axis of symmetry
+def _boxed_i(D, B, tf, t_centre, t_outer):
+    plates = _stack((0, 0, B, tf), (0, tf, t_outer, D - 2 * tf), ((B - t_centre) / 2, tf, t_centre, D - 2 * tf),
+                    (B - t_outer, tf, t_outer, D - 2 * tf), (0, D - tf, B, tf))
+    return plates, (0, B, tf), _webs((0, t_outer), ((B - t_centre) / 2, t_centre), (B - t_outer, t_outer)), tf, D - tf
+
+
+def _rectangular_tube(D, B, t):
+    plates = _stack((0, 0, B, t), (0, t, t, D - 2 * t), (B - t, t, t, D - 2 * t), (0, D - t, B, t))
+    return plates, (0, B, t), _webs((0, t), (B - t, t)), t, D - t
+
+
+SHAPES = {
+    "Symmetric I-Beam": _symmetric_i,
+    "Assymmetric I-Beam": _asymmetric_i,
+    "Boxed Up I-Beam": _boxed_i,
+    "Rectangular Tube": _rectangular_tube,
+    "Circular Tube": None,
+}
+
+
+# ---------------------------------------------------------------------------
+# Classification and effective widths
+# ---------------------------------------------------------------------------
+def _element_class(ratio, limits):
+    return 1 + sum((ratio > limit).astype(int) for limit in limits)
+
+
+# EN 1993-1-5 table 4.1 (internal) reduction and buckling factor for stress ratio psi
+def _internal_rho(c, t, eps, psi):
+    k = np.where(psi >= 0, 8.2 / (1.05 + psi), np.where(psi > -1, 7.81 - 6.29 * psi + 9.78 * psi**2, 5.98 * (1 - psi) ** 2))
+    lam = (c / t) / (28.4 * eps * np.sqrt(k))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = (lam - 0.055 * (3 + psi)) / lam**2
+    return np.where(lam > 0.5 + np.sqrt(0.085 - 0.055 * psi), np.minimum(rho, 1.0), 1.0)
+
+
+# EN 1993-1-5 table 4.2 (outstand) under uniform compression, k = 0.43
+def _outstand_rho(c, t, eps):
+    lam = (c / t) / (28.4 * eps * np.sqrt(0.43))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = (lam - 0.188) / lam**2
+    return np.where(lam > 0.748, np.minimum(rho, 1.0), 1.0)
+
+
+# Flange elements between and beyond the webs: widths (..., W + 1), outstand flags and the
+# x of each element's edge nearest a web (left edge for the left outstand)
+def _flange_elements(flange, webs):
+    fx, fw, _ = flange
+    wx, wt = webs
+    left = wx[..., :1] - fx[..., None]
+    inner = wx[..., 1:] - (wx[..., :-1] + wt[..., :-1])
+    right = (fx + fw)[..., None] - (wx[..., -1:] + wt[..., -1:])
+    widths = np.concatenate((left, inner, right), -1)
+    outstand = np.zeros(widths.shape[-1], dtype=bool)
+    outstand[[0, -1]] = True
+    starts = np.concatenate((fx[..., None], wx[..., :-1] + wt[..., :-1], wx[..., -1:] + wt[..., -1:]), -1)
+    return np.maximum(widths, 0.0), outstand, starts
+
+
+# Section class, plastic, elastic and effective moduli of a plate shape for yield strength fy
+def _plate_shape(plates, flange, webs, yb, yt, fy, iterations):
+    shape = plates.shape[:-2]
+    flange = tuple(np.broadcast_to(v, shape) for v in flange)
+    webs = tuple(np.broadcast_to(v, shape + (v.shape[-1],)) for v in webs)
+    yb, yt = np.broadcast_to(yb, shape), np.broadcast_to(yt, shape)
+    eps = np.broadcast_to(epsilon(fy), shape)
+    fx, _, ft = flange
+    wx, wt = webs
+    hw = (yt - yb)[..., None]
+    top, bottom = (plates[..., 1] + plates[..., 3]).max(-1), plates[..., 1].min(-1)
+
+    A, yc, Ix = _elastic(plates, 1.0)
+    Zx = Ix / np.maximum(top - yc, yc - bottom)
+    Zpx, yp = plate_plastic_modulus(plates, iterations=iterations)
+
+    # Table 5.2: flange outstands and internal panels in compression, webs in bending
+    c, outstand, starts = _flange_elements(flange, webs)
+    flange_ratio = c / ft[..., None] / eps[..., None]
+    flange_class = np.where(outstand, _element_class(flange_ratio, (9, 10, 14)), _element_class(flange_ratio, (33, 38, 42)))
+    alpha = np.clip((yt - yp) / (yt - yb), 1e-9, 1.0)[..., None]
+    psi = np.minimum(-(yc - yb) / np.maximum(yt - yc, 1e-12), 1.0)[..., None]
+    with np.errstate(invalid="ignore"):
+        web_limits = (np.where(alpha > 0.5, 396 / (13 * alpha - 1), 36 / alpha),
+                      np.where(alpha > 0.5, 456 / (13 * alpha - 1), 41.5 / alpha),
+                      np.where(psi > -1, 42 / (0.67 + 0.33 * psi), 62 * (1 - psi) * np.sqrt(np.abs(psi))))
+    web_class = _element_class(hw / wt / eps[..., None], web_limits)
+    section_class = np.maximum(flange_class.max(-1), web_class.max(-1)).astype(int)
+
+    # Effective compression flange: outstands keep rho c next to the web, panels lose their middle
+    rho_f = np.where(outstand, _outstand_rho(c, ft[..., None], eps[..., None]), _internal_rho(c, ft[..., None], eps[..., None], 1.0))
+    lost = (1 - rho_f) * c
+    x_lost = np.where(outstand, starts, starts + rho_f * c / 2)
+    x_lost[..., -1] = starts[..., -1] + rho_f[..., -1] * c[..., -1]
+    flange_holes = np.stack(np.broadcast_arrays(x_lost, yt[..., None], lost, ft[..., None]), -1)
+    reduced = np.concatenate((plates, flange_holes), -2)
+    signs = np.concatenate((np.ones(plates.shape[-2]), -np.ones(c.shape[-1])))
+    _, yc_f, _ = _elastic(reduced, signs)
+
+    # Webs: compressed zone from the flange down to the axis (or the web bottom), rho for its psi
+    web_bottom = np.maximum(yc_f, yb)[..., None]
+    compressed = np.maximum(yt[..., None] - web_bottom, 0.0)
+    psi_w = np.clip(-(yc_f[..., None] - yb[..., None]) / np.maximum(yt[..., None] - yc_f[..., None], 1e-12), -3.0, 1.0)
+    rho_w = _internal_rho(hw, wt, eps[..., None], psi_w)
+    effective = np.where(psi_w >= 0, rho_w * hw, rho_w * hw / (1 - psi_w))
+    be1 = np.where(psi_w >= 0, 2 / (5 - psi_w), 0.4) * effective
+    hole = np.maximum(compressed - effective, 0.0)
+    web_holes = np.stack(np.broadcast_arrays(wx, yt[..., None] - be1 - hole, wt, hole), -1)
+    reduced = np.concatenate((reduced, web_holes), -2)
+    signs = np.concatenate((signs, -np.ones(wx.shape[-1])))
+    _, yc_eff, Ieff = _elastic(reduced, signs)
+    Zeffx = Ieff / np.maximum(top - yc_eff, yc_eff - bottom)
+
+    return {"A": A, "Ix": Ix, "Zx": Zx, "Zpx": Zpx, "ypna": yp - bottom, "Zeffx": np.where(section_class == 4, Zeffx, Zx),
+            "section_class": section_class, "epsilon": eps, "rho_flange": rho_f.min(-1), "rho_web": rho_w.min(-1)}
+
+
+# Circular hollow section: closed forms, class from D / t (table 5.2 sheet 3)
+def _circular_tube(D, t, fy):
+    D, t = np.broadcast_arrays(np.asarray(D, dtype=float), np.asarray(t, dtype=float))
+    d = D - 2 * t
+    eps = np.broadcast_to(epsilon(fy), D.shape)
+    Ix = np.pi * (D**4 - d**4) / 64
+    Zx = 2 * Ix / D
+    return {"A": np.pi * (D**2 - d**2) / 4, "Ix": Ix, "Zx": Zx, "Zpx": (D**3 - d**3) / 6, "ypna": D / 2, "Zeffx": Zx,
+            "section_class": _element_class(D / t / eps**2, (50, 70, 90)), "epsilon": eps,
+            "rho_flange": np.ones(D.shape), "rho_web": np.ones(D.shape)}
+
+
+# Properties of a Custom Beam shape for dimensions in the order of its tab 2 inputs (m; arrays
+# broadcast, e.g. a whole sweep of candidates at once) and fy (Pa). "Zdx" is the design modulus
+# for the section class: Zpx for class 1 and 2, Zx for class 3, Zeffx for class 4.
+def custom_section(shape, dims, fy, iterations=40):
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown beam type: {shape}")
+    if SHAPES[shape] is None:
+        out = _circular_tube(*dims, fy)
+    else:
+        plates, flange, webs, yb, yt = SHAPES[shape](*(np.asarray(d, dtype=float) for d in dims))
+        out = _plate_shape(plates, flange, webs, yb, yt, fy, iterations)
+    out["Zdx"] = np.choose(out["section_class"] - 1, [out[key] for key in DESIGN_MODULUS])
+    return out
+
+
+# Plastic moduli of one Section as plain floats
+def section_plastic_moduli(section, iterations=40):
+    return {key: float(value[0]) for key, value in plastic_moduli([section], iterations).items()}
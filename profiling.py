@@ -0,0 +1,204 @@
+import os
+import sys
+import json
+import time
+import pstats
+import cProfile
+import datetime
+import functools
+import threading
+import numpy as np
+import streamlit as st
+import sfd_slp as sfd
+import code_check as cc
+import continuous_beam as cb
+import chart_transport as ct
+import batch_stream as bs
+from beam_pipeline import BeamPipeline
+
+# Opt-in profiling of app reruns and batch calls, stored with the inputs that produced them.
+# Enabled by the environment variable BEAM_PROFILE=1 (every session) or the query parameter
+# ?profile=1 (one browser tab). A capture wraps main() and the tab fragments with cProfile and
+# writes two files to BEAM_PROFILE_DIR (default ./profiles):
+#   <stamp>-<name>.prof   pstats dump (snakeviz, python -m pstats, ...)
+#   <stamp>-<name>.json   the recorded inputs: case, span, loads, supports, section (SI)
+# The tabs call record() with their resolved inputs; it does nothing unless a capture is running.
+# Any recorded case can be run again offline under the profiler:
+#
+#   python profiling.py replay profiles/<stamp>-<name>.json [top]
+#   python profiling.py batch <jobs.csv> <summary.csv>
+#
+# Only one capture runs at a time per process: on Python 3.12+ cProfile sits on sys.monitoring,
+# which is process-wide, so a second Profile.enable() fails and a capture also records what
+# other threads (other sessions) run meanwhile. A rerun that starts while another session is
+# being captured runs unprofiled. A capture inside another one on the same thread (a fragment
+# within main) adds to the outer one.
+
+PROFILE_ENV = "BEAM_PROFILE"
+PROFILE_DIR = os.environ.get("BEAM_PROFILE_DIR", "profiles")
+TOP = 30  # rows of the printed pstats summary
+
+_local = threading.local()       # the capture running on this thread, if any
+_capture_lock = threading.Lock()  # held while any capture in the process is running
+
+
+class Capture:
+    __slots__ = ("name", "profile", "inputs", "started")
+
+    def __init__(self, name):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.inputs = {}
+        self.started = None
+
+
+def _json_value(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot store {type(value).__name__} in a profile")
+
+
+# Profiling switched on for this process or this browser tab
+def enabled():
+    if os.environ.get(PROFILE_ENV, "") not in ("", "0"):
+        return True
+    try:
+        return st.query_params.get("profile", "0") not in ("", "0")
+    except Exception:
+        return False  # outside a Streamlit session
+
+
+# Adds inputs to the running capture, if any
+def record(**inputs):
+    capture = getattr(_local, "capture", None)
+    if capture is not None:
+        capture.inputs.update(inputs)
+
+
+# Writes the profile and its inputs; returns the path of the .json file
+def save(capture, elapsed, directory=PROFILE_DIR):
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    stem = os.path.join(directory, f"{stamp}-{capture.name}")
+    capture.profile.dump_stats(stem + ".prof")
+    with open(stem + ".json", "w") as f:
+        json.dump({"name": capture.name, "created": stamp, "elapsed": elapsed, "profile": os.path.basename(stem) + ".prof",
+                   "inputs": capture.inputs}, f, indent=1, default=_json_value)
+    return stem + ".json"
+
+
+# Runs fn under cProfile when profiling is enabled (or forced); returns fn's result
+def run(name, fn, *args, force=False, **kwargs):
+    if getattr(_local, "capture", None) is not None or not (force or enabled()):
+        return fn(*args, **kwargs)
+    if not _capture_lock.acquire(blocking=False):
+        return fn(*args, **kwargs)  # another session is being captured
+    capture = Capture(name)
+    try:
+        capture.profile.enable()
+    except ValueError:
+        # Another profiling tool (a debugger, py-spy in-process, ...) holds the process
+        _capture_lock.release()
+        return fn(*args, **kwargs)
+    start = time.perf_counter()
+    try:
+        _local.capture = capture
+        return fn(*args, **kwargs)
+    finally:
+        capture.profile.disable()
+        _local.capture = None
+        _capture_lock.release()
+        path = save(capture, time.perf_counter() - start)
+        if not force:
+            st.caption(f"Profile of this run: {path}")
+
+
+# Decorator form of run(), e.g. under @st.fragment so fragment-only reruns are captured too
+def profiled(name):
+    def wrap(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            return run(name, fn, *args, **kwargs)
+        return wrapper
+    return wrap
+
+
+# ---------------------------------------------------------------------------
+# Offline replay of recorded cases (same solver, figure and code-check calls as the app)
+# ---------------------------------------------------------------------------
+def _replay_single_span(inputs):
+    pipeline = BeamPipeline()
+    results = pipeline.update(**{key: inputs[key] for key in ("span", "load_location", "load_magnitude", "left_support_type",
+                                                             "right_support_type", "udl")})
+    section, span = inputs["section"], inputs["span"]
+    _, delta = sfd.slope_deflection(results["x"], results["M"], inputs["left_support_type"], I=section["Ix"],
+                                    right_support_type=inputs["right_support_type"], supports=(0, span))
+    cc.code_check(results["x"], results["V"], results["M"], delta, section, inputs["fy"], inputs["design_code"],
+                  Lb=span, Cb=cc.cantilever_cb(inputs["left_support_type"], inputs["right_support_type"]), span=span)
+    for fig in pipeline.figures.values():
+        ct.compact_figure(fig).to_json()
+
+
+def _replay_continuous(inputs):
+    spans, section = inputs["spans"], inputs["section"]
+    result = cb.solve_continuous(spans, inputs["loads"], inputs["udl"], inputs["left_support_type"],
+                                 inputs["right_support_type"], I=section["Ix"])
+    for i in range(len(spans)):
+        cc.code_check(*(result[key].reshape(len(spans), -1)[i] for key in ("x", "V", "M", "delta")),
+                      section, inputs["fy"], inputs["design_code"])
+    for fig in (sfd.shear_force_figure(result["x"], result["V"]), sfd.bending_moment_figure(result["x"], result["M"])):
+        ct.compact_figure(fig).to_json()
+
+
+def _replay_batch(inputs):
+    for _ in bs.stream_results(inputs["jobs"], **inputs.get("options", {})):
+        pass
+
+
+REPLAYS = {"single_span": _replay_single_span, "continuous": _replay_continuous, "batch": _replay_batch}
+
+
+# Re-runs a recorded case under the profiler and saves the new capture next to the old one
+def replay(path, directory=None):
+    with open(path) as f:
+        inputs = json.load(f)["inputs"]
+    case = inputs.get("case")
+    if case not in REPLAYS:
+        raise ValueError(f"Profile has no replayable case (recorded: {sorted(inputs)})")
+    capture = Capture(f"replay-{case}")
+    capture.inputs = inputs
+    start = time.perf_counter()
+    with _capture_lock:
+        capture.profile.enable()
+        try:
+            REPLAYS[case](inputs)
+        finally:
+            capture.profile.disable()
+    elapsed = time.perf_counter() - start
+    return capture, elapsed, save(capture, elapsed, directory or os.path.dirname(os.path.abspath(path)))
+
+
+# Profiles a batch_stream run and records its jobs so it can be replayed
+def profile_batch(jobs, summary_path, **options):
+    jobs = list(jobs)
+    def batch():
+        record(case="batch", jobs=jobs, options=options)
+        return bs.write_summary(bs.stream_results(jobs, **options), summary_path)
+    return run("batch", batch, force=True)
+
+
+if __name__ == "__main__":
+    # python profiling.py replay <profile.json> [top]
+    # python profiling.py batch <jobs.csv> <summary.csv>
+    if len(sys.argv) >= 3 and sys.argv[1] == "replay":
+        capture, elapsed, saved = replay(sys.argv[2])
+        print(f"Replayed {capture.inputs['case']} in {elapsed * 1e3:.1f} ms; profile saved to {saved}")
+        pstats.Stats(capture.profile).sort_stats("cumulative").print_stats(int(sys.argv[3]) if len(sys.argv) > 3 else TOP)
+    elif len(sys.argv) == 4 and sys.argv[1] == "batch":
+        n = profile_batch(bs.read_jobs(sys.argv[2]), sys.argv[3])
+        print(f"Wrote {n} member summaries to {sys.argv[3]}; profile saved to {PROFILE_DIR}")
+    else:
+        print("Usage: python profiling.py replay <profile.json> [top]\n       python profiling.py batch <jobs.csv> <summary.csv>")
+        sys.exit(1)
@@ -0,0 +1,217 @@
+import io
+import time
+import hashlib
+import sqlite3
+import threading
+import numpy as np
+import pandas as pd
+
+# Local project database (SQLite) for beam analyses.
+# Every analysis is appended as one row: the beam definition and section choice (SI), the
+# summary results and, optionally, the diagram arrays as a compressed float32 blob (kept in
+# a side table so the summary rows stay narrow), so a stored member can be reopened without
+# recomputing. Rows are never updated; the latest row
+# per (project, member_id) is the current state and the older ones are its history.
+#
+# Indexes cover the lookups the app and batch runs make: member history, section, utilization
+# and the input key (a hash of the inputs, used to find a cached result for an identical beam).
+
+INPUT_FIELDS = ("member_id", "section", "span", "load_location", "load_magnitude", "udl",
+                "left_support_type", "right_support_type", "design_code", "fy")
+RESULT_FIELDS = ("max_shear", "max_moment", "max_deflection", "utilization", "governing_check")
+DIAGRAMS = ("x", "V", "M", "delta")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    member_id TEXT NOT NULL,
+    section TEXT,
+    span REAL,
+    load_location REAL,
+    load_magnitude REAL,
+    udl REAL,
+    left_support_type TEXT,
+    right_support_type TEXT,
+    design_code TEXT,
+    fy REAL,
+    input_key TEXT NOT NULL,
+    max_shear REAL,
+    max_moment REAL,
+    max_deflection REAL,
+    utilization REAL,
+    governing_check TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS diagrams (
+    analysis_id INTEGER PRIMARY KEY REFERENCES analyses (id),
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS library_snapshot (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_member ON analyses (project, member_id, id);
+CREATE INDEX IF NOT EXISTS idx_analyses_section ON analyses (section);
+CREATE INDEX IF NOT EXISTS idx_analyses_utilization ON analyses (utilization);
+CREATE INDEX IF NOT EXISTS idx_analyses_project_utilization ON analyses (project, utilization);
+CREATE INDEX IF NOT EXISTS idx_analyses_input ON analyses (input_key);
+"""
+
+SUMMARY_COLUMNS = ("id", "project") + INPUT_FIELDS + RESULT_FIELDS + ("created_at",)
+
+
+# Hash of everything that determines the result (member_id excluded, so identical beams share it)
+def input_key(record):
+    values = (record.get(key) for key in INPUT_FIELDS[1:])
+    values = tuple(round(float(value), 9) if isinstance(value, (int, float, np.floating)) else value for value in values)
+    return hashlib.sha1(repr(values).encode()).hexdigest()
+
+
+def encode_diagrams(diagrams):
+    buffer = io.BytesIO()
+    np.savez_compressed(buffer, **{name: np.asarray(values, dtype=np.float32) for name, values in zip(DIAGRAMS, diagrams)})
+    return buffer.getvalue()
+
+
+def decode_diagrams(blob):
+    with np.load(io.BytesIO(blob)) as f:
+        return tuple(f[name].astype(float) for name in DIAGRAMS)
+
+
+class ProjectStore:
+    __slots__ = ("path", "conn", "_lock", "_latest")
+
+    def __init__(self, path="beam_project.sqlite"):
+        self.path = path
+        # One connection shared by the Streamlit script threads and background jobs. Every statement
+        # holds the lock, so a read never runs inside another thread's open write transaction
+        # (where it would see, and cache, rows that are not committed yet)
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.RLock()
+        self._latest = {}  # project -> (newest row id when read, latest() frame)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _row(self, project, record, created_at):
+        return ((project,) + tuple(record.get(key) for key in INPUT_FIELDS) + (input_key(record),)
+                + tuple(record.get(key) for key in RESULT_FIELDS) + (created_at,))
+
+    # Appends one analysis (record holds INPUT_FIELDS and RESULT_FIELDS) and returns its row id
+    def save(self, project, record, diagrams=None):
+        return self.save_many(project, [record], [diagrams])[0]
+
+    # Appends many analyses in one transaction, e.g. the summary rows of a batch run
+    def save_many(self, project, records, diagrams=None):
+        records = list(records)
+        columns = ("project",) + INPUT_FIELDS + ("input_key",) + RESULT_FIELDS + ("created_at",)
+        sql = f"INSERT INTO analyses ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        now = time.time()
+        # The lock serializes this process's threads; BEGIN IMMEDIATE takes the database write lock
+        # up front, so other processes (app replicas, library_diff.py) cannot interleave, and each
+        # row id comes from its own INSERT
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                ids = [self.conn.execute(sql, self._row(project, record, now)).lastrowid for record in records]
+                if diagrams is not None:
+                    self.conn.executemany("INSERT INTO diagrams (analysis_id, data) VALUES (?, ?)",
+                                          ((i, encode_diagrams(d)) for i, d in zip(ids, diagrams) if d is not None))
+            except BaseException:
+                self.conn.rollback()
+                raise
+            self.conn.commit()
+        return ids
+
+    def _fetch(self, sql, params=()):
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def _frame(self, sql, params=()):
+        with self._lock:
+            cursor = self.conn.execute(sql, params)
+            rows = cursor.fetchall()
+        return pd.DataFrame.from_records(rows, columns=[c[0] for c in cursor.description])
+
+    # Most recent stored result for an identical beam, with its diagrams if they were stored
+    def find(self, record):
+        rows = self._fetch(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses WHERE input_key = ? ORDER BY id DESC LIMIT 1",
+            (input_key(record),))
+        if not rows:
+            return None
+        out = dict(zip(SUMMARY_COLUMNS, rows[0]))
+        out["diagrams"] = self.diagrams(out["id"])
+        return out
+
+    def projects(self):
+        return [row[0] for row in self._fetch("SELECT DISTINCT project FROM analyses ORDER BY project")]
+
+    # Current state of a project: the latest row of every member. The frame is kept per project
+    # until any new row is appended (by this or another process), checked with one rowid lookup.
+    def latest(self, project):
+        with self._lock:
+            newest = self._fetch("SELECT MAX(id) FROM analyses")[0][0]
+            cached = self._latest.get(project)
+            if cached is None or cached[0] != newest:
+                cached = self._latest[project] = (newest, self._frame(
+                    f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses JOIN "
+                    "(SELECT MAX(id) AS id FROM analyses WHERE project = ? GROUP BY member_id) USING (id) ORDER BY member_id",
+                    (project,)))
+            return cached[1].copy()
+
+    def history(self, project, member_id):
+        return self._frame(f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses WHERE project = ? AND member_id = ? "
+                           "ORDER BY id DESC", (project, member_id))
+
+    # Stored analyses above a utilization, worst first (walks the utilization index)
+    def above(self, utilization, project=None, limit=-1):
+        sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses WHERE utilization > ?"
+        params = (utilization,)
+        if project is not None:
+            sql += " AND project = ?"
+            params += (project,)
+        return self._frame(sql + " ORDER BY utilization DESC LIMIT ?", params + (limit,))
+
+    def count_above(self, utilization, project=None):
+        if project is None:
+            return self._fetch("SELECT COUNT(*) FROM analyses WHERE utilization > ?", (utilization,))[0][0]
+        return self._fetch("SELECT COUNT(*) FROM analyses WHERE utilization > ? AND project = ?",
+                           (utilization, project))[0][0]
+
+    # Latest row of every member (any project) whose current section is one of `sections`;
+    # walks the section index, so the cost follows the number of matching rows
+    def latest_by_section(self, sections):
+        sections = list(sections)
+        if not sections:
+            return self._frame(f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses WHERE 0")
+        return self._frame(
+            f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses AS a WHERE section IN ({', '.join('?' * len(sections))}) "
+            "AND id = (SELECT MAX(id) FROM analyses AS b WHERE b.project = a.project AND b.member_id = a.member_id) "
+            "ORDER BY project, member_id", sections)
+
+    def by_section(self, section):
+        return self._frame(f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM analyses WHERE section = ? ORDER BY id", (section,))
+
+    # Section library this store was last revalidated against (library_diff snapshot bytes) or None
+    def library_snapshot(self):
+        rows = self._fetch("SELECT data FROM library_snapshot WHERE id = 1")
+        return rows[0][0] if rows else None
+
+    def save_library_snapshot(self, data):
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO library_snapshot (id, data) VALUES (1, ?)", (data,))
+
+    # Stored diagrams of one row, as (x, V, M, delta) or None
+    def diagrams(self, row_id):
+        rows = self._fetch("SELECT data FROM diagrams WHERE analysis_id = ?", (int(row_id),))
+        return decode_diagrams(rows[0][0]) if rows else None
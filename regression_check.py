@@ -0,0 +1,408 @@
+import os
+import sys
+import time
+import numpy as np
+import sfd_slp as sfd
+import continuous_beam as cb
+import section_engine as se
+import plastic_section as pls
+import influence_library as il
+import parametric_sweep as ps
+import batch_stream as bs
+from beam_pipeline import BeamPipeline
+
+# Deterministic golden-result regression run for the solvers.
+# Every case returns checks (label, value, reference, rtol):
+#   - reference is a closed-form textbook value, or the same quantity from another code path
+#     (scalar vs vectorized, cached pipeline, influence table, batch stream), or None when only
+#     the recorded golden value applies;
+#   - every value is also compared with the golden file (regression_golden.npz, GOLDEN_RTOL),
+#     so results without a closed form still cannot drift unnoticed.
+# Each case has a wall-time ceiling (best of `repeat` runs, seconds), so a fix that keeps the
+# numbers but loses the speed fails too. Inputs are fixed or drawn from a seeded generator.
+# All values are SI (N, m, Nm, Pa).
+#
+#   python regression_check.py [--update] [case ...]
+#
+# --update rewrites the golden file from this run (after a reviewed, intended change).
+
+GOLDEN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "regression_golden.npz")
+GOLDEN_RTOL = 1e-9
+ATOL = 1e-9
+SEED = 20240601
+
+L, A, P, W = 10.0, 3.0, 1e4, 1e3  # span, load position, point load, UDL of the support cases
+B_ = L - A
+
+
+# ---------------------------------------------------------------------------
+# calculate_supports: every SUPPORT_CASES branch, overhangs and rejected patterns
+# ---------------------------------------------------------------------------
+# Point load P at a (b = L - a); MA is reported hogging positive, MB sagging positive
+POINT_REFERENCES = {
+    ("Pinned", "Pinned"): (P * B_ / L, P * A / L, 0.0, 0.0),
+    ("Fixed", "Pinned"): (P - P * A**2 * (3 * L - A) / (2 * L**3), P * A**2 * (3 * L - A) / (2 * L**3),
+                          P * A * B_ * (L + B_) / (2 * L**2), 0.0),
+    ("Pinned", "Fixed"): (P * B_**2 * (3 * L - B_) / (2 * L**3), P - P * B_**2 * (3 * L - B_) / (2 * L**3),
+                          0.0, -P * A * B_ * (L + A) / (2 * L**2)),
+    ("Fixed", "Fixed"): (P * B_**2 * (3 * A + B_) / L**3, P * A**2 * (A + 3 * B_) / L**3, P * A * B_**2 / L**2, -P * A**2 * B_ / L**2),
+    ("Fixed", "Free"): (P, 0.0, P * A, 0.0),
+    ("Free", "Fixed"): (0.0, P, 0.0, -P * B_),
+}
+
+# UDL w over the span
+UDL_REFERENCES = {
+    ("Pinned", "Pinned"): (W * L / 2, W * L / 2, 0.0, 0.0),
+    ("Fixed", "Pinned"): (5 * W * L / 8, 3 * W * L / 8, W * L**2 / 8, 0.0),
+    ("Pinned", "Fixed"): (3 * W * L / 8, 5 * W * L / 8, 0.0, -W * L**2 / 8),
+    ("Fixed", "Fixed"): (W * L / 2, W * L / 2, W * L**2 / 12, -W * L**2 / 12),
+    ("Fixed", "Free"): (W * L, 0.0, W * L**2 / 2, 0.0),
+    ("Free", "Fixed"): (0.0, W * L, 0.0, -W * L**2 / 2),
+}
+
+
+def _reactions(label, values, reference, rtol=1e-12):
+    return [(f"{label}/{name}", value, ref, rtol) for name, value, ref in zip(("RA", "RB", "MA", "MB"), values, reference)]
+
+
+def case_support_branches():
+    checks = []
+    for (left, right), reference in POINT_REFERENCES.items():
+        checks += _reactions(f"point/{left}-{right}", sfd.calculate_supports(L, A, P, left, right), reference)
+    for (left, right), reference in UDL_REFERENCES.items():
+        checks += _reactions(f"udl/{left}-{right}", sfd.beam_reactions(L, [], [], left, right, W), reference)
+
+    # Overhangs (load c = 2 m past a pinned support): statics, and for the propped cantilever
+    # the tip moment P c carried half to the fixed end
+    c = 2.0
+    checks += _reactions("overhang/left", sfd.calculate_supports(L, -c, P, "Pinned", "Pinned"),
+                         (P * (L + c) / L, -P * c / L, P * c, 0.0))
+    checks += _reactions("overhang/right", sfd.calculate_supports(L, L + c, P, "Pinned", "Pinned"),
+                         (-P * c / L, P * (L + c) / L, 0.0, -P * c))
+    checks += _reactions("overhang/propped", sfd.calculate_supports(L, L + c, P, "Fixed", "Pinned"),
+                         (-1.5 * P * c / L, P + 1.5 * P * c / L, -P * c / 2, -P * c))
+
+    # Patterns the table rejects
+    for label, args in (("free-free", (L, A, P, "Free", "Free")), ("overhang-fixed", (L, -c, P, "Fixed", "Pinned")),
+                        ("overhang-free", (L, L + c, P, "Fixed", "Free"))):
+        try:
+            sfd.calculate_supports(*args)
+            rejected = 0.0
+        except ValueError:
+            rejected = 1.0
+        checks.append((f"rejects/{label}", rejected, 1.0, 0.0))
+    return checks
+
+
+# Peak |deflection| of the single-span diagrams against the handbook formulas
+def case_deflections():
+    E, I = sfd.E, sfd.I
+    x = np.linspace(0, L, 2001)
+    propped = (39 + 55 * np.sqrt(33)) / 65536  # w L^4 / EI, propped cantilever under UDL
+    cases = (
+        ("ss-centre-point", (L, [L / 2], [P], "Pinned", "Pinned", 0.0), P * L**3 / (48 * E * I)),
+        ("ss-udl", (L, [], [], "Pinned", "Pinned", W), 5 * W * L**4 / (384 * E * I)),
+        ("cantilever-tip-point", (L, [L], [P], "Fixed", "Free", 0.0), P * L**3 / (3 * E * I)),
+        ("cantilever-udl", (L, [], [], "Free", "Fixed", W), W * L**4 / (8 * E * I)),
+        ("fixed-centre-point", (L, [L / 2], [P], "Fixed", "Fixed", 0.0), P * L**3 / (192 * E * I)),
+        ("fixed-udl", (L, [], [], "Fixed", "Fixed", W), W * L**4 / (384 * E * I)),
+        ("propped-udl", (L, [], [], "Fixed", "Pinned", W), propped * W * L**4 / (E * I)),
+    )
+    checks = []
+    for label, (span, a, p, left, right, w), reference in cases:
+        _, _, M, _ = sfd.load_diagrams(span, a, p, left, right, udl=w, x=x)
+        _, delta = sfd.slope_deflection(x, M, left, E, I, right)
+        checks.append((f"{label}/max_deflection", np.abs(delta).max(), reference, 1e-4))
+    return checks
+
+
+# ---------------------------------------------------------------------------
+# Multi-support beams, given the way app.py collects them (support and load dicts)
+# ---------------------------------------------------------------------------
+def _app_layout(supports, point_loads, udl=0.0):
+    locations = np.sort([support["location"] for support in supports])
+    loads = [(load["location"], load["magnitude"]) for load in point_loads]
+    return cb.solve_continuous(np.diff(locations), loads, udl, num_points=401)
+
+
+def _supports(*locations):
+    return [{"name": f"Support {i + 1}", "type": "Pinned" if i == 0 else "Roller", "location": x} for i, x in enumerate(locations)]
+
+
+def case_multi_support():
+    E, I = sfd.E, sfd.I
+    propped = (39 + 55 * np.sqrt(33)) / 65536
+    checks = []
+
+    # Two equal spans, UDL: 3/8, 10/8, 3/8 w L and -w L^2 / 8 over the middle support
+    two = _app_layout(_supports(0.0, L, 2 * L), [], W)
+    checks += [("two-span-udl/reactions", two["reactions"], np.array([3, 10, 3]) * W * L / 8, 1e-12),
+               ("two-span-udl/support_moments", two["support_moments"], [0.0, -W * L**2 / 8, 0.0], 1e-12),
+               ("two-span-udl/max_deflection", np.abs(two["delta"]).max(), propped * W * L**4 / (E * I), 1e-4)]
+
+    # Three equal spans, UDL: 0.4, 1.1, 1.1, 0.4 w L and -w L^2 / 10 over the inner supports
+    three = _app_layout(_supports(0.0, L, 2 * L, 3 * L), [], W)
+    checks += [("three-span-udl/reactions", three["reactions"], np.array([0.4, 1.1, 1.1, 0.4]) * W * L, 1e-12),
+               ("three-span-udl/support_moments", three["support_moments"], [0.0, -W * L**2 / 10, -W * L**2 / 10, 0.0], 1e-12)]
+
+    # Two equal spans, P at each midspan: 5/16, 22/16, 5/16 P and -3 P L / 16
+    loads = [{"location": L / 2, "magnitude": P}, {"location": 1.5 * L, "magnitude": P}]
+    points = _app_layout(_supports(0.0, L, 2 * L), loads)
+    checks += [("two-span-points/reactions", points["reactions"], np.array([5, 22, 5]) * P / 16, 1e-12),
+               ("two-span-points/support_moments", points["support_moments"], [0.0, -3 * P * L / 16, 0.0], 1e-12)]
+
+    # Unequal spans with off-centre loads: golden values only
+    loads = [{"location": 2.0, "magnitude": P}, {"location": 9.5, "magnitude": 2 * P}, {"location": 13.0, "magnitude": P}]
+    mixed = _app_layout(_supports(0.0, 4.0, 11.0, 15.0), loads, W)
+    checks += [("unequal/reactions", mixed["reactions"], None, 0.0), ("unequal/support_moments", mixed["support_moments"], None, 0.0),
+               ("unequal/max_deflection", np.abs(mixed["delta"]).max(), None, 0.0)]
+
+    # One span with fixed ends (zero-length end spans) is the sfd_slp Fixed-Fixed case
+    single = cb.solve_continuous([L], [(A, P)], 0.0, "Fixed", "Fixed")
+    RA, RB, MA, MB = sfd.calculate_supports(L, A, P, "Fixed", "Fixed")
+    checks += [("fixed-single/reactions", single["reactions"], [RA, RB], 1e-12),
+               ("fixed-single/support_moments", single["support_moments"], [-MA, MB], 1e-12)]
+    return checks
+
+
+# ---------------------------------------------------------------------------
+# Custom Beam shapes (tab 2 inputs, m) against hand formulas and the polygon engine
+# ---------------------------------------------------------------------------
+FY = 355e6
+
+
+# Area, elastic neutral axis, Ix and plastic modulus of stacked rectangles (x0, y0, width, height)
+def _rectangles(plates):
+    plates = np.asarray(plates, dtype=float)
+    w, h, y0 = plates[:, 2], plates[:, 3], plates[:, 1]
+    a = w * h
+    A = a.sum()
+    yc = (a * (y0 + h / 2)).sum() / A
+    Ix = (w * h**3 / 12 + a * (y0 + h / 2 - yc) ** 2).sum()
+    # Plastic axis: the area below a height is piecewise linear between the plate edges
+    levels = np.unique(np.concatenate((y0, y0 + h)))
+    below = np.array([(w * np.clip(y - y0, 0, h)).sum() for y in levels])
+    yp = np.interp(A / 2, below, levels)
+    lo, hi = np.minimum(y0, yp), np.maximum(y0 + h, yp)
+    Zp = (w * ((yp - lo) ** 2 - (yp - np.minimum(y0 + h, yp)) ** 2) / 2
+          + w * ((hi - yp) ** 2 - (np.maximum(y0, yp) - yp) ** 2) / 2).sum()
+    return A, yc, Ix, Zp, yp
+
+
+SHAPE_CASES = (
+    # shape, tab 2 dimensions (m), the same section as rectangles (x0, y0, w, h)
+    ("Symmetric I-Beam", (0.4, 0.18, 0.0135, 0.0086),
+     ((0, 0, 0.18, 0.0135), (0.08570, 0.0135, 0.0086, 0.373), (0, 0.3865, 0.18, 0.0135))),
+    ("Assymmetric I-Beam", (0.6, 0.3, 0.2, 0.02, 0.015, 0.01),
+     ((0.05, 0, 0.2, 0.015), (0.145, 0.015, 0.01, 0.565), (0, 0.58, 0.3, 0.02))),
+    ("Boxed Up I-Beam", (0.5, 0.3, 0.016, 0.01, 0.008),
+     ((0, 0, 0.3, 0.016), (0, 0.016, 0.008, 0.468), (0.145, 0.016, 0.01, 0.468), (0.292, 0.016, 0.008, 0.468), (0, 0.484, 0.3, 0.016))),
+    ("Rectangular Tube", (0.3, 0.2, 0.01),
+     ((0, 0, 0.2, 0.01), (0, 0.01, 0.01, 0.28), (0.19, 0.01, 0.01, 0.28), (0, 0.29, 0.2, 0.01))),
+)
+
+# Thin-walled sections for the class 3 / 4 branches (golden values only)
+SLENDER_CASES = (
+    ("Symmetric I-Beam", (1.2, 0.4, 0.012, 0.006)),
+    ("Assymmetric I-Beam", (1.0, 0.5, 0.3, 0.01, 0.02, 0.006)),
+    ("Boxed Up I-Beam", (0.8, 0.8, 0.008, 0.006, 0.006)),
+    ("Rectangular Tube", (0.6, 0.5, 0.006)),
+    ("Circular Tube", (0.9, 0.006)),
+)
+CLASS_CASES = [(shape, dims) for shape, dims, _ in SHAPE_CASES] + [("Circular Tube", (0.3239, 0.01))] + list(SLENDER_CASES)
+
+
+def case_custom_shapes():
+    checks = []
+    for shape, dims, rectangles in SHAPE_CASES:
+        out = pls.custom_section(shape, dims, FY)
+        A_, yc, Ix, Zp, yp = _rectangles(rectangles)
+        depth = dims[0]
+        label = shape.replace(" ", "-")
+        checks += [(f"{label}/A", out["A"], A_, 1e-12), (f"{label}/Ix", out["Ix"], Ix, 1e-12),
+                   (f"{label}/Zx", out["Zx"], Ix / max(depth - yc, yc), 1e-12),
+                   (f"{label}/Zpx", out["Zpx"], Zp, 1e-9), (f"{label}/ypna", out["ypna"], yp, 1e-9)]
+        # Polygon engine on the same plates
+        section = se.Section.from_plates(rectangles)
+        checks += [(f"{label}/engine-Ix", se.properties(section)["Ix"], Ix, 1e-12),
+                   (f"{label}/engine-Zpx", pls.section_plastic_moduli(section)["Zpx"], Zp, 1e-9)]
+
+    # Circular tube: closed forms against the 720-gon ring in the polygon engine
+    D, t = 0.3239, 0.01
+    d = D - 2 * t
+    out = pls.custom_section("Circular Tube", (D, t), FY)
+    ring = se.circular_tube(D, t, segments=720)
+    checks += [("Circular-Tube/Ix", out["Ix"], np.pi * (D**4 - d**4) / 64, 1e-12),
+               ("Circular-Tube/Zpx", out["Zpx"], (D**3 - d**3) / 6, 1e-12),
+               ("Circular-Tube/engine-Ix", se.properties(ring)["Ix"], np.pi * (D**4 - d**4) / 64, 1e-4),
+               ("Circular-Tube/engine-Zpx", pls.section_plastic_moduli(ring)["Zpx"], (D**3 - d**3) / 6, 1e-4)]
+
+    # Classes, effective widths and the design modulus for every shape
+    for shape, dims in CLASS_CASES:
+        out = pls.custom_section(shape, dims, FY)
+        label = shape.replace(" ", "-") + "/" + "x".join(f"{d * 1e3:g}" for d in dims)
+        checks += [(f"{label}/{key}", out[key], None, 0.0) for key in ("section_class", "Zeffx", "Zdx", "rho_flange", "rho_web")]
+    return checks
+
+
+# ---------------------------------------------------------------------------
+# Vectorized, cached and batch paths against the scalar closed forms
+# ---------------------------------------------------------------------------
+def _random_beams(n=100):
+    rng = np.random.default_rng(SEED)
+    span = rng.uniform(1.0, 20.0, n)
+    return span, span * rng.uniform(0.0, 1.0, n), rng.uniform(1e3, 1e5, n)
+
+
+def case_vectorized():
+    span, a, p = _random_beams()
+    checks = []
+    for left, right in sfd.SUPPORT_CASES:
+        vector = sfd.calculate_supports(span, a, p, left, right)
+        scalar = np.array([sfd.calculate_supports(*beam, left, right) for beam in zip(span, a, p)]).T
+        checks += [(f"{left}-{right}/{name}", v, s, 1e-12) for name, v, s in zip(("RA", "RB", "MA", "MB"), vector, scalar)]
+        # Several loads in one call are the sum of the single-load reactions
+        loads = np.array([[0.2, 0.5, 0.9]]) * span[:1, None]
+        together = sfd.beam_reactions(span[0], loads[0], [p[0], 2 * p[0], p[0]], left, right)
+        apart = np.sum([sfd.calculate_supports(span[0], x, m, left, right) for x, m in zip(loads[0], (p[0], 2 * p[0], p[0]))], axis=0)
+        checks.append((f"{left}-{right}/superposition", np.array(together), apart, 1e-12))
+
+    # Parametric sweep grid against single beams
+    sweep = ps.sweep_span_location(np.linspace(2, 12, 21), np.linspace(0, 12, 25), P, "Fixed", "Pinned")
+    row, col = ps.nearest_cell(sweep, 7.0, 4.5)
+    RA, _, MA, MB = sfd.calculate_supports(7.0, 4.5, P, "Fixed", "Pinned")
+    checks.append(("sweep/max_moment", sweep["max_moment"][row, col], max(abs(MA), abs(MB), abs(RA * 4.5 - MA)), 1e-12))
+
+    # Custom sections: a batch of candidates in one call against one call per candidate
+    depths = np.linspace(0.3, 1.2, 10)
+    batch = pls.custom_section("Symmetric I-Beam", (depths, 0.3, 0.02, 0.01), FY)
+    single = [pls.custom_section("Symmetric I-Beam", (D, 0.3, 0.02, 0.01), FY) for D in depths]
+    checks += [(f"sections/{key}", batch[key], np.array([float(s[key]) for s in single]), 1e-12)
+               for key in ("Zx", "Zpx", "Zeffx", "section_class")]
+    return checks
+
+
+def case_cached():
+    checks = []
+    pipeline = BeamPipeline()
+    inputs = dict(span=L, load_location=A, load_magnitude=P, left_support_type="Fixed", right_support_type="Pinned", udl=W)
+    for step, change in enumerate(({}, {"load_magnitude": 2 * P}, {"udl": 0.5 * W}, {"load_location": 7.0})):
+        inputs.update(change)
+        result = pipeline.update(**inputs)
+        x, V, M, reactions = sfd.load_diagrams(inputs["span"], [inputs["load_location"]], [inputs["load_magnitude"]],
+                                               inputs["left_support_type"], inputs["right_support_type"], udl=inputs["udl"])
+        checks += [(f"pipeline/{step}/reactions", np.array(result["reactions"]), np.array(reactions), 1e-12),
+                   (f"pipeline/{step}/V", result["V"], V, 1e-12), (f"pipeline/{step}/M", result["M"], M, 1e-12)]
+    # A magnitude-only edit reuses the unit solutions
+    pipeline.update(load_magnitude=3 * P)
+    checks.append(("pipeline/rescale-only", float(pipeline.recomputed == ["load", "results", "figures"]), 1.0, 0.0))
+
+    # Influence-line table (float32) at its own grid positions
+    library = il.load_library()
+    for left, right in sfd.SUPPORT_CASES:
+        a = library.xi[[20, 100, 170]] * L
+        table = np.array([library.reactions(L, [(x, P)], left, right) for x in a])
+        exact = np.array([sfd.calculate_supports(L, x, P, left, right) for x in a])
+        checks.append((f"influence/{left}-{right}", table, exact, 1e-5))
+    return checks
+
+
+def case_batch():
+    span, a, p = _random_beams()
+    patterns = list(sfd.SUPPORT_CASES)
+    jobs = [{"member_id": f"B{i}", "span": span[i], "load_location": a[i], "load_magnitude": p[i] / 1e3,
+             "left_support_type": patterns[i % 6][0], "right_support_type": patterns[i % 6][1],
+             "Z": 1e-3, "fy": 355} for i in range(len(span))]
+    rows = list(bs.stream_results(jobs, chunk_size=32, num_points=101))
+    shear, moment, deflection = [], [], []
+    for job in jobs:
+        left, right = job["left_support_type"], job["right_support_type"]
+        x = np.linspace(0, job["span"], 101)
+        load = ([job["load_location"]], [job["load_magnitude"] * 1e3], left, right)
+        _, V, M, _ = sfd.load_diagrams(job["span"], *load, x=x)
+        _, delta = sfd.slope_deflection(x, M, left, sfd.E, sfd.I, right)
+        # M is piecewise linear: its peak is at a support or under the load, wherever the stations fall
+        _, _, M_peak, _ = sfd.load_diagrams(job["span"], *load, x=np.array([0.0, job["load_location"], job["span"]]))
+        shear.append(np.abs(V).max())
+        moment.append(np.abs(M_peak).max())
+        deflection.append(np.abs(delta).max())
+    return [("stream/max_shear", np.array([row["max_shear"] for row in rows]), np.array(shear), 1e-9),
+            ("stream/max_moment", np.array([row["max_moment"] for row in rows]), np.array(moment), 1e-9),
+            ("stream/max_deflection", np.array([row["max_deflection"] for row in rows]), np.array(deflection), 1e-6),
+            ("stream/utilization", np.array([row["utilization"] for row in rows]), None, 0.0)]
+
+
+# (name, check function, wall-time ceiling in seconds)
+CASES = [
+    ("support_branches", case_support_branches, 0.02),
+    ("deflections", case_deflections, 0.03),
+    ("multi_support", case_multi_support, 0.03),
+    ("custom_shapes", case_custom_shapes, 0.3),
+    ("vectorized", case_vectorized, 0.4),
+    ("cached", case_cached, 0.3),
+    ("batch", case_batch, 0.25),
+]
+
+
+def load_golden(path=GOLDEN_PATH):
+    if not os.path.exists(path):
+        return {}
+    with np.load(path) as f:
+        return {name: f[name] for name in f.files}
+
+
+def save_golden(values, path=GOLDEN_PATH):
+    np.savez_compressed(path, **values)
+
+
+# Runs the cases and returns rows (case, passed, seconds, ceiling, failures) plus every value computed
+def run_cases(names=None, golden=None, repeat=3):
+    golden = load_golden() if golden is None else golden
+    rows, values = [], {}
+    for name, check, ceiling in CASES:
+        if names and name not in names:
+            continue
+        seconds = np.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            checks = check()
+            seconds = min(seconds, time.perf_counter() - start)
+        failures = []
+        for label, value, reference, rtol in checks:
+            key = f"{name}/{label}"
+            value = np.asarray(value, dtype=float)
+            values[key] = value
+            if reference is not None and not np.allclose(value, reference, rtol=rtol, atol=ATOL):
+                error = np.max(np.abs(value - np.asarray(reference, dtype=float)))
+                failures.append(f"{label}: off the reference by {error:.3g} (rtol {rtol:g})")
+            if key not in golden:
+                failures.append(f"{label}: no golden value")
+            elif golden[key].shape != value.shape or not np.allclose(value, golden[key], rtol=GOLDEN_RTOL, atol=ATOL):
+                failures.append(f"{label}: changed from the golden value")
+        if seconds > ceiling:
+            failures.append(f"took {seconds * 1e3:.1f} ms, ceiling {ceiling * 1e3:.0f} ms")
+        rows.append((name, not failures, seconds, ceiling, failures))
+    return rows, values
+
+
+if __name__ == "__main__":
+    # python regression_check.py [--update] [case ...]
+    args = sys.argv[1:]
+    update = "--update" in args
+    names = [arg for arg in args if arg != "--update"]
+    unknown = set(names) - {name for name, _, _ in CASES}
+    if unknown:
+        print(f"Unknown cases: {sorted(unknown)}; available: {[name for name, _, _ in CASES]}")
+        sys.exit(1)
+    golden = load_golden()
+    rows, values = run_cases(names, golden)
+    if update:
+        # Reference and timing failures still count; only the golden comparison is re-recorded
+        save_golden({**golden, **values})
+        rows, values = run_cases(names, load_golden())
+        print(f"Recorded {len(values)} golden values in {GOLDEN_PATH}")
+    for name, passed, seconds, ceiling, failures in rows:
+        print(f"{'PASS' if passed else 'FAIL'}  {name:<18} {seconds * 1e3:8.1f} ms  (ceiling {ceiling * 1e3:.0f} ms)")
+        for failure in failures:
+            print(f"      {failure}")
+    sys.exit(0 if all(passed for _, passed, _, _, _ in rows) else 1)
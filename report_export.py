@@ -0,0 +1,270 @@
+import io
+import html
+import zipfile
+import functools
+import threading
+import concurrent.futures
+import pandas as pd
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import plotly.io as pio
+import plotly.offline
+import sfd_slp as sfd
+import units
+import shared_library as shl
+
+# Calculation report export for one or many members, without going through the browser.
+# Each member gets the beam sketch, SFD, BMD, reactions and (optionally) its section table.
+#
+#   fmt="html": one self-contained HTML file, plotly.js embedded once (works offline)
+#   fmt="pdf":  a zip bundle with one vector PDF page per member (matplotlib)
+#
+# Member fields are in MEMBER_UNITS and are converted to SI once, in the analysis key.
+# Members are rendered in a long-lived worker pool. Rendered figures and pages are kept in the
+# parent process per analysis input, so members sharing span/load/supports are only drawn
+# once, and a repeated export reuses everything drawn by earlier ones.
+# With library (a shared_library path), a member's section_name also gets its library
+# properties; process workers map the library once and look them up themselves.
+
+REPORT_CSS = """
+body { font-family: Arial, sans-serif; margin: 24px; }
+section { page-break-after: always; margin-bottom: 48px; }
+table { border-collapse: collapse; margin: 8px 0; }
+td, th { border: 1px solid #999; padding: 4px 8px; text-align: right; }
+.figs { display: flex; flex-wrap: wrap; }
+"""
+
+MEMBER_UNITS = {"span": "m", "load_location": "m", "load_magnitude": "kN", "udl": "kN/m"}  # udl includes self-weight
+
+# Library properties listed under a member's section: (key, label, display unit)
+LIBRARY_ROWS = (("mass", "Mass", "kg/m"), ("D", "Depth", "mm"), ("B", "Width", "mm"), ("tf", "Flange thickness", "mm"),
+                ("tw", "Web thickness", "mm"), ("A", "Area", "cm^2"), ("Ix", "Ix", "cm^4"), ("Zx", "Zx", "cm^3"))
+
+RENDER_CACHE_SIZE = 1024  # rendered figure sets / PDF pages kept between exports
+
+_export_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+_pools = {}         # (executor kind, max_workers, library) -> pool, created on first use
+_rendered = {}      # (renderer, input) -> rendered bytes or HTML
+_lock = threading.Lock()
+
+
+def _analysis_key(member):
+    si = units.convert({key: member[key] for key in MEMBER_UNITS}, MEMBER_UNITS)
+    return (si["span"], si["load_location"], si["load_magnitude"],
+            member["left_support_type"], member["right_support_type"], si["udl"])
+
+
+def _analyse(key):
+    span, a, P, left, right, w = key
+    x, V, M, reactions = sfd.load_diagrams(span, [a], [P], left, right, udl=w)
+    return tuple(map(float, reactions)), x, V, M
+
+
+# ---------------------------------------------------------------------------
+# HTML
+# ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=1024)
+def _html_figures(key):
+    (RA, RB, MA, MB), x, V, M = _analyse(key)
+    span, a, P, left, right, _ = key
+    figs = (sfd.beam_supports_figure(span, left, right, a, P, RA, RB, -MA, MB),
+            sfd.shear_force_figure(x, V, figsize=(6, 4)),
+            sfd.bending_moment_figure(x, M, figsize=(6, 4)))
+    return "".join(pio.to_html(fig, full_html=False, include_plotlyjs=False) for fig in figs)
+
+
+def _table_html(rows):
+    return "<table>" + "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(v))}</td>" for v in row) + "</tr>" for row in rows) + "</table>"
+
+
+def _library_rows(library, name):
+    if library is None or name is None:
+        return ()
+    try:
+        props = shl.attach(library).section(name)
+    except KeyError:
+        return ()  # custom or removed section
+    return tuple((label, f"{units.from_si(props[key], unit):.4g} {unit}") for key, label, unit in LIBRARY_ROWS)
+
+
+def _section_html(section, library_rows=()):
+    if section is None:
+        return _table_html(library_rows) if library_rows else ""
+    if isinstance(section, pd.DataFrame):
+        return section.to_html(index=False, na_rep="") + (_table_html(library_rows) if library_rows else "")
+    return _table_html(tuple(section.items()) + library_rows)
+
+
+def render_member_html(member, figures_html=None, library=None):
+    key = _analysis_key(member)
+    RA, RB, MA, MB = _analyse(key)[0]
+    span, a, P, left, right, w = key
+    return (
+        f"<section><h2>{html.escape(str(member.get('member_id', '')))}</h2>"
+        + _table_html([("Span", units.show(span, "length")), ("Load", units.show(P, "force")),
+                       ("Load location", units.show(a, "length")), ("UDL", units.show(w, "udl")),
+                       ("Left support", left), ("Right support", right)])
+        + _table_html([("", "Reaction Force", "Moment"),
+                       ("Left Support", units.show(RA, "force"), units.show(-MA, "moment")),
+                       ("Right Support", units.show(-RB, "force"), units.show(MB, "moment"))])
+        + _section_html(member.get("section"), _library_rows(library, member.get("section_name")))
+        + f"<div class='figs'>{figures_html or _html_figures(key)}</div></section>"
+    )
+
+
+# ---------------------------------------------------------------------------
+# PDF (matplotlib, one page per member)
+# ---------------------------------------------------------------------------
+def _draw_beam(ax, key, reactions):
+    span, a, P, left, right, _ = key
+    RA, RB, MA, MB = reactions
+    ax.plot([min(0, a), max(span, a)], [0, 0], color="blue", lw=4)
+    for pos, kind in ((0, left), (span, right)):
+        if kind == "Free":
+            continue
+        if kind == "Pinned":
+            ax.fill([pos - 0.2, pos + 0.2, pos], [-0.5, -0.5, 0], color="gold")
+        else:
+            ax.plot([pos, pos], [-1, 1], color="gold", lw=6)
+    ax.annotate(sfd.load_label(P), xy=(a, 0), xytext=(a, 1.2), ha="center", color="red",
+                arrowprops=dict(arrowstyle="->", color="red"))
+    ax.text(0, -1.3, sfd.reaction_label("L", RA, -MA), ha="center", va="top", color="green", fontsize=8)
+    ax.text(span, -1.3, sfd.reaction_label("R", RB, MB), ha="center", va="top", color="green", fontsize=8)
+    ax.set_xlim(min(0, a) - 2, max(span, a) + 2)
+    ax.set_ylim(-2.5, 2)
+    ax.axis("off")
+
+
+def _draw_diagram(ax, x, y, title, ylabel, color):
+    ax.plot(x, y, color=color)
+    ax.fill_between(x, y, 0, where=y >= 0, color="yellow", alpha=0.5)
+    ax.fill_between(x, y, 0, where=y < 0, color="red", alpha=0.5)
+    ax.axhline(0, color="black", lw=2)
+    ax.set_title(title)
+    ax.set_xlabel("Distance along the beam (m)")
+    ax.set_ylabel(ylabel)
+    ax.grid(True)
+    ax.locator_params(nbins=5)  # fewer ticks keeps the page cheap to lay out
+
+
+@functools.lru_cache(maxsize=1024)
+def _pdf_page(key, member_id, section_rows):
+    reactions, x, V, M = _analyse(key)
+    fig = plt.figure(figsize=(8.27, 11.69))  # A4 portrait
+    fig.suptitle(f"Member {member_id}", fontsize=16)
+    _draw_beam(fig.add_axes([0.08, 0.72, 0.84, 0.18]), key, reactions)
+    _draw_diagram(fig.add_axes([0.1, 0.47, 0.8, 0.2]), x, units.from_si(V, units.DISPLAY["force"]),
+                  "Shear Force Diagram", units.label("Shear Force", "force"), "blue")
+    _draw_diagram(fig.add_axes([0.1, 0.2, 0.8, 0.2]), x, units.from_si(M, units.DISPLAY["moment"]),
+                  "Bending Moment Diagram", units.label("Bending Moment", "moment"), "green")
+    if section_rows:
+        table_ax = fig.add_axes([0.1, 0.02, 0.8, 0.14])
+        table_ax.axis("off")
+        table_ax.table(cellText=[list(map(str, row)) for row in section_rows], loc="center", fontsize=7)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="pdf")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def _section_rows(section):
+    if section is None:
+        return ()
+    if isinstance(section, pd.DataFrame):
+        return tuple(tuple(row) for row in [section.columns.tolist()] + section.astype(str).values.tolist())
+    return tuple(section.items())
+
+
+def _page_args(member, library=None):
+    return (_analysis_key(member), str(member.get("member_id", "")), _section_rows(member.get("section")),
+            library, member.get("section_name"))
+
+
+# Runs in the worker: library properties are looked up in its own mapping of the library
+def _render_page(args):
+    key, member_id, section_rows, library, name = args
+    width = len(section_rows[0]) if section_rows else 2  # the page table needs equal rows
+    return _pdf_page(key, member_id, section_rows + tuple(row + ("",) * (width - 2) for row in _library_rows(library, name)))
+
+
+def render_member_pdf(member, library=None):
+    return _render_page(_page_args(member, library))
+
+
+# ---------------------------------------------------------------------------
+# Bulk export
+# ---------------------------------------------------------------------------
+# One pool per kind, size and library for the life of the process (worker start-up is paid
+# once); process workers map the library when they start
+def _executor(kind, max_workers, library=None):
+    with _lock:
+        pool = _pools.get((kind, max_workers, library))
+        if pool is None:
+            if kind == "process":
+                pool = concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, initializer=shl.attach if library else None,
+                                                              initargs=(library,) if library else ())
+            else:
+                pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+            _pools[(kind, max_workers, library)] = pool
+        return pool
+
+
+# func(item) for every item (hashable); only items not rendered by an earlier export go to the pool
+def _map(func, items, max_workers, executor, library=None):
+    with _lock:
+        missing = list(dict.fromkeys(item for item in items if (func.__name__, item) not in _rendered))
+    if len(missing) < 2:
+        results = [func(item) for item in missing]
+    else:
+        if library and executor == "process":
+            shl.attach(library)  # published again if pruned, for workers the pool starts now
+        results = list(_executor(executor, max_workers, library).map(func, missing, chunksize=max(1, len(missing) // 32)))
+    with _lock:
+        if len(_rendered) + len(missing) > RENDER_CACHE_SIZE:
+            _rendered.clear()
+        _rendered.update(((func.__name__, item), result) for item, result in zip(missing, results))
+        return [_rendered[(func.__name__, item)] for item in items]
+
+
+# Renders every member and returns the report as bytes (HTML text or a zip of PDFs)
+def export_reports(members, fmt="html", max_workers=None, executor="process", library=None):
+    if fmt not in ("html", "pdf"):
+        raise ValueError("fmt must be 'html' or 'pdf'")
+    members = list(members)
+
+    if fmt == "html":
+        # Figures depend only on the analysis inputs, so each distinct beam is drawn once
+        keys = list(dict.fromkeys(_analysis_key(m) for m in members))
+        figures = dict(zip(keys, _map(_html_figures, keys, max_workers, executor)))
+        parts = [render_member_html(m, figures[_analysis_key(m)], library) for m in members]
+        return ("<!DOCTYPE html><html><head><meta charset='utf-8'><title>Beam Sensei Calculation Report</title>"
+                f"<style>{REPORT_CSS}</style><script>{plotly.offline.get_plotlyjs()}</script></head><body>"
+                + "".join(parts) + "</body></html>").encode("utf-8")
+
+    pages = _map(_render_page, [_page_args(m, library) for m in members], max_workers, executor, library)
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, page in zip(_file_names(members), pages):
+            zf.writestr(name, page)
+    return buf.getvalue()
+
+
+# Unique PDF names in the bundle: member id, with -2, -3, ... for repeated ids
+def _file_names(members):
+    names, used = [], set()
+    for member in members:
+        stem = name = str(member.get("member_id", "") or "member").replace("/", "_").replace("\\", "_")
+        count = 1
+        while name in used:
+            count += 1
+            name = f"{stem}-{count}"
+        used.add(name)
+        names.append(name + ".pdf")
+    return names
+
+
+# Same as export_reports but runs in the background; returns a Future so the UI keeps going
+def export_reports_async(members, fmt="html", max_workers=None, executor="process", library=None):
+    return _export_pool.submit(export_reports, list(members), fmt, max_workers, executor, library)
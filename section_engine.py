@@ -0,0 +1,181 @@
+import numpy as np
+
+# General cross-section properties from polygons, holes and plates.
+# A Section is a list of closed rings (vertex arrays, either orientation), each added (+1) or
+# removed (-1, holes and cut-outs), plus optional rectangular plates used for the torsion
+# constant. Properties come from Green's theorem edge sums; all rings of a batch of sections
+# are concatenated and reduced with bincount, so thousands of candidates are one pass over
+# their vertices. Units are whatever the vertices use (the app passes m).
+#
+# Per edge (x0, y0) -> (x1, y1) with c = x0 y1 - x1 y0:
+#   A   = sum c / 2
+#   Qx  = sum (y0 + y1) c / 6                       (first moment about the x axis)
+#   Qy  = sum (x0 + x1) c / 6
+#   Ixx = sum (y0^2 + y0 y1 + y1^2) c / 12          (about the origin)
+#   Iyy = sum (x0^2 + x0 x1 + x1^2) c / 12
+#   Ixy = sum (x0 y1 + 2 x0 y0 + 2 x1 y1 + x1 y0) c / 24
+#
+# The torsion constant J is the open thin-walled sum over plates,
+#   J = sum a t^3 (1/3 - 0.21 t/a (1 - t^4 / (12 a^4)))   (a >= t, Roark),
+# Saint-Venant's solid-section estimate A^4 / (4 pi^2 Ip) when there are no plates, or the
+# value passed to Section(J=...) (e.g. Bredt's formula for closed tubes).
+
+PROPERTIES = ("A", "xc", "yc", "Ix", "Iy", "Ixy", "I1", "I2", "theta", "Zx", "Zy", "rx", "ry", "J")
+
+
+class Section:
+    __slots__ = ("rings", "plates", "J")
+
+    def __init__(self, rings=(), plates=(), J=None):
+        self.rings = [(np.asarray(vertices, dtype=float).reshape(-1, 2), int(sign)) for vertices, sign in rings]
+        self.plates = np.asarray(plates, dtype=float).reshape(-1, 4)  # x0, y0, width, height
+        self.J = J
+
+    # Solid polygon with optional holes (each an (n, 2) vertex array)
+    @classmethod
+    def from_polygon(cls, outline, holes=(), J=None):
+        return cls([(outline, 1)] + [(hole, -1) for hole in holes], J=J)
+
+    # Union of non-overlapping rectangular plates given as (x0, y0, width, height)
+    @classmethod
+    def from_plates(cls, plates, holes=(), J=None):
+        plates = np.asarray(plates, dtype=float).reshape(-1, 4)
+        return cls([(rectangle(*p), 1) for p in plates] + [(hole, -1) for hole in holes], plates, J)
+
+    def add_hole(self, vertices):
+        self.rings.append((np.asarray(vertices, dtype=float).reshape(-1, 2), -1))
+        return self
+
+
+def rectangle(x0, y0, width, height):
+    return np.array([[x0, y0], [x0 + width, y0], [x0 + width, y0 + height], [x0, y0 + height]])
+
+
+def circle(xc, yc, radius, segments=72):
+    t = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    return np.column_stack((xc + radius * np.cos(t), yc + radius * np.sin(t)))
+
+
+# ---------------------------------------------------------------------------
+# Common shapes as plates (origin at the bottom-left of the bounding box)
+# ---------------------------------------------------------------------------
+def i_section(D, B, tf, tw):
+    return Section.from_plates([(0, 0, B, tf), ((B - tw) / 2, tf, tw, D - 2 * tf), (0, D - tf, B, tf)])
+
+
+def asymmetric_i_section(D, b_top, b_bottom, tf_top, tf_bottom, tw):
+    B = max(b_top, b_bottom)
+    return Section.from_plates([((B - b_bottom) / 2, 0, b_bottom, tf_bottom),
+                                ((B - tw) / 2, tf_bottom, tw, D - tf_top - tf_bottom),
+                                ((B - b_top) / 2, D - tf_top, b_top, tf_top)])
+
+
+def channel(D, B, tf, tw):
+    return Section.from_plates([(0, 0, B, tf), (0, tf, tw, D - 2 * tf), (0, D - tf, B, tf)])
+
+
+def angle(h, b, t):
+    return Section.from_plates([(0, 0, b, t), (0, t, t, h - t)])
+
+
+def tee(D, B, tf, tw):
+    return Section.from_plates([((B - tw) / 2, 0, tw, D - tf), (0, D - tf, B, tf)])
+
+
+# I-girder with cover plates on both flanges
+def plated_girder(D, B, tf, tw, plate_width, plate_thickness):
+    girder = i_section(D, B, tf, tw)
+    x = (B - plate_width) / 2
+    return Section.from_plates(np.vstack((girder.plates, [(x, -plate_thickness, plate_width, plate_thickness),
+                                                          (x, D, plate_width, plate_thickness)])))
+
+
+# Closed rectangular tube; J from Bredt's formula on the wall mid-line
+def rectangular_tube(D, B, t):
+    J = 4 * ((B - t) * (D - t)) ** 2 * t / (2 * (B - t) + 2 * (D - t))
+    return Section.from_polygon(rectangle(0, 0, B, D), [rectangle(t, t, B - 2 * t, D - 2 * t)], J=J)
+
+
+def circular_tube(diameter, t, segments=72):
+    r = diameter / 2
+    J = np.pi * (r**4 - (r - t) ** 4) / 2
+    return Section.from_polygon(circle(r, r, r, segments), [circle(r, r, r - t, segments)], J=J)
+
+
+# ---------------------------------------------------------------------------
+# Batch evaluation
+# ---------------------------------------------------------------------------
+# Open-section torsion constant per section from all plates of the batch (0 where there are none)
+def _plate_torsion(sections):
+    plate_id = np.repeat(np.arange(len(sections)), [len(section.plates) for section in sections])
+    plates = np.concatenate([section.plates for section in sections])
+    a = np.maximum(plates[:, 2], plates[:, 3])
+    t = np.minimum(plates[:, 2], plates[:, 3])
+    return np.bincount(plate_id, weights=a * t**3 * (1 / 3 - 0.21 * t / a * (1 - t**4 / (12 * a**4))), minlength=len(sections))
+
+
+# Properties of every section, as arrays of shape (len(sections),)
+def section_properties(sections):
+    sections = list(sections)
+    rings = [(vertices, sign, i) for i, section in enumerate(sections) for vertices, sign in section.rings]
+    n_sections, n_rings = len(sections), len(rings)
+    counts = np.fromiter((len(v) for v, _, _ in rings), dtype=int, count=n_rings)
+    p0 = np.concatenate([v for v, _, _ in rings])
+    # Each vertex's successor, wrapping to the first vertex of its ring
+    starts = np.cumsum(counts) - counts
+    following = np.arange(1, len(p0) + 1)
+    following[starts + counts - 1] = starts
+    p1 = p0[following]
+    ring_id = np.repeat(np.arange(n_rings), counts)
+    x0, y0, x1, y1 = p0[:, 0], p0[:, 1], p1[:, 0], p1[:, 1]
+    c = x0 * y1 - x1 * y0
+
+    def ring_sum(values):
+        return np.bincount(ring_id, weights=values, minlength=n_rings)
+
+    raw = np.stack((ring_sum(c) / 2,
+                    ring_sum((y0 + y1) * c) / 6,
+                    ring_sum((x0 + x1) * c) / 6,
+                    ring_sum((y0**2 + y0 * y1 + y1**2) * c) / 12,
+                    ring_sum((x0**2 + x0 * x1 + x1**2) * c) / 12,
+                    ring_sum((x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * c) / 24))
+    # Clockwise rings give negative integrals; orient every ring, then add or remove it
+    sign = np.fromiter((s for _, s, _ in rings), dtype=float, count=n_rings) * np.sign(raw[0])
+    section_id = np.fromiter((i for _, _, i in rings), dtype=int, count=n_rings)
+    A, Qx, Qy, Ixx, Iyy, Ixy = (np.bincount(section_id, weights=row * sign, minlength=n_sections) for row in raw)
+
+    xc, yc = Qy / A, Qx / A
+    Ix = Ixx - A * yc**2
+    Iy = Iyy - A * xc**2
+    Ixy = Ixy - A * xc * yc
+    mean, radius = (Ix + Iy) / 2, np.sqrt(((Ix - Iy) / 2) ** 2 + Ixy**2)
+
+    # Extreme fibres from the outer rings' vertices
+    vertex_section = section_id[ring_id]
+    outer = sign[ring_id] > 0
+    bounds = {}
+    for name, values, reduce in (("ymax", p0[:, 1], np.maximum), ("ymin", p0[:, 1], np.minimum),
+                                 ("xmax", p0[:, 0], np.maximum), ("xmin", p0[:, 0], np.minimum)):
+        out = np.full(n_sections, -np.inf if reduce is np.maximum else np.inf)
+        reduce.at(out, vertex_section[outer], values[outer])
+        bounds[name] = out
+
+    Ip = Ix + Iy
+    has_plates = np.fromiter((len(section.plates) > 0 for section in sections), dtype=bool, count=n_sections)
+    J = np.where(has_plates, _plate_torsion(sections), A**4 / (4 * np.pi**2 * Ip))
+    for i, section in enumerate(sections):
+        if section.J is not None:
+            J[i] = section.J
+    return {
+        "A": A, "xc": xc, "yc": yc, "Ix": Ix, "Iy": Iy, "Ixy": Ixy,
+        "I1": mean + radius, "I2": mean - radius, "theta": 0.5 * np.arctan2(-2 * Ixy, Ix - Iy),
+        "Zx": Ix / np.maximum(bounds["ymax"] - yc, yc - bounds["ymin"]),
+        "Zy": Iy / np.maximum(bounds["xmax"] - xc, xc - bounds["xmin"]),
+        "rx": np.sqrt(Ix / A), "ry": np.sqrt(Iy / A), "J": J,
+        "bounds": bounds,
+    }
+
+
+# Properties of one section as plain floats
+def properties(section):
+    return {key: float(value[0]) for key, value in section_properties([section]).items() if key in PROPERTIES}
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import sfd_slp as sfd
+import units
+import code_check as cc
+
+# Section properties from the Database sheet of the section library, as SI columns.
+# The table is read once through the same sheet object the app already holds
+# (xlwings sheet or the formula engine), so tab 3 can use the section chosen in tab 1.
+#
+# Database columns used (row 4 onwards):
+#   A Type, B Standard, C mass [kg/m], D depth [mm], E breadth [mm], F tf [mm], G tw [mm],
+#   J area [cm2], N Ix [cm4], O Iy [cm4], Q ry [cm], R Sex [cm3], T Zpx [cm3]
+
+DATABASE_RANGE = "A4:T1021"
+GRAVITY = 9.81  # m/s^2
+
+# (name, column offset from A, factor to SI)
+PROPERTIES = (
+    ("mass", 2, 1.0),      # kg/m
+    ("D", 3, 1e-3),        # m
+    ("B", 4, 1e-3),        # m
+    ("tf", 5, 1e-3),       # m
+    ("tw", 6, 1e-3),       # m
+    ("A", 9, 1e-4),        # m^2
+    ("Ix", 13, 1e-8),      # m^4
+    ("Iy", 14, 1e-8),      # m^4
+    ("ry", 16, 1e-2),      # m
+    ("Zx", 17, 1e-6),      # m^3, elastic modulus Sex
+    ("Zpx", 19, 1e-6),     # m^3, plastic modulus
+)
+
+
+# Self-weight of a section as a UDL (N/m) from its mass per metre (kg/m)
+def self_weight_udl(mass):
+    return mass * GRAVITY
+
+
+class SectionTable:
+    __slots__ = ("names", "standards", "props", "_index")
+
+    def __init__(self, names, standards, props):
+        self.names = list(names)
+        self.standards = list(standards)
+        self.props = {key: np.asarray(value, dtype=float) for key, value in props.items()}
+        # A name that appears more than once resolves to its first row, as the workbook's exact
+        # VLOOKUP (tab 1) does; the later rows are only listed by the library screening
+        self._index = {}
+        for i, name in enumerate(self.names):
+            self._index.setdefault(name, i)
+
+    @classmethod
+    def from_sheet(cls, sheet_db, addr=DATABASE_RANGE):
+        return cls.from_values(sheet_db.range(addr).value)
+
+    # Table from the rows of the Database range (a list of rows, as the sheet returns them)
+    @classmethod
+    def from_values(cls, rows):
+        names, standards, columns = [], [], {key: [] for key, _, _ in PROPERTIES}
+        for row in rows:
+            if not row or row[0] is None:
+                continue
+            names.append(str(row[0]))
+            standards.append(row[1])
+            for key, offset, factor in PROPERTIES:
+                value = row[offset]
+                columns[key].append(float(value) * factor if isinstance(value, (int, float)) else np.nan)
+        return cls(names, standards, columns)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, key):
+        return self.props[key]
+
+    # Properties of one section by name, as plain floats
+    def section(self, name):
+        i = self._index[name]
+        return {key: float(values[i]) for key, values in self.props.items()}
+
+    # Self-weight of every section (N/m)
+    @property
+    def self_weight(self):
+        return self_weight_udl(self.props["mass"])
+
+
+# Code-checks every section in the table for one span and point load, with each section's own
+# self-weight added as a UDL. The beam is linear, so the point load and a 1 N/m UDL are
+# solved once and combined per section; deflection scales with 1/Ix. Sections are checked
+# in chunks of chunk_size; progress(sections_done, sections, chunk_frame) is called after each chunk.
+def check_all_sections(table, span, load_location, load_magnitude, left_support_type, right_support_type,
+                       fy, code="AISC 360", E=sfd.E, deflection_limit=360.0, num_points=500, chunk_size=256,
+                       progress=None):
+    x = sfd.beam_stations(span, [load_location], num_points)
+    _, V_point, M_point, _ = sfd.load_diagrams(span, [load_location], [load_magnitude], left_support_type, right_support_type, x=x)
+    _, V_unit, M_unit, _ = sfd.load_diagrams(span, [], [], left_support_type, right_support_type, udl=1.0, x=x)
+    bc = dict(right_support_type=right_support_type, supports=(0, span))
+    delta_point = sfd.slope_deflection(x, M_point, left_support_type, E, 1.0, **bc)[1]
+    delta_unit = sfd.slope_deflection(x, M_unit, left_support_type, E, 1.0, **bc)[1]
+    frames = []
+    for start in range(0, len(table), chunk_size):
+        rows = slice(start, start + chunk_size)
+        props = {key: values[rows] for key, values in table.props.items()}
+        self_weight = self_weight_udl(props["mass"])
+        w = self_weight[:, None]
+        V = V_point[None, :] + w * V_unit[None, :]
+        M = M_point[None, :] + w * M_unit[None, :]
+        delta = (delta_point[None, :] + w * delta_unit[None, :]) / props["Ix"][:, None]
+        check = cc.code_check(x, V, M, delta, props, fy, code, Cb=cc.cantilever_cb(left_support_type, right_support_type),
+                              E=E, deflection_limit=deflection_limit, span=span)
+        frame = pd.DataFrame({
+            "Section": table.names[rows],
+            "Standard": table.standards[rows],
+            units.label("Self-weight", "udl"): units.from_si(self_weight, units.DISPLAY["udl"]),
+            units.label("Max Moment", "moment"): units.from_si(np.max(np.abs(M), axis=1), units.DISPLAY["moment"]),
+            units.label("Max Deflection", "deflection"): units.from_si(np.max(np.abs(delta), axis=1), units.DISPLAY["deflection"]),
+        })
+        for name in cc.CHECKS:
+            frame[f"{name.capitalize()} Ratio"] = check["max"][name]
+        frame["Utilization"] = check["governing"]
+        frame["Governing Check"] = check["governing_check"]
+        frames.append(frame)
+        if progress is not None:
+            progress(min(start + chunk_size, len(table)), len(table), frame)
+    return pd.concat(frames, ignore_index=True)
@@ -1,66 +1,125 @@
+import functools
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
 import plotly.graph_objects as go
+import units
+import chart_transport as ct
 
 # Define default values for Elastic Modulus (E) and Moment of Inertia (I)
 E = 210e9  # Pa (N/m^2)
 I = 5e-6  # m^4
 
-# Function to calculate moments and shear forces
-def calculate_supports(span, load_location, load_magnitude, left_support_type, right_support_type):
-    L = span
-    a = load_location
-    b = L - a
-    P = load_magnitude *1000
-    
-    # Initialize reactions at supports.
-    RA = RB = 0
-    MA = MB = 0
-    
-    if left_support_type == 'Pinned' and right_support_type == 'Pinned':
-        # Both ends are pinned
-        RA = P * b / L
-        RB = P * a / L
-        MA = MB = 0
-
-    elif left_support_type == 'Pinned' and right_support_type == 'Fixed':
-        # Calculate moment at right fixed support (MA)
-        # MB = calculate_moment_at_fixed(load_magnitude, span)
-        MB = (P / L**2) * (a**2 * b + ((b**2 * a) / 2))
-        # Calculate reaction at left fixed support (RA) and right pinned support (RB)
-        RA = (P * (L - a) - MB) / L
-        RB = P - RA
-        MB = MB * -1
-        MA = 0  # Moment at the pinned support is zero.
-
-    elif left_support_type == 'Fixed' and right_support_type == 'Pinned':
-        # Calculate moment at right fixed support (MA)
-        MA = (P / L**2) * (b**2 * a + ((a**2 * b) / 2))
-        # Calculate reaction at left fixed support (RA) and right pinned support (RB)
-        RB = (P * (L - b) - MA) / L
-        RA = P - RB
-        MB = 0  # Moment at the pinned support is zero.
-
-    elif left_support_type == 'Fixed' and right_support_type == 'Fixed':
-        # Both ends are fixed
-        RA = (P * b**2 * (3*L - 2*b)) / L**3
-        RB = (P * a**2 * (3*L - 2*a)) / L**3
-        MA = P * a * b**2 / L**2
-        MB = -P * b * a**2 / L**2
+# Closed forms per support pattern (left, right) for a beam with supports at 0 and L.
+# Each entry gives the internal end moments (sagging positive) at the two supports:
+#   point(L, a, b): unit point load at a from the left support (b = L - a)
+#   udl(L):         unit UDL over 0..L
+#   carry:          (share of a left overhang moment carried to the right end,
+#                    share of a right overhang moment carried to the left end)
+# Reactions then follow from statics, so new patterns only need their end moments.
+# Loads outside 0..L sit on an overhang, which needs a Pinned support next to it.
+SUPPORT_CASES = {
+    ("Pinned", "Pinned"): (lambda L, a, b: (0 * a, 0 * a), lambda L: (0 * L, 0 * L), (0.0, 0.0)),
+    ("Fixed", "Pinned"): (lambda L, a, b: (-a * b * (L + b) / (2 * L**2), 0 * a), lambda L: (-L**2 / 8, 0 * L), (0.0, -0.5)),
+    ("Pinned", "Fixed"): (lambda L, a, b: (0 * a, -a * b * (L + a) / (2 * L**2)), lambda L: (0 * L, -L**2 / 8), (-0.5, 0.0)),
+    ("Fixed", "Fixed"): (lambda L, a, b: (-a * b**2 / L**2, -a**2 * b / L**2), lambda L: (-L**2 / 12, -L**2 / 12), (0.0, 0.0)),
+    # Cantilevers: the whole length hangs off the fixed end
+    ("Fixed", "Free"): (lambda L, a, b: (-a, 0 * a), lambda L: (-L**2 / 2, 0 * L), (0.0, 0.0)),
+    ("Free", "Fixed"): (lambda L, a, b: (0 * a, -b), lambda L: (0 * L, -L**2 / 2), (0.0, 0.0)),
+}
+
+SUPPORT_TYPES = ("Pinned", "Fixed", "Free")
+
+
+def _support_case(left_support_type, right_support_type):
+    case = SUPPORT_CASES.get((left_support_type, right_support_type))
+    if case is None:
+        raise ValueError(f"Unsupported support combination: {left_support_type} - {right_support_type}")
+    return case
+
 
+# End moments and reactions (N, Nm) for point loads P (N) at a, elementwise over arrays
+def _point_actions(L, a, P, left_support_type, right_support_type):
+    point, _, (carry_right, carry_left) = _support_case(left_support_type, right_support_type)
+    L, a, P = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (L, a, P)))
+    left_hang, right_hang = a < 0, a > L
+    if (np.any(left_hang) and left_support_type != "Pinned") or (np.any(right_hang) and right_support_type != "Pinned"):
+        raise ValueError("Loads beyond a support need a Pinned support next to the overhang")
+    # An overhang load acts as the same load on the support plus the overhang moment there
+    a_span = np.clip(a, 0, L)
+    mA, mB = point(L, a_span, L - a_span)
+    hang_left = np.where(left_hang, a, 0.0)
+    hang_right = np.where(right_hang, L - a, 0.0)
+    mA = P * (mA + hang_left + carry_left * hang_right)
+    mB = P * (mB + hang_right + carry_right * hang_left)
+    RA = P * (L - a_span) / L + (mB - mA) / L
+    return RA, P - RA, -mA, mB
+
+
+# Function to calculate moments and shear forces (one load, or elementwise over arrays of beams).
+# Like every solver here it works in SI (N, m, Nm); see units.py for the conversions.
+def calculate_supports(span, load_location, load_magnitude, left_support_type, right_support_type):
+    RA, RB, MA, MB = _point_actions(span, load_location, load_magnitude, left_support_type, right_support_type)
+    if RA.ndim == 0:
+        return float(RA), float(RB), float(MA), float(MB)
     return RA, RB, MA, MB
 
+
+# Reactions for any number of point loads (N, positions from the left support) plus a UDL over the span (N/m)
+def beam_reactions(span, load_locations, load_magnitudes, left_support_type, right_support_type, udl=0.0):
+    RA, RB, MA, MB = (np.sum(v, axis=-1) for v in _point_actions(
+        span, load_locations, load_magnitudes, left_support_type, right_support_type))
+    w = np.asarray(udl, dtype=float)
+    mA, mB = _support_case(left_support_type, right_support_type)[1](np.asarray(span, dtype=float))
+    RA_w = w * span / 2 + w * (mB - mA) / span
+    return RA + RA_w, RB + w * span - RA_w, MA - w * mA, MB + w * mB
+
+
+# Stations covering the supports and any overhang loads; the plain 0..L grid when there is no overhang
+def beam_stations(span, load_locations=(), num_points=500):
+    a = np.asarray(load_locations, dtype=float)
+    x0 = min(0.0, a.min()) if a.size else 0.0
+    x1 = max(span, a.max()) if a.size else span
+    if x0 == 0.0 and x1 == span:
+        return station_grid(span, num_points)
+    return np.unique(np.concatenate((np.linspace(x0, x1, num_points), [0.0, span])))
+
+
+# Shear and moment for any number of point loads plus a UDL over the span, from the left free body.
+# Reactions come from the SUPPORT_CASES table, so every support pattern uses the same code.
+def load_diagrams(span, load_locations, load_magnitudes, left_support_type, right_support_type, udl=0.0, x=None):
+    a = np.atleast_1d(np.asarray(load_locations, dtype=float))
+    P = np.atleast_1d(np.asarray(load_magnitudes, dtype=float))
+    if x is None:
+        x = beam_stations(span, a)
+    RA, RB, MA, MB = beam_reactions(span, a, P, left_support_type, right_support_type, udl)
+    w = float(udl)
+    xs = x[:, None]
+    past = xs >= a[None, :]
+    on_span = np.clip(x, 0, span)
+    V = RA * (x >= 0) + RB * (x > span) - np.sum(P * past, axis=1) - w * on_span
+    M = (RA * np.maximum(x, 0) + RB * np.maximum(x - span, 0) - np.sum(P * past * (xs - a), axis=1)
+         - w * on_span * (np.maximum(x, 0) - on_span / 2))
+    if left_support_type == "Fixed":
+        M = M - MA * (x >= 0)
+    return x, V, M, (RA, RB, MA, MB)
+
+# Station grid along the beam, built once per span and shared read-only between diagrams
+@functools.lru_cache(maxsize=256)
+def station_grid(L, num_points=500):
+    x = np.linspace(0, L, num_points)
+    x.flags.writeable = False
+    return x
+
 # Function to calculate SFD and BMD
 def shear_force_diagram(L, a, P, RA, RB):
-    x = np.linspace(0, L, 500)
+    x = station_grid(L)
     V = np.piecewise(x, [x < a, x >= a], [RA, -RB])
 
     return x, V
 
 def bending_moment_diagram(L, a, P, RA):
-    P *= 1000
-    x = np.linspace(0, L, 500)
+    x = station_grid(L)
     M = np.piecewise(x, 
                      [x < a, x >= a], 
                      [lambda x: RA * x, 
@@ -69,13 +128,57 @@ def bending_moment_diagram(L, a, P, RA):
 
 # Function to calculate Bending Moment Diagram for Fixed-Fixed
 def bending_moment_fixed_fixed(L, a, P, RA, MA, RB, MB):
-    x = np.linspace(0, L, 500)
+    x = station_grid(L)
     M = np.piecewise(x, [x < a, x >= a], 
                      [lambda x: -MA + RA * x, lambda x: MB - RB * (x - L)])
     return x, M
 
-# Function to plot SFD
-def plot_sfd(x, V, figsize=(10, 5)):
+# Function to calculate slope and deflection by integrating M/EI twice along the stations.
+# The rigid-body part is set from the supports: slope and deflection are zero at a fixed left end,
+# or at a fixed right end when the left end is free (cantilever), otherwise deflection is zero at
+# both supports. Supports sit at the first and last station unless their positions are given.
+# Works on one beam or on rows of beams (x, M of shape (beams, stations), E/I/support per row).
+def slope_deflection(x, M, left_support_type, E=E, I=I, right_support_type="Pinned", supports=None):
+    curvature = np.asarray(M, dtype=float) / (E * I)
+    x = np.broadcast_to(np.asarray(x, dtype=float), curvature.shape)
+    dx = np.diff(x, axis=-1)
+    zero = np.zeros(curvature.shape[:-1] + (1,))
+    theta = np.concatenate((zero, np.cumsum((curvature[..., 1:] + curvature[..., :-1]) * dx / 2, axis=-1)), axis=-1)
+    delta = np.concatenate((zero, np.cumsum((theta[..., 1:] + theta[..., :-1]) * dx / 2, axis=-1)), axis=-1)
+
+    # Slope and deflection at the station of each support
+    if supports is None:
+        iA = np.zeros(curvature.shape[:-1] + (1,), dtype=int)
+        iB = np.full_like(iA, curvature.shape[-1] - 1)
+    else:
+        iA = np.argmin(np.abs(x - np.asarray(supports[0])[..., None]), axis=-1)[..., None]
+        iB = np.argmin(np.abs(x - np.asarray(supports[1])[..., None]), axis=-1)[..., None]
+    xA, xB = np.take_along_axis(x, iA, -1), np.take_along_axis(x, iB, -1)
+    dA, dB = np.take_along_axis(delta, iA, -1), np.take_along_axis(delta, iB, -1)
+    tA, tB = np.take_along_axis(theta, iA, -1), np.take_along_axis(theta, iB, -1)
+
+    # Add the rigid-body rotation c1 and offset c0 (about the first station) that satisfy the supports
+    left = np.asarray(left_support_type)[..., None]
+    right = np.asarray(right_support_type)[..., None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        c1 = np.where(left == "Fixed", -tA,
+                      np.where((left == "Free") & (right == "Fixed"), -tB, -(dB - dA) / (xB - xA)))
+    c0 = np.where((left == "Free") & (right == "Fixed"), -dB - c1 * (xB - x[..., :1]), -dA - c1 * (xA - x[..., :1]))
+    return theta + c1, delta + c0 + c1 * (x - x[..., :1])
+
+# Figures are patched copies of cached templates. Each template is built once per layout key
+# with the plotly graph objects below (so plotly validates it once) and kept as a plain dict;
+# a diagram swaps in its data arrays and the few position-dependent layout values and is
+# wrapped without re-validation, so building one costs about as much as a dict copy.
+def _from_template(template, data=(), layout=None):
+    data = list(data) + [{}] * (len(template["data"]) - len(data))
+    return go.Figure({"data": [dict(trace, **patch) for trace, patch in zip(template["data"], data)],
+                      "layout": dict(template["layout"], **(layout or {}))}, _validate=False)
+
+# Function to build the SFD template (placeholder data, labels in force_unit)
+@functools.lru_cache(maxsize=None)
+def _shear_force_template(figsize, force_unit):
+    x, V = np.array([0.0, 1.0]), np.zeros(2)
     # Create a figure using plotly
     fig = go.Figure()
 
@@ -135,7 +238,7 @@ def plot_sfd(x, V, figsize=(10, 5)):
         title='Shear Force Diagram',
         title_font=dict(size=24), 
         xaxis_title='Distance along the beam (m)',
-        yaxis_title='Shear Force (N)',
+        yaxis_title=units.label('Shear Force', 'force'),
         showlegend=False,
         template='plotly_white',  # Optional, for a white background
         width=figsize[0] * 100,  # Width in pixels (e.g., 10 * 100 = 1000px)
@@ -157,12 +260,33 @@ def plot_sfd(x, V, figsize=(10, 5)):
             linecolor='black', ),
         # hovermode='closest'
     )
+    return fig.to_dict()
 
+# Function to build the SFD figure
+def shear_force_figure(x, V, figsize=(10, 5)):
+    x = np.asarray(x, dtype=float)
+    V = units.from_si(V, units.DISPLAY["force"])
+    return _from_template(_shear_force_template(tuple(figsize), units.DISPLAY["force"]),
+                          [dict(x=x, y=V), dict(x=x, y=np.where(V >= 0, V, 0)), dict(x=x, y=np.where(V < 0, V, 0)),
+                           dict(x=[x.min(), x.max()])])
+
+# Function to plot SFD
+def plot_sfd(x, V, figsize=(10, 5)):
     # Display the plot in Streamlit
-    st.plotly_chart(fig)
+    ct.plotly_chart(shear_force_figure(x, V, figsize))
 
-# Function to plot Bending Moment Diagram (BMD)
-def plot_bmd(x, M, figsize=(10, 5)):
+# Function to swap new shear values into an existing SFD figure (same stations)
+def update_shear_force_figure(fig, V):
+    V = units.from_si(V, units.DISPLAY["force"])
+    fig.data[0].y = V
+    fig.data[1].y = np.where(V >= 0, V, 0)
+    fig.data[2].y = np.where(V < 0, V, 0)
+    return fig
+
+# Function to build the Bending Moment Diagram (BMD) template (placeholder data, labels in moment_unit)
+@functools.lru_cache(maxsize=None)
+def _bending_moment_template(figsize, moment_unit):
+    x, M = np.array([0.0, 1.0]), np.zeros(2)
     fig = go.Figure()
     # Plotting the bending moment diagram
     fig.add_trace(go.Scatter(x=x, y=M, mode='lines+markers', 
@@ -204,7 +328,7 @@ def plot_bmd(x, M, figsize=(10, 5)):
     fig.add_annotation(
         x=max_x,
         y=max_m,
-        text=f'Max: {max_m:.0f} Nm, {max_x:.1f} m ',
+        text=f'Max: {max_m:.2f} {units.DISPLAY["moment"]}, {max_x:.1f} m ',
         showarrow=True,
         arrowhead=2,
         ax=0,
@@ -218,7 +342,7 @@ def plot_bmd(x, M, figsize=(10, 5)):
         title='Bending Moment Diagram',
         title_font=dict(size=24), 
         xaxis_title='Distance along the beam (m)',
-        yaxis_title='Bending Moment (Nm)',
+        yaxis_title=units.label('Bending Moment', 'moment'),
         showlegend=False,
         width=figsize[0] * 100,  # Width in pixels (e.g., 10 * 100 = 1000px)
         height=figsize[1] * 100,  # Height in pixels (e.g., 5 * 100 = 500px)
@@ -238,14 +362,185 @@ def plot_bmd(x, M, figsize=(10, 5)):
             linewidth=3,         # Increase the line width (bold)
             linecolor='black', ),
     )
-    st.plotly_chart(fig)
+    return fig.to_dict()
+
+# Function to build the Bending Moment Diagram (BMD) figure
+def bending_moment_figure(x, M, figsize=(10, 5)):
+    x = np.asarray(x, dtype=float)
+    M = units.from_si(M, units.DISPLAY["moment"])
+    template = _bending_moment_template(tuple(figsize), units.DISPLAY["moment"])
+    i = np.argmax(M)
+    annotation = dict(template["layout"]["annotations"][0], x=float(x[i]), y=float(M[i]),
+                      text=f'Max: {M[i]:.2f} {units.DISPLAY["moment"]}, {x[i]:.1f} m ')
+    return _from_template(template, [dict(x=x, y=M), dict(x=x, y=np.where(M > 0, M, 0)), dict(x=x, y=np.where(M < 0, M, 0)),
+                                     dict(x=[x.min(), x.max()])], {"annotations": [annotation]})
+
+# Function to plot Bending Moment Diagram (BMD)
+def plot_bmd(x, M, figsize=(10, 5)):
+    ct.plotly_chart(bending_moment_figure(x, M, figsize))
+
+# Function to swap new moment values into an existing BMD figure (same stations)
+def update_bending_moment_figure(fig, x, M):
+    M = units.from_si(M, units.DISPLAY["moment"])
+    fig.data[0].y = M
+    fig.data[1].y = np.where(M > 0, M, 0)
+    fig.data[2].y = np.where(M < 0, M, 0)
+    max_m = max(M)
+    max_x = x[np.argmax(M)]
+    fig.layout.annotations[0].update(x=max_x, y=max_m, text=f'Max: {max_m:.2f} {units.DISPLAY["moment"]}, {max_x:.1f} m ')
+    return fig
+
+# Labels for the beam sketch (SI values in, display units out)
+def load_label(load_magnitude):
+    return str(units.show(load_magnitude, "force"))
+
+def reaction_label(side, R, M):
+    return f"R_{side} = {units.show(R, 'force')}\nM_{side} = {units.show(M, 'moment')}"
+
+# Support marker: triangle for a pin, vertical wall for a fixed end, nothing for a free end
+def _support_shape(pos, support_type, size=0.2):
+    if support_type == "Pinned":
+        return go.layout.Shape(type="path", fillcolor="yellow", line=dict(color="yellow", width=2),
+                               **_support_position(pos, support_type, size))
+    if support_type == "Fixed":
+        return go.layout.Shape(type="line", y0=-1, y1=1, line=dict(color="yellow", width=6),
+                               **_support_position(pos, support_type, size))
+    return None
+
+# The position-dependent properties of a support marker
+def _support_position(pos, support_type, size=0.2):
+    if support_type == "Pinned":
+        return {"path": f"M {pos-size} -0.5 L {pos+size} -0.5 L {pos} 0 Z"}
+    return {"x0": pos, "x1": pos}
+
+# Function to build the beam sketch template for a pair of support types
+@functools.lru_cache(maxsize=None)
+def _beam_supports_template(left_support_type, right_support_type):
+    span, load_location, load_magnitude, RA, RB, MA, MB = 1.0, 0.5, 0.0, 0.0, 0.0, 0.0, 0.0
+    
+    # Define the x-coordinates for left and right supports (in meters)
+    left_support_position = 0  # Left support is always at the start of the beam
+    right_support_position = span  # Right support is at the end of the beam
+    # The beam runs past a support when the load sits on an overhang
+    beam_start = min(left_support_position, load_location)
+    beam_end = max(right_support_position, load_location)
+
+    # Create the plot layout without axes
+    layout = go.Layout(
+        shapes=[
+            # Draw the beam (a simple line from end to end, past a support on an overhang)
+            go.layout.Shape(
+                type="line", 
+                x0=beam_start, 
+                y0=0, 
+                x1=beam_end, 
+                y1=0, 
+                line=dict(color="blue", width=4),
+            ),
+        ] + [
+            # Draw left and right supports based on support type (nothing for a free end)
+            shape for shape in (_support_shape(left_support_position, left_support_type),
+                                _support_shape(right_support_position, right_support_type)) if shape is not None
+        ],
+        annotations=[
+            dict(
+                x=load_location,
+                y=0,
+                text=load_label(load_magnitude),
+                font=dict(size=20, color="red"),
+                showarrow=True,
+                arrowhead=2,
+                ax=0,
+                ay=-100,
+            ),
+            dict(
+                x=left_support_position,
+                y=0,
+                text=reaction_label("L", RA, MA),
+                font=dict(size=20, color="green"),
+                showarrow=True,
+                arrowhead=5,
+                ax=0,
+                ay=80,
+            ),
+            dict(
+                x=right_support_position,
+                y=0,
+                text=reaction_label("R", RB, MB),
+                font=dict(size=20, color="green"),
+                showarrow=True,
+                arrowhead=5,
+                ax=0,
+                ay=80,
+            ),
+        ],
+        xaxis=dict(
+            visible=False,
+            range=[beam_start - 2, beam_end + 2],
+        ),
+        yaxis=dict(
+            visible=False,
+            range=[-1.5, 1.5],
+        ),
+        plot_bgcolor="white",
+        showlegend=False,
+        height=300,
+    )
+    # Create the figure with the layout
+    return go.Figure(layout=layout).to_dict()
+
+# Function to build the beam sketch with supports, load and reaction labels
+def beam_supports_figure(span, left_support_type, right_support_type, load_location, load_magnitude, RA, RB, MA, MB):
+    span, load_location, load_magnitude = float(span), float(load_location), float(load_magnitude)
+    template = _beam_supports_template(left_support_type, right_support_type)["layout"]
+    # The beam runs past a support when the load sits on an overhang
+    beam_start, beam_end = min(0.0, load_location), max(span, load_location)
+    supports = [(pos, support) for pos, support in ((0.0, left_support_type), (span, right_support_type))
+                if support in ("Pinned", "Fixed")]
+    shapes = [dict(template["shapes"][0], x0=beam_start, x1=beam_end)] + \
+        [dict(shape, **_support_position(pos, support)) for shape, (pos, support) in zip(template["shapes"][1:], supports)]
+    load, left, right = template["annotations"]
+    annotations = [dict(load, x=load_location, text=load_label(load_magnitude)),
+                   dict(left, text=reaction_label("L", RA, MA)),
+                   dict(right, x=span, text=reaction_label("R", RB, MB))]
+    return _from_template({"data": [], "layout": template}, layout={
+        "shapes": shapes, "annotations": annotations, "xaxis": dict(template["xaxis"], range=[beam_start - 2, beam_end + 2])})
+
+# Function to build the sketch of a continuous beam: one support per span end, point loads and reactions
+def continuous_beam_figure(supports, left_support_type, right_support_type, loads, reactions):
+    supports = np.asarray(supports, dtype=float)
+    total = supports[-1]
+    size = max(total / 50, 0.2)  # support marker size relative to the beam length
+    shapes = [go.layout.Shape(type="line", x0=0, y0=0, x1=total, y1=0, line=dict(color="blue", width=4))]
+    for i, pos in enumerate(supports):
+        end = left_support_type if i == 0 else right_support_type if i == len(supports) - 1 else "Pinned"
+        shapes.append(_support_shape(pos, end, size))
+    fig = go.Figure(layout=go.Layout(
+        shapes=shapes,
+        xaxis=dict(visible=False, range=[-total * 0.05, total * 1.05]),
+        yaxis=dict(visible=False, range=[-1.5, 1.5]),
+        plot_bgcolor="white",
+        showlegend=False,
+        height=300,
+    ))
+    # Loads and reactions as hoverable markers so long lines stay readable
+    loads = np.asarray(loads, dtype=float).reshape(-1, 2)
+    fig.add_trace(go.Scatter(x=loads[:, 0], y=np.full(len(loads), 0.6), mode="markers",
+                             marker=dict(symbol="triangle-down", size=12, color="red"),
+                             hovertemplate=f"%{{customdata:.2f}} {units.DISPLAY['force']} at %{{x:.2f}} m<extra></extra>",
+                             customdata=units.from_si(loads[:, 1], units.DISPLAY["force"])))
+    fig.add_trace(go.Scatter(x=supports, y=np.full(len(supports), -0.8), mode="markers",
+                             marker=dict(symbol="triangle-up", size=10, color="green"),
+                             hovertemplate=f"R = %{{customdata:.2f}} {units.DISPLAY['force']} at %{{x:.2f}} m<extra></extra>",
+                             customdata=units.from_si(reactions, units.DISPLAY["force"])))
+    return fig
 
 def display_summary_table(RA, RB, MA, MB):
     # st.write("### Reactions and Moments Summary:")
     table_data = {
         "Location (m)": ["Left Support", "Right Support"],
-        "Reaction Force (N)": [f"{RA:.2f}",f"{-RB:.2f}"],
-        "Moment (Nm)": [f"{-MA:.2f}",f"{MB:.2f}"],
+        units.label("Reaction Force", "force"): [f"{units.from_si(RA, units.DISPLAY['force']):.2f}", f"{units.from_si(-RB, units.DISPLAY['force']):.2f}"],
+        units.label("Moment", "moment"): [f"{units.from_si(-MA, units.DISPLAY['moment']):.2f}", f"{units.from_si(MB, units.DISPLAY['moment']):.2f}"],
     }
     st.table(table_data)
 # # Streamlit UI setup
@@ -294,4 +589,4 @@ def display_summary_table(RA, RB, MA, MB):
 # H4: Thickness of the bottom flange
 # I4: Thickness of the web
 
-# deduce a single line excel formula using the formula above, using cell references only
\ No newline at end of file
+# deduce a single line excel formula using the formula above, using cell references only
@@ -0,0 +1,87 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import section_library as sl
+
+# Read-only section library shared by every Streamlit session and worker process on a node.
+# The SectionTable columns are written once per library version as a single float64 .npy
+# (one row per property) plus a small JSON index, and every process maps that file with
+# np.load(mmap_mode="r"). The property arrays are zero-copy views into the page cache, so
+# the library costs the same memory however many sessions or workers use it.
+#
+# The version is a hash of the Database range contents, so only a revised section list gets
+# a new directory (saving the workbook or copying it elsewhere does not). The publishing
+# process removes the older versions. Another process may still hold a removed path (e.g. in
+# st.cache_resource): attach() in that process publishes its mapped table again, so call it
+# before starting workers on a path. Worker processes get the published path and attach()
+# it themselves (e.g. as a pool initializer) instead of receiving pickled copies of the table.
+
+DEFAULT_DIR = os.environ.get("SECTION_LIBRARY_CACHE", os.path.join(tempfile.gettempdir(), "beam_sensei_sections"))
+
+_attached = {}  # path -> SectionTable, one mapping per process
+
+
+# Version of the rows read from sl.DATABASE_RANGE
+def content_version(rows):
+    key = json.dumps([sl.DATABASE_RANGE, rows], default=str)
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def _version_dir(version, directory):
+    return os.path.join(directory, f"sections-{version}")
+
+
+# Writes the table under `version` (atomically; a concurrent writer of the same version wins)
+def publish(table, version, directory=DEFAULT_DIR):
+    target = _version_dir(version, directory)
+    if os.path.exists(target):
+        return target
+    os.makedirs(directory, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=directory, prefix=".publish-")
+    columns = [key for key, _, _ in sl.PROPERTIES]
+    np.save(os.path.join(tmp, "props.npy"), np.stack([table.props[key] for key in columns]))
+    with open(os.path.join(tmp, "index.json"), "w") as f:
+        json.dump({"columns": columns, "names": table.names,
+                   "standards": [None if s is None else str(s) for s in table.standards]}, f)
+    try:
+        os.rename(tmp, target)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+    return target
+
+
+# SectionTable whose property columns are read-only views of the mapped file. A path this
+# process has mapped but another process has pruned is published again from the mapping.
+def attach(path):
+    if path in _attached and not os.path.exists(os.path.join(path, "index.json")):
+        shutil.rmtree(path, ignore_errors=True)  # left over from an interrupted prune
+        publish(_attached[path], os.path.basename(path)[len("sections-"):], os.path.dirname(path))
+    if path not in _attached:
+        with open(os.path.join(path, "index.json")) as f:
+            index = json.load(f)
+        data = np.load(os.path.join(path, "props.npy"), mmap_mode="r")
+        _attached[path] = sl.SectionTable(index["names"], index["standards"], dict(zip(index["columns"], data)))
+    return _attached[path]
+
+
+# Path of the shared table for the rows of the Database range, published (and the older
+# versions pruned) when no process has published these contents yet; map it with attach()
+def shared_table(rows, directory=DEFAULT_DIR):
+    version = content_version(rows)
+    path = _version_dir(version, directory)
+    if not os.path.exists(path):
+        publish(sl.SectionTable.from_values(rows), version, directory)
+        prune(keep=[version], directory=directory)
+    return path
+
+
+# Removes the published versions other than `keep`
+def prune(keep=(), directory=DEFAULT_DIR):
+    keep = {_version_dir(version, directory) for version in keep}
+    for name in os.listdir(directory) if os.path.isdir(directory) else ():
+        path = os.path.join(directory, name)
+        if name.startswith("sections-") and path not in keep:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,89 @@
+import numpy as np
+
+# Unit boundary for the app, batch runs and reports.
+# Inputs are converted to SI float64 once, where they enter (widgets, CSV columns, member dicts);
+# the solvers in sfd_slp, continuous_beam, section_library and code_check only ever see
+#   N, m, N/m, Nm, Pa, m^2, m^3, m^4, kg/m
+# and results are converted back only when they are formatted for display.
+
+FACTORS = {
+    # force
+    "N": 1.0, "kN": 1e3, "MN": 1e6,
+    # length
+    "m": 1.0, "cm": 1e-2, "mm": 1e-3,
+    # distributed load
+    "N/m": 1.0, "kN/m": 1e3,
+    # moment
+    "Nm": 1.0, "kNm": 1e3, "kN·m": 1e3,
+    # stress and modulus
+    "Pa": 1.0, "N/m^2": 1.0, "kPa": 1e3, "MPa": 1e6, "N/mm^2": 1e6, "GPa": 1e9,
+    # section properties
+    "m^2": 1.0, "cm^2": 1e-4, "mm^2": 1e-6,
+    "m^3": 1.0, "cm^3": 1e-6, "mm^3": 1e-9,
+    "m^4": 1.0, "cm^4": 1e-8, "mm^4": 1e-12,
+    # other
+    "kg/m": 1.0, "rad": 1.0, "-": 1.0,
+}
+
+# Units used for everything shown to the user
+DISPLAY = {
+    "force": "kN",
+    "udl": "kN/m",
+    "moment": "kNm",
+    "length": "m",
+    "deflection": "mm",
+    "stress": "MPa",
+}
+
+
+def factor(unit):
+    try:
+        return FACTORS[unit.strip()]
+    except KeyError:
+        raise ValueError(f"Unknown unit: {unit}") from None
+
+
+# Value(s) in `unit` -> SI float64 (a float for scalars, an array otherwise)
+def to_si(value, unit):
+    out = np.asarray(value, dtype=np.float64) * factor(unit)
+    return float(out) if out.ndim == 0 else out
+
+
+# SI value(s) -> `unit`
+def from_si(value, unit):
+    out = np.asarray(value, dtype=np.float64) / factor(unit)
+    return float(out) if out.ndim == 0 else out
+
+
+# Converts the listed fields of a record (or of a dict of columns) to SI in one pass
+def convert(record, units):
+    return {key: to_si(value, units[key]) if key in units else value for key, value in record.items()}
+
+
+# SI value that is only converted and rounded when it is rendered, e.g. f"R = {Display(RA, 'kN')}"
+class Display:
+    __slots__ = ("value", "unit", "digits")
+
+    def __init__(self, value, unit, digits=2):
+        self.value = value
+        self.unit = unit
+        self.digits = digits
+
+    def __format__(self, spec):
+        return f"{from_si(self.value, self.unit):{spec or f'.{self.digits}f'}} {self.unit}"
+
+    def __str__(self):
+        return format(self, "")
+
+    def __repr__(self):
+        return f"Display({self.value!r}, {self.unit!r})"
+
+
+# Shorthand for a value in one of the DISPLAY units, e.g. show(RA, "force")
+def show(value, quantity, digits=2):
+    return Display(value, DISPLAY[quantity], digits)
+
+
+# Column heading with the display unit, e.g. label("Reaction Force", "force") -> "Reaction Force (kN)"
+def label(name, quantity):
+    return f"{name} ({DISPLAY[quantity]})"